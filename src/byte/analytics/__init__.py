@@ -7,6 +7,7 @@ from byte._import_utils import import_attr
 if TYPE_CHECKING:
     from byte.analytics.schemas import LastMessageUsage, ModelUsage, TokenCount, UsageAnalytics
     from byte.analytics.service.agent_analytics_service import AgentAnalyticsService
+    from byte.analytics.service.token_counter_service import TokenCounterService
     from byte.analytics.service_provider import AnalyticsProvider
     from byte.analytics.utils.usage_metrics import UsageMetrics
 
@@ -17,6 +18,7 @@ __all__ = (
     "LastMessageUsage",
     "ModelUsage",
     "TokenCount",
+    "TokenCounterService",
     "UsageAnalytics",
     "UsageMetrics",
 )
@@ -29,6 +31,7 @@ _dynamic_imports = {
     "LastMessageUsage": "schemas",
     "ModelUsage": "schemas",
     "TokenCount": "schemas",
+    "TokenCounterService": "service.token_counter_service",
     "UsageAnalytics": "schemas",
     # keep-sorted end
 }
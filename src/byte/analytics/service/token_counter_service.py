@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Any, List
+
+from byte import Service
+
+
+class TokenCounterService(Service):
+    """Count prompt tokens with a local tokenizer, calibrated per provider against real usage.
+
+    Base counts come from tiktoken's `o200k_base` encoding when it can be loaded
+    and from a characters-per-token ratio otherwise. Loading the encoding may
+    download its BPE file, so it happens in a worker thread once the application
+    has booted; counts made before it finishes are estimated and not cached.
+    Providers tokenize differently, so each provider gets a
+    correction factor learned from the `input_tokens` of real responses. Base
+    counts are cached per fragment hash, so unchanged context is only tokenized once.
+    Usage: `tokens = counter.count(text, "anthropic")`
+    """
+
+    CHARS_PER_TOKEN: int = 4
+    CACHE_SIZE: int = 4096
+
+    # Weight given to each new observation when updating a provider's correction factor
+    CALIBRATION_WEIGHT: float = 0.3
+
+    def boot(self) -> None:
+        self._encoding: Any = None
+        self._encoding_loaded = False
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._factors: dict[str, float] = {}
+        self._pending: dict[str, int] = {}
+
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+
+    def _load_encoding(self) -> Any:
+        """Load the tiktoken encoding, returning None if it is unavailable. Blocks, so never call it on the loop."""
+        try:
+            import tiktoken
+
+            return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            self.app["log"].debug(f"Tokenizer unavailable, estimating from characters: {e}")
+            return None
+
+    async def load_encoding(self, *args) -> None:
+        """Load the tokenizer in a worker thread; registered as a booted callback.
+
+        Usage: `app.booted(token_counter_service.load_encoding)`
+        """
+        if self._encoding_loaded:
+            return
+
+        self._encoding = await asyncio.to_thread(self._load_encoding)
+        self._encoding_loaded = True
+
+    def base_count(self, text: str) -> int:
+        """Return the uncalibrated token count for a fragment, using the cache when possible.
+
+        Usage: `counter.base_count("def main(): ...")` -> 5
+        """
+        if not text:
+            return 0
+
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+
+        self.cache_misses += 1
+        if self._encoding is not None:
+            count = len(self._encoding.encode(text, disallowed_special=()))
+        else:
+            count = math.ceil(len(text) / self.CHARS_PER_TOKEN)
+            if not self._encoding_loaded:
+                # Keep the cache for real counts while the tokenizer is still loading
+                return count
+
+        self._cache[key] = count
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return count
+
+    def factor(self, provider: str) -> float:
+        """Return the learned correction factor for a provider, 1.0 until calibrated."""
+        return self._factors.get(provider, 1.0)
+
+    def count(self, text: str, provider: str = "") -> int:
+        """Return the calibrated token count for a single piece of text.
+
+        Usage: `counter.count(context_message, "anthropic")` -> 1830
+        """
+        return round(self.base_count(text) * self.factor(provider))
+
+    def estimate_prompt(self, agent_state: dict, scratch_messages: List[Any], provider: str = "") -> int:
+        """Estimate the input tokens for an assembled prompt and remember it for calibration.
+
+        Args:
+            agent_state: Dict produced by `PromptAssembler.generate_messages()`,
+                expected keys: `user_message`, `system_message`, `context_message`.
+            scratch_messages: Scratch messages from state; each must expose a `text` attribute.
+            provider: Provider of the model the prompt is sent to.
+
+        Usage: `tokens = counter.estimate_prompt(agent_state, scratch_messages, "openai")`
+        """
+        fragments = [
+            agent_state.get("user_message", ""),
+            agent_state.get("system_message", ""),
+            agent_state.get("context_message", ""),
+            *(message.text for message in scratch_messages),
+        ]
+        base = sum(self.base_count(fragment) for fragment in fragments)
+        self._pending[provider] = base
+        return round(base * self.factor(provider))
+
+    def calibrate(self, provider: str, input_tokens: int) -> None:
+        """Update a provider's correction factor from the reported input tokens of a response.
+
+        Compares the reported count with the last `estimate_prompt()` for the same
+        provider. The estimate is consumed, so each response calibrates at most once.
+        Usage: `counter.calibrate("anthropic", usage["input_tokens"])`
+        """
+        estimated = self._pending.pop(provider, 0)
+        if estimated <= 0 or input_tokens <= 0:
+            return
+
+        observed = input_tokens / estimated
+        previous = self._factors.get(provider)
+        if previous is None:
+            self._factors[provider] = observed
+        else:
+            self._factors[provider] = previous + self.CALIBRATION_WEIGHT * (observed - previous)
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters and learned factors.
+
+        Usage: `counter.stats()` -> `{"hits": 40, "misses": 6, "cached": 6, "factors": {"anthropic": 1.12}}`
+        """
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "cached": len(self._cache),
+            "factors": dict(self._factors),
+        }
@@ -1,5 +1,5 @@
 from byte import ServiceProvider
-from byte.analytics import AgentAnalyticsService
+from byte.analytics import AgentAnalyticsService, TokenCounterService
 
 
 class AnalyticsProvider(ServiceProvider):
@@ -15,5 +15,11 @@ class AnalyticsProvider(ServiceProvider):
         return [
             # keep-sorted start
             AgentAnalyticsService,
+            TokenCounterService,
             # keep-sorted end
         ]
+
+    async def boot(self) -> None:
+        """Load the tokenizer off the event loop once the application has booted."""
+        token_counter_service = self.app.make(TokenCounterService)
+        self.app.booted(token_counter_service.load_encoding)
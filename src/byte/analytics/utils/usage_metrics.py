@@ -1,5 +1,3 @@
-from typing import Any, List
-
 from byte.analytics.schemas import LastMessageUsage, ModelUsage
 from byte.llm.schemas import ModelConstraints
 
@@ -15,38 +13,19 @@ class UsageMetrics:
     _PER_MILLION: int = 1_000_000
     _DEFAULT_MAX_TOKENS: int = 150_000
 
-    # Characters-per-token approximation used for prompt size estimation
-    _CHARS_PER_TOKEN: int = 4
-
     @staticmethod
-    def estimate_prompt_tokens(
-        agent_state: dict, scratch_messages: List[Any], max_tokens: int = 150_000
-    ) -> tuple[float, float]:
-        """Estimate token usage for the current prompt and return memory utilisation.
-
-        Uses a characters-per-token approximation (``len / 4``) across the
-        assembled message strings and any scratch messages.
+    def memory_percent(prompt_tokens: int, max_tokens: int = 0) -> float:
+        """Return how much of the context window a prompt fills, as a percentage.
 
         Args:
-            agent_state: Dict produced by ``PromptAssembler.generate_messages()``,
-                expected keys: ``user_message``, ``system_message``, ``context_message``.
-            scratch_messages: List of scratch messages from state; each must expose
-                a ``text`` attribute.
-            max_tokens: Context-window size to measure against. Defaults to
-                ``_DEFAULT_MAX_TOKENS`` (150 000).
+            prompt_tokens: Estimated input tokens for the prompt.
+            max_tokens: The model's ``max_input_tokens``. Falls back to
+                ``_DEFAULT_MAX_TOKENS`` (150 000) when the model does not declare one.
 
         Returns:
-            Tuple of ``(total_tokens, memory_percent)`` where *memory_percent*
-            is ``(total_tokens / max_tokens) * 100``.
+            ``(prompt_tokens / max_tokens) * 100``.
         """
-        total_tokens = (
-            len(agent_state.get("user_message", "")) / UsageMetrics._CHARS_PER_TOKEN
-            + len(agent_state.get("system_message", "")) / UsageMetrics._CHARS_PER_TOKEN
-            + len(agent_state.get("context_message", "")) / UsageMetrics._CHARS_PER_TOKEN
-            + sum(len(m.text) / UsageMetrics._CHARS_PER_TOKEN for m in scratch_messages)
-        )
-        memory_percent = (total_tokens / max_tokens) * 100
-        return total_tokens, memory_percent
+        return (prompt_tokens / (max_tokens or UsageMetrics._DEFAULT_MAX_TOKENS)) * 100
 
     @staticmethod
     def model_cost(usage: ModelUsage, constraints: ModelConstraints) -> float:
@@ -6,6 +6,7 @@ from byte.documentation.config import DocumentationConfig
 from byte.files.config import FilesConfig
 from byte.gateway.config import GatewayConfig
 from byte.git.config import GitConfig
+from byte.knowledge.config import KnowledgeConfig
 from byte.lint.config import LintConfig
 from byte.llm.config import LLMConfig
 from byte.presets.config import PresetsConfig
@@ -41,6 +42,9 @@ class ByteUserConfig(BaseModel):
     git: GitConfig = Field(
         default_factory=GitConfig, description="Git operations and conventional commit behavior configuration"
     )
+    knowledge: KnowledgeConfig = Field(
+        default_factory=KnowledgeConfig, description="Session context retrieval configuration"
+    )
     lint: LintConfig = Field(default_factory=LintConfig, description="Code linting and formatting configuration")
     llm: LLMConfig = Field(default_factory=LLMConfig, description="LLM provider and model assignment configuration")
     # lsp: LSPConfig = Field(default_factory=LSPConfig)
@@ -1,5 +1,9 @@
 import fnmatch
+import os
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
 from byte import Service
 from byte.constitution.models import (
@@ -13,6 +17,9 @@ from byte.constitution.models import (
 from byte.support.string import Str
 from byte.support.yaml import Yaml
 
+if TYPE_CHECKING:
+    from byte.node import NodeEvents
+
 
 class ConstitutionService(Service):
     """Service for loading and managing the project constitution.
@@ -34,6 +41,10 @@ class ConstitutionService(Service):
                     items/
                         <id>.md    # frontmatter: name; body: content
 
+    Mutations only write the files of entries they changed, each through a temp
+    file and ``os.replace``. Inside a batch, writes are deferred until the
+    outermost batch exits; the tool node opens one around each set of tool calls.
+
     Usage:
         service = app.make(ConstitutionService)
         constitution = service.constitution   # access the loaded Constitution
@@ -47,6 +58,9 @@ class ConstitutionService(Service):
         """
         self._constitution: Constitution | None = None
         self._constitution_path: Path = self.app.config_path("constitution")
+        self._dirty: set[tuple[str, ...]] = set()
+        self._deleted: set[Path] = set()
+        self._batch_depth = 0
         self.reload()
 
     # ------------------------------------------------------------------
@@ -73,102 +87,139 @@ class ConstitutionService(Service):
     # Serialisation helpers
     # ------------------------------------------------------------------
 
-    def _save(self, constitution: Constitution) -> None:
-        """Persist *constitution* to disk as a directory of Markdown files.
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writes until the outermost batch exits, then flush once.
+
+        Usage:
+            with service.batch():
+                service.add_principle("I. Library-First", "...")
+                service.add_principle("II. Test-First", "...")
+        """
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
 
-        Creates all required directories and files, removing stale slugs that
-        no longer exist in the in-memory model.
+    def begin_batch(self) -> None:
+        """Start deferring writes. Batches nest; only the outermost one flushes.
 
-        Usage: `self._save(constitution)`
+        Usage: `service.begin_batch()`
         """
-        root = self._constitution_path
-        root.mkdir(parents=True, exist_ok=True)
+        self._batch_depth += 1
 
-        # --- constitution.md (meta) ---
-        meta_file = root / "constitution.md"
-        meta_file.write_text(
-            Yaml.render_frontmatter(
-                {
-                    "version": constitution.meta.version,
-                    "ratified": constitution.meta.ratified,
-                    "last_amended": constitution.meta.last_amended,
-                }
-            ),
-            encoding="utf-8",
-        )
+    def end_batch(self) -> None:
+        """Close a batch opened with `begin_batch` and flush when it was the outermost.
 
-        # --- principles/ ---
-        principles_dir = root / "principles"
-        principles_dir.mkdir(exist_ok=True)
-        active_principle_files: set[Path] = set()
-        for slug, p in constitution.principles.items():
-            f = principles_dir / f"{p.id}.md"
-            f.write_text(
-                Yaml.render_frontmatter({"id": p.id, "name": p.name, "order": p.order}, p.description), encoding="utf-8"
+        Usage: `service.end_batch()`
+        """
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth == 0:
+            self.flush()
+
+    async def begin_batch_hook(self, payload: NodeEvents.PreToolCalls) -> NodeEvents.PreToolCalls:
+        """Defer writes while the tool node runs the tool calls of one response."""
+        self.begin_batch()
+        return payload
+
+    async def end_batch_hook(self, payload: NodeEvents.PostToolCalls) -> NodeEvents.PostToolCalls:
+        """Flush the changes made by all tool calls of one response at once."""
+        self.end_batch()
+        return payload
+
+    def flush(self) -> None:
+        """Write dirty entries and remove deleted ones, leaving untouched files alone.
+
+        Usage: `service.flush()`
+        """
+        if self._constitution is None or not (self._dirty or self._deleted):
+            return
+
+        self._constitution_path.mkdir(parents=True, exist_ok=True)
+
+        # Deletions go first so an entry removed and re-added in one batch is rewritten
+        while self._deleted:
+            path = self._deleted.pop()
+            if path.is_dir():
+                shutil.rmtree(path)
+            elif path.exists():
+                path.unlink()
+
+        written = 0
+        while self._dirty:
+            rendered = self._render(self._constitution, self._dirty.pop())
+            if rendered is not None:
+                self._write(*rendered)
+                written += 1
+
+        self.app["log"].debug(f"ConstitutionService: wrote {written} file(s) to {self._constitution_path}")
+
+    def _persist(self) -> None:
+        """Flush pending changes now unless a batch is open."""
+        if self._batch_depth == 0:
+            self.flush()
+
+    def _write(self, path: Path, content: str) -> None:
+        """Atomically replace *path* with *content* via a temp file in the same directory."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _section_dir(self, section: ConstitutionSection) -> Path:
+        return self._constitution_path / "sections" / section.id
+
+    def _render(self, constitution: Constitution, entry: tuple[str, ...]) -> tuple[Path, str] | None:
+        """Return the file path and contents for a dirty *entry*, or None if it no longer exists.
+
+        Entries are ``("meta",)``, ``("principle", slug)``, ``("governance", slug)``,
+        ``("section", slug)`` and ``("item", section_slug, item_slug)``.
+        """
+        root = self._constitution_path
+        kind, *keys = entry
+
+        if kind == "meta":
+            meta = constitution.meta
+            return root / "constitution.md", Yaml.render_frontmatter(
+                {"version": meta.version, "ratified": meta.ratified, "last_amended": meta.last_amended}
             )
-            active_principle_files.add(f)
-        # Remove stale files
-        for existing in principles_dir.glob("*.md"):
-            if existing not in active_principle_files:
-                existing.unlink()
 
-        # --- governance/ ---
-        governance_dir = root / "governance"
-        governance_dir.mkdir(exist_ok=True)
-        active_governance_files: set[Path] = set()
-        for slug, r in constitution.governance.items():
-            f = governance_dir / f"{r.id}.md"
-            f.write_text(
-                Yaml.render_frontmatter({"id": r.id, "name": r.name, "order": r.order}, r.content), encoding="utf-8"
+        if kind == "principle" and (p := constitution.principles.get(keys[0])):
+            return root / "principles" / f"{p.id}.md", Yaml.render_frontmatter(
+                {"id": p.id, "name": p.name, "order": p.order}, p.description
             )
-            active_governance_files.add(f)
-        for existing in governance_dir.glob("*.md"):
-            if existing not in active_governance_files:
-                existing.unlink()
 
-        # --- sections/ ---
-        sections_dir = root / "sections"
-        sections_dir.mkdir(exist_ok=True)
-        active_section_dirs: set[Path] = set()
-        for slug, section in constitution.sections.items():
-            section_dir = sections_dir / section.id
-            section_dir.mkdir(exist_ok=True)
-            active_section_dirs.add(section_dir)
+        if kind == "governance" and (r := constitution.governance.get(keys[0])):
+            return root / "governance" / f"{r.id}.md", Yaml.render_frontmatter(
+                {"id": r.id, "name": r.name, "order": r.order}, r.content
+            )
 
-            # section.md
+        if kind == "section" and (section := constitution.sections.get(keys[0])):
             section_fm: dict = {"id": section.id, "name": section.name, "order": section.order}
             if section.applies_to:
                 section_fm["applies_to"] = section.applies_to
-            section_file = section_dir / "section.md"
-            section_file.write_text(Yaml.render_frontmatter(section_fm), encoding="utf-8")
-
-            # items/
-            items_dir = section_dir / "items"
-            items_dir.mkdir(exist_ok=True)
-            active_item_files: set[Path] = set()
-            for item_slug, item in section.items.items():
-                f = items_dir / f"{item.id}.md"
-                f.write_text(
-                    Yaml.render_frontmatter(
-                        {"id": item.id, "section_id": item.section_id, "name": item.name, "order": item.order},
-                        item.content,
-                    ),
-                    encoding="utf-8",
-                )
-                active_item_files.add(f)
-            for existing in items_dir.glob("*.md"):
-                if existing not in active_item_files:
-                    existing.unlink()
+            (self._section_dir(section) / "items").mkdir(parents=True, exist_ok=True)
+            return self._section_dir(section) / "section.md", Yaml.render_frontmatter(section_fm)
 
-        # Remove stale section directories
-        if sections_dir.exists():
-            for existing_dir in [d for d in sections_dir.iterdir() if d.is_dir()]:
-                if existing_dir not in active_section_dirs:
-                    import shutil
+        if kind == "item" and (section := constitution.sections.get(keys[0])) and (item := section.items.get(keys[1])):
+            return self._section_dir(section) / "items" / f"{item.id}.md", Yaml.render_frontmatter(
+                {"id": item.id, "section_id": item.section_id, "name": item.name, "order": item.order},
+                item.content,
+            )
 
-                    shutil.rmtree(existing_dir)
+        return None
 
-        self.app["log"].debug(f"ConstitutionService: saved constitution to {root}")
+    @staticmethod
+    def _entries(constitution: Constitution) -> set[tuple[str, ...]]:
+        """Return a dirty entry for every file making up *constitution*."""
+        entries: set[tuple[str, ...]] = {("meta",)}
+        entries.update(("principle", slug) for slug in constitution.principles)
+        entries.update(("governance", slug) for slug in constitution.governance)
+        for slug, section in constitution.sections.items():
+            entries.add(("section", slug))
+            entries.update(("item", slug, item_slug) for item_slug in section.items)
+        return entries
 
     # ------------------------------------------------------------------
     # Getters
@@ -250,7 +301,8 @@ class ConstitutionService(Service):
             raise ValueError(f"Principle with slug '{slug}' already exists.")
         principle = ConstitutionPrinciple(id=slug, name=name, description=description, order=order)
         self._constitution.principles[slug] = principle
-        self._save(self._constitution)
+        self._dirty.add(("principle", slug))
+        self._persist()
         return principle
 
     def delete_principle(self, principle_id: str) -> None:
@@ -272,11 +324,9 @@ class ConstitutionService(Service):
                 break
         if principle_slug is None:
             raise ValueError(f"Principle with id '{principle_id}' not found.")
-        del self._constitution.principles[principle_slug]
-        principle_file = self._constitution_path / "principles" / f"{principle_slug}.md"
-        if principle_file.exists():
-            principle_file.unlink()
-        self._save(self._constitution)
+        principle = self._constitution.principles.pop(principle_slug)
+        self._deleted.add(self._constitution_path / "principles" / f"{principle.id}.md")
+        self._persist()
 
     # ------------------------------------------------------------------
     # Sections
@@ -301,7 +351,8 @@ class ConstitutionService(Service):
             raise ValueError(f"Section with slug '{slug}' already exists.")
         section = ConstitutionSection(id=slug, name=name, applies_to=applies_to, order=order)
         self._constitution.sections[slug] = section
-        self._save(self._constitution)
+        self._dirty.add(("section", slug))
+        self._persist()
         return section
 
     def delete_section(self, section_id: str) -> None:
@@ -323,8 +374,8 @@ class ConstitutionService(Service):
                 break
         if section_slug is None:
             raise ValueError(f"Section with id '{section_id}' not found.")
-        del self._constitution.sections[section_slug]
-        self._save(self._constitution)
+        self._deleted.add(self._section_dir(self._constitution.sections.pop(section_slug)))
+        self._persist()
 
     # ------------------------------------------------------------------
     # Section items
@@ -348,18 +399,21 @@ class ConstitutionService(Service):
         assert self._constitution
         # Find the section by id
         section = None
+        section_key = None
         for slug, sec in self._constitution.sections.items():
             if sec.id == section_id:
                 section = sec
+                section_key = slug
                 break
-        if section is None:
+        if section is None or section_key is None:
             raise ValueError(f"Section with id '{section_id}' not found.")
         item_slug = Str.normalize_id(item_name)
         if item_slug in section.items:
             raise ValueError(f"Item '{item_name}' (slug: '{item_slug}') already exists in section '{section.name}'.")
         item = ConstitutionItem(id=item_slug, section_id=section.id, name=item_name, content=content, order=order)
         section.items[item_slug] = item
-        self._save(self._constitution)
+        self._dirty.add(("item", section_key, item_slug))
+        self._persist()
         return item
 
     def delete_section_item(self, section_id: str, item_id: str) -> None:
@@ -392,8 +446,9 @@ class ConstitutionService(Service):
                 break
         if item_slug is None:
             raise ValueError(f"Item with id '{item_id}' not found in section '{section.name}'.")
-        del section.items[item_slug]
-        self._save(self._constitution)
+        item = section.items.pop(item_slug)
+        self._deleted.add(self._section_dir(section) / "items" / f"{item.id}.md")
+        self._persist()
 
     # ------------------------------------------------------------------
     # Governance rules
@@ -418,7 +473,8 @@ class ConstitutionService(Service):
             raise ValueError(f"Governance rule with slug '{slug}' already exists.")
         rule = ConstitutionGovernanceRule(id=slug, name=name, content=content, order=order)
         self._constitution.governance[slug] = rule
-        self._save(self._constitution)
+        self._dirty.add(("governance", slug))
+        self._persist()
         return rule
 
     def delete_governance_rule(self, rule_id: str) -> None:
@@ -440,8 +496,9 @@ class ConstitutionService(Service):
                 break
         if rule_slug is None:
             raise ValueError(f"Governance rule with id '{rule_id}' not found.")
-        del self._constitution.governance[rule_slug]
-        self._save(self._constitution)
+        rule = self._constitution.governance.pop(rule_slug)
+        self._deleted.add(self._constitution_path / "governance" / f"{rule.id}.md")
+        self._persist()
 
     # ------------------------------------------------------------------
     # Meta
@@ -473,7 +530,8 @@ class ConstitutionService(Service):
             meta.last_amended = last_amended_date
         if version is not None:
             meta.version = version
-        self._save(self._constitution)
+        self._dirty.add(("meta",))
+        self._persist()
         return meta
 
     # ------------------------------------------------------------------
@@ -592,20 +650,17 @@ class ConstitutionService(Service):
 
         Usage: `service.save_and_set_current(constitution)`
         """
-        import shutil
-
         root = self._constitution_path
 
         # Erase existing constitution directory
         if root.exists():
             shutil.rmtree(root)
 
-        # Recreate directory and save the constitution
-        root.mkdir(parents=True, exist_ok=True)
-        self._save(constitution)
-
-        # Set as current constitution
+        # Set as current constitution and write every entry of it
         self._constitution = constitution
+        self._deleted.clear()
+        self._dirty = self._entries(constitution)
+        self.flush()
 
         self.app["log"].debug(f"ConstitutionService: saved and set current constitution to {root}")
 
@@ -619,6 +674,10 @@ class ConstitutionService(Service):
         """
         root = self._constitution_path
 
+        # Pending changes are superseded by whatever is on disk now
+        self._dirty.clear()
+        self._deleted.clear()
+
         try:
             self._constitution = self._load_from_directory(root)
             self.app["log"].debug(
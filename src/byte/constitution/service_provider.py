@@ -1,4 +1,4 @@
-from byte import ServiceProvider
+from byte import EventBus, ServiceProvider
 from byte.constitution import (
     ConstitutionAgentNode,
     ConstitutionCommand,
@@ -18,6 +18,7 @@ from byte.constitution.tools import (
     DeleteSectionTool,
     UpdateMetaTool,
 )
+from byte.node import NodeEvents
 
 
 class ConstitutionServiceProvider(ServiceProvider):
@@ -72,4 +73,9 @@ class ConstitutionServiceProvider(ServiceProvider):
 
     async def boot(self):
         """Boot the constitution service."""
-        self.app.make(ConstitutionService)
+        constitution_service = self.app.make(ConstitutionService)
+
+        # Flush all constitution edits from one batch of tool calls together
+        event_bus = self.app.make(EventBus)
+        event_bus.on(NodeEvents.PreToolCalls, constitution_service.begin_batch_hook)
+        event_bus.on(NodeEvents.PostToolCalls, constitution_service.end_batch_hook)
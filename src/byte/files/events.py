@@ -19,3 +19,17 @@ class FileEvents:
 
         file_path: str
         change_type: str
+
+    @dataclass
+    class SessionContextChanged(Event):
+        """Event emitted when a file in the session context directory is changed on disk."""
+
+        file_path: str
+        change_type: str
+
+    @dataclass
+    class SpecChanged(Event):
+        """Event emitted when a spec or task file in the specs directory is changed on disk."""
+
+        file_path: str
+        change_type: str
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -6,6 +7,13 @@ from pydantic import BaseModel
 from byte.support import Boundary, BoundaryType
 from byte.support.utils import get_language_from_filename, list_to_multiline_text
 
+# Lines that open a declaration in most mainstream languages, used when tree-sitter cannot parse the file
+_DECLARATION_PATTERN = re.compile(
+    r"^\s*(?:@|(?:export\s+|default\s+|pub(?:\([^)]*\))?\s+|public\s+|private\s+|protected\s+|static\s+"
+    r"|abstract\s+|final\s+|async\s+)*(?:def|class|function|interface|struct|enum|trait|impl|fn|func|type"
+    r"|module|namespace)\b)"
+)
+
 
 class FileContext(BaseModel):
     """Immutable file context containing path information."""
@@ -53,6 +61,64 @@ class FileContext(BaseModel):
             ]
         )
 
+    def _declaration_lines(self, content: str) -> list[int]:
+        """Return the 1-based lines where classes, functions, and similar declarations start.
+
+        Declarations come from a tree-sitter parse, nested ones included. When the
+        language is unknown, its grammar cannot be loaded, or the parse finds no
+        declarations, lines are matched by `_DECLARATION_PATTERN` instead.
+        """
+        numbers: set[int] = set()
+        try:
+            from tree_sitter_language_pack import ProcessConfig, detect_language_from_path, process
+
+            language = detect_language_from_path(str(self.path))
+            if language is not None:
+                result = process(content, ProcessConfig(language=language, imports=False, exports=False))
+                items = list(result.structure)
+                while items:
+                    item = items.pop()
+                    if item.span is not None:
+                        numbers.add(item.span.start_line + 1)
+                    items.extend(item.children)
+        except Exception:
+            # Grammars are downloaded on first use, so a missing or broken one falls back to the pattern
+            numbers = set()
+
+        if numbers:
+            return sorted(numbers)
+
+        return [number for number, line in enumerate(content.splitlines(), start=1) if _DECLARATION_PATTERN.match(line)]
+
     def to_summary(self) -> Optional[str]:
-        # TODO: this will use tree-sitter
-        pass
+        """Render an outline of the file's declarations, with line numbers, instead of its full content.
+
+        Used when the prompt is over budget and read-only files have to shrink.
+        Parsing may download a tree-sitter grammar, so call it from a worker
+        thread. Returns None if the file is unreadable.
+        Usage: `file_context.to_summary()` -> outline boundary listing lines such as "12: class App:"
+        """
+        try:
+            content = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError, PermissionError, UnicodeDecodeError:
+            return None
+
+        lines = content.splitlines()
+        outline = [
+            f"{number}: {lines[number - 1].rstrip()}"
+            for number in self._declaration_lines(content)
+            if number <= len(lines)
+        ]
+
+        opening = Boundary.open(
+            BoundaryType.FILE,
+            meta={"source": self.relative_path, "language": self.language, "outline": "true"},
+        )
+        return list_to_multiline_text(
+            [
+                opening,
+                f"Outline of {len(lines)} lines; read the file for its full content.",
+                *outline,
+                Boundary.close(BoundaryType.FILE),
+            ]
+        )
@@ -3,6 +3,7 @@ from pathlib import Path
 from watchfiles import Change, awatch
 
 from byte import Service, TaskManager
+from byte.event import Event
 from byte.files import FileDiscoveryService, FileEvents, FileIgnoreService, FileService
 
 
@@ -14,6 +15,18 @@ class FileWatcherService(Service):
     Usage: Automatically started during boot to monitor file changes
     """
 
+    def _byte_file_event(self, file_path: Path) -> type[Event] | None:
+        """Return the change event for files Byte keeps under the ignored `.byte` directory but still watches.
+
+        Session context and specs can be edited by hand, so their changes are
+        announced with their own events instead of going through discovery.
+        """
+        if file_path.is_relative_to(self.app.session_context_path()):
+            return FileEvents.SessionContextChanged
+        if file_path.is_relative_to(self.app.specs_path()):
+            return FileEvents.SpecChanged
+        return None
+
     def _watch_filter(self, change: Change, path: str) -> bool:
         """Filter function for watchfiles to ignore files based on ignore patterns.
 
@@ -32,6 +45,9 @@ class FileWatcherService(Service):
                 return True
 
             file_path = Path(path)
+            if self._byte_file_event(file_path) is not None:
+                return True
+
             relative_path = file_path.relative_to(self.app["path"])
 
             is_ignored = spec.match_file(str(relative_path)) or spec.match_file(str(relative_path) + "/")
@@ -49,6 +65,11 @@ class FileWatcherService(Service):
         if file_path.is_dir():
             return
 
+        byte_file_event = self._byte_file_event(file_path)
+        if byte_file_event is not None:
+            await self.emit(byte_file_event(file_path=str(file_path), change_type=change_type.name.lower()))
+            return
+
         if change_type == Change.deleted:
             await self.file_discovery.remove_file(file_path)
 
@@ -6,6 +6,7 @@ from byte._import_utils import import_attr
 
 if TYPE_CHECKING:
     from byte.foundation.application import Application
+    from byte.foundation.boot_timeline import BootSpan, BootTimeline
     from byte.foundation.console.kernel import Kernel
     from byte.foundation.container import Container
     from byte.foundation.exceptions import ByteException
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
 
 __all__ = (
     "Application",
+    "BootSpan",
+    "BootTimeline",
     "ByteException",
     "Container",
     "FoundationServiceProvider",
@@ -24,6 +27,8 @@ __all__ = (
 _dynamic_imports = {
     # keep-sorted start
     "Application": "application",
+    "BootSpan": "boot_timeline",
+    "BootTimeline": "boot_timeline",
     "ByteException": "exceptions",
     "Container": "container",
     "FoundationServiceProvider": "service_provider",
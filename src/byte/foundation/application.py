@@ -1,4 +1,6 @@
+import asyncio
 import inspect
+import signal
 from pathlib import Path
 from typing import Callable, Optional, TypeVar
 
@@ -87,15 +89,21 @@ class Application(Container):
         self._has_been_bootstrapped = True
 
         for bootstrapper in bootstrappers:
-            instance = self.make(bootstrapper)
-            instance.bootstrap(self)
+            with self.timeline.span(bootstrapper.__name__, "bootstrap"):
+                instance = self.make(bootstrapper)
+                instance.bootstrap(self)
 
     def booting(self, callback: Callable) -> None:
         """Register a new boot listener."""
         self._booting_callbacks.append(callback)
 
     def booted(self, callback: Callable):
-        """Register a new "booted" listener."""
+        """Register a new "booted" listener.
+
+        Listeners run on the event loop once every provider has booted. Plain
+        functions run in registration order; coroutine functions run
+        concurrently, so slow ones should hand blocking work to a thread.
+        """
         self._booted_callbacks.append(callback)
 
         # TODO: need to figure out how to make this async friendly
@@ -115,22 +123,63 @@ class Application(Container):
         for callback in self._booting_callbacks:
             callback(self)
 
-        providers = RegisterProviders._merge
-
-        # TODO: Use gather here?
-        for provider in providers:
-            provider_instance = self.make(provider)
-            await self.boot_provider(provider_instance)  # ty:ignore[invalid-argument-type]
+        providers = [self.make(provider) for provider in RegisterProviders._merge]
+        await self._boot_providers(providers)
 
         # Fire booted callbacks
-        for callback in self._booted_callbacks:
+        await asyncio.gather(*(self._fire_booted_callback(callback) for callback in self._booted_callbacks))
+
+        self._booted = True
+
+        self.timeline.finish()
+        try:
+            trace_path = self.timeline.write(self.cache_path("boot_trace.json"))
+            self["log"].debug(f"Boot timeline written to {trace_path}")
+        except OSError as e:
+            self["log"].warning(f"Could not write boot timeline: {e}")
+
+    async def _boot_providers(self, providers: list[ServiceProvider]) -> None:
+        """Boot providers in registration order, letting opted-in providers overlap.
+
+        A provider waits for every provider registered before it, unless its
+        boots_concurrently() is True, in which case it waits only for the
+        providers it depends on.
+        """
+        tasks: dict[type, asyncio.Task] = {}
+        for provider in providers:
+            if not provider.boots_concurrently():
+                dependencies = list(tasks.values())
+            else:
+                dependencies = []
+                for dependency in provider.depends_on():
+                    if dependency not in tasks:
+                        raise ValueError(
+                            f"{type(provider).__name__} depends on {dependency.__name__}, "
+                            "which must be registered before it"
+                        )
+                    dependencies.append(tasks[dependency])
+
+            tasks[type(provider)] = asyncio.create_task(self._boot_provider_after(provider, dependencies))
+
+        await asyncio.gather(*tasks.values())
+
+    async def _boot_provider_after(self, provider: ServiceProvider, dependencies: list[asyncio.Task]) -> None:
+        """Wait for dependency boots to finish, then boot the provider."""
+        if dependencies:
+            await asyncio.gather(*dependencies)
+
+        with self.timeline.span(type(provider).__name__, "provider"):
+            await self.boot_provider(provider)
+
+    async def _fire_booted_callback(self, callback: Callable) -> None:
+        """Run a single booted listener on the event loop."""
+        name = getattr(callback, "__qualname__", repr(callback))
+        with self.timeline.span(name, "booted"):
             if inspect.iscoroutinefunction(callback):
                 await callback(self)
             else:
                 callback(self)
 
-        self._booted = True
-
     async def boot_provider(self, provider: ServiceProvider) -> None:
         """Boot a service provider."""
         if hasattr(provider, "boot") and callable(getattr(provider, "boot")):
@@ -211,6 +260,10 @@ class Application(Container):
         """Determine if the application is in the production environment."""
         return self["env"] == "production"
 
+    def is_headless(self) -> bool:
+        """Determine if the application was started with the --headless flag."""
+        return "headless" in self["args"].get("flags", [])
+
     def running_unit_tests(self) -> bool:
         """Determine if the application is running unit tests."""
         return self["env"] == "testing"
@@ -264,6 +317,9 @@ class Application(Container):
         """Run the interactive prompt-based application loop."""
         from byte.tui import TUIManagerService
 
+        if self.is_headless():
+            return await self.run_headless()
+
         # TODO: This needs to be fixed / updates
         try:
             tui = self.make(TUIManagerService)
@@ -293,6 +349,41 @@ class Application(Container):
         #     # return 2
         # return 1
 
+    async def run_headless(self) -> int:
+        """Serve the gateway without starting the Textual TUI until SIGINT or SIGTERM.
+
+        Providers are booted as usual and GatewayServiceProvider starts the server,
+        so editors and CI jobs drive Byte entirely over the gateway.
+        Usage: `byte --headless`
+        """
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+        self["log"].info("Running headless, press Ctrl+C to stop")
+        try:
+            await stop.wait()
+        finally:
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(sig)
+            # GatewayServiceProvider.shutdown stops the gateway server
+            await self.shutdown()
+
+        return 0
+
+    async def shutdown(self) -> None:
+        """Let every booted provider clean up its resources, in reverse boot order.
+
+        A provider that fails to shut down is logged and does not prevent the rest.
+        Usage: `await app.shutdown()`
+        """
+        for provider_class in reversed(RegisterProviders._merge):
+            try:
+                await self.make(provider_class).shutdown(self)
+            except Exception as e:
+                self["log"].warning(f"{provider_class.__name__} failed to shut down: {e}")
+
     def terminate(self) -> None:
         """Terminate the application."""
         pass
@@ -305,6 +396,11 @@ class Application(Container):
                 f"Provider {provider.__name__ if inspect.isclass(provider) else provider} must extend ServiceProvider"
             )
 
+        with self.timeline.span(provider.__name__, "register"):
+            return self._register_provider(provider)
+
+    def _register_provider(self, provider) -> ServiceProvider:
+        """Bind the provider and run each of its registration phases."""
         self.singleton(provider)
 
         # Instantiate the provider
@@ -350,12 +446,13 @@ class Application(Container):
             tui_manager_service = self.make(TUIManagerService)
             payload.panel_id = tui_manager_service.get_panel_id()  # ty:ignore[invalid-assignment]
 
-        try:
-            byte_tui = self.tui()
-            byte_tui.conversation.post_message(payload)
-        except ScreenStackError:
-            self["log"].debug("No screen found skipping message post.")
-            pass
+        if not self.is_headless():
+            try:
+                byte_tui = self.tui()
+                byte_tui.conversation.post_message(payload)
+            except ScreenStackError:
+                self["log"].debug("No screen found skipping message post.")
+                pass
 
         gateway_service = self.make(GatewayService)
         gateway_service.post_message(payload)
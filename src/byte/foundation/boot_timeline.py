@@ -0,0 +1,126 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List
+
+
+@dataclass(frozen=True)
+class BootSpan:
+    """A single timed boot phase.
+
+    Args:
+        name: What was timed, such as a bootstrapper, provider, or service class name.
+        category: The boot phase, one of "bootstrap", "register", "provider", "service", or "booted".
+        start_ns: Start offset from the timeline origin in nanoseconds.
+        duration_ns: Wall-clock duration in nanoseconds.
+        thread_id: Identifier of the thread the span ran on.
+    """
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1_000_000
+
+
+class BootTimeline:
+    """Record how long each boot phase takes and export it as a Chrome trace.
+
+    Spans are recorded from container creation until `finish()` is called at the
+    end of `Application.boot()`, so services resolved later at runtime are not
+    tracked. The exported file opens in `chrome://tracing` or https://ui.perfetto.dev.
+
+    Usage:
+        with app.timeline.span("GitServiceProvider", "provider"):
+            await provider.boot()
+        app.timeline.write(app.cache_path("boot_trace.json"))
+    """
+
+    def __init__(self) -> None:
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: List[BootSpan] = []
+        self._lock = threading.Lock()
+        self.recording = True
+
+    @property
+    def spans(self) -> List[BootSpan]:
+        """Return the recorded spans in completion order."""
+        return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        """Time the enclosed block as one span.
+
+        Usage: `with timeline.span("LoadConfiguration", "bootstrap"): ...`
+        """
+        if not self.recording:
+            yield
+            return
+
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            span = BootSpan(
+                name=name,
+                category=category,
+                start_ns=start_ns - self._origin_ns,
+                duration_ns=end_ns - start_ns,
+                thread_id=threading.get_ident(),
+            )
+            with self._lock:
+                self._spans.append(span)
+
+    def finish(self) -> None:
+        """Stop recording new spans."""
+        self.recording = False
+
+    def totals(self, category: str) -> dict[str, float]:
+        """Return the total milliseconds per span name for a category, slowest first.
+
+        Usage: `timeline.totals("provider")` -> `{"GitServiceProvider": 84.2, ...}`
+        """
+        totals: dict[str, float] = defaultdict(float)
+        for span in self._spans:
+            if span.category == category:
+                totals[span.name] += span.duration_ms
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def to_chrome_trace(self) -> dict:
+        """Return the spans in Chrome Trace Event format.
+
+        Usage: `json.dumps(timeline.to_chrome_trace())`
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+            }
+            for span in sorted(self._spans, key=lambda span: span.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> Path:
+        """Write the Chrome trace JSON to a file and return its path.
+
+        Usage: `timeline.write(app.cache_path("boot_trace.json"))`
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()))
+        return path
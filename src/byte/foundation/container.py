@@ -2,6 +2,7 @@ import inspect
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Type, TypeVar, Union, overload
 
+from byte.foundation.boot_timeline import BootTimeline
 from byte.support import Str
 from byte.support.mixins import Bootable
 from byte.tui import Console
@@ -26,6 +27,7 @@ class Container:
         self._instances = {}
 
         self._service_providers = []
+        self.timeline = BootTimeline()
 
     @classmethod
     def set_instance(cls, container):
@@ -72,10 +74,19 @@ class Container:
 
         # TODO: Centralize this.
         if isinstance(instance, Bootable):
-            instance.ensure_booted(**kwargs)
+            self._boot_instance(instance, **kwargs)
 
         return instance
 
+    def _boot_instance(self, instance: Bootable, **kwargs) -> None:
+        """Boot an instance, recording the boot on the timeline while the application boots."""
+        if instance._is_booted or not self.timeline.recording:
+            instance.ensure_booted(**kwargs)
+            return
+
+        with self.timeline.span(type(instance).__name__, "service"):
+            instance.ensure_booted(**kwargs)
+
     @overload
     def make(self, abstract: Type[T], **kwargs) -> T: ...
 
@@ -115,7 +126,7 @@ class Container:
         instance = abstract(app=self, **kwargs)
 
         if isinstance(instance, Bootable):
-            instance.ensure_booted(**kwargs)
+            self._boot_instance(instance, **kwargs)
 
         return instance
 
@@ -9,3 +9,18 @@ class GatewayConfig(BaseModel):
     port: int = Field(
         default=0, description="Port to bind the gateway server to (0 lets the OS choose an available port)"
     )
+    max_in_flight: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of requests processed concurrently for each connected client",
+    )
+    outbound_high_water: int = Field(
+        default=256,
+        ge=1,
+        description="Queued notifications per client before state updates are dropped and streamed responses are merged into larger frames",
+    )
+    outbound_queue_limit: int = Field(
+        default=1024,
+        ge=1,
+        description="Hard cap on queued notifications per client; past it, notifications that cannot be merged into a queued frame are dropped",
+    )
@@ -1,9 +1,15 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 
 @dataclass
 class GatewayRequest:
-    """Base class for typed gateway requests."""
+    """Base class for typed gateway requests.
+
+    The JSON-RPC method defaults to the snake_case class name; set `METHOD` to override it.
+    """
+
+    METHOD: ClassVar[str | None] = None
 
     id: str | int
 
@@ -41,3 +47,24 @@ class Requests:
         """Drop file contents from session context."""
 
         file_path: str
+
+    @dataclass
+    class Stats(GatewayRequest):
+        """Return outbound queue and dispatch metrics for every connected session."""
+
+    @dataclass
+    class AgentRun(GatewayRequest):
+        """Run an agent command and stream `agent/delta` notifications tagged with this request id."""
+
+        METHOD: ClassVar[str | None] = "agent/run"
+
+        input: str
+        command: str = "coder"
+
+    @dataclass
+    class AgentCancel(GatewayRequest):
+        """Cancel a running `agent/run` request."""
+
+        METHOD: ClassVar[str | None] = "agent/cancel"
+
+        run_id: str | int
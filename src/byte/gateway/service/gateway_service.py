@@ -1,4 +1,3 @@
-import asyncio
 import json
 import os
 import secrets
@@ -22,15 +21,27 @@ from byte.tui.messages import Messages
 
 
 class GatewayService(Service):
-    """Manage the WebSocket server lifecycle and per-connection auth handshake."""
+    """Manage the WebSocket server lifecycle, per-connection auth handshake and session registry.
+
+    Every authenticated connection gets its own SessionService, and notifications fan out
+    to all of them so several clients can drive the same Byte instance.
+    """
 
     def boot(self) -> None:
         self._config = self.app["config"].gateway
         self._token: str = ""
         self._server: Any | None = None  # websockets does not export a stable ServerConnection type
-        self._session: SessionService | None = None
+        self._sessions: dict[str, SessionService] = {}
         self._actual_port: int = 0
 
+    @property
+    def sessions(self) -> list[SessionService]:
+        """Return the currently connected sessions.
+
+        Usage: `for session in gateway.sessions: ...`
+        """
+        return list(self._sessions.values())
+
     def _token_path(self) -> Path:
         """Return the path to the gateway token file."""
         return self.app.cache_path("gateway.token")
@@ -92,8 +103,16 @@ class GatewayService(Service):
         ok_response = RpcResponse(id=request.id, result={"ok": True})
         await websocket.send(ok_response.model_dump_json())
 
-        self._session = self.app.make(SessionService, websocket=websocket)
-        await self._session.handle_connection()
+        session_id = secrets.token_hex(8)
+        session = self.app.make(SessionService, websocket=websocket, session_id=session_id)
+        self._sessions[session_id] = session
+        self.app["log"].debug(f"Session {session_id} registered ({len(self._sessions)} active)")
+
+        try:
+            await session.handle_connection()
+        finally:
+            self._sessions.pop(session_id, None)
+            self.app["log"].debug(f"Session {session_id} closed ({len(self._sessions)} active)")
 
     async def start(self) -> None:
         """Generate the auth token, write discovery files, and start the WebSocket server."""
@@ -130,27 +149,41 @@ class GatewayService(Service):
         self._cleanup_files()
 
     def post_message(self, event: Message) -> None:
-        """Route inbound application events to appropriate notification handlers."""
+        """Route inbound application events to every connected session as notifications."""
 
-        if not self._session:
+        if not self._sessions:
             return
 
         match event:
-            case Messages.Response():
-                coroutine = self._session.notify(
-                    "messages/response", {"content": str(event.chunk), "done": event.status is Status.SUCCESS}
-                )
+            # Only streamed text and the final frame are forwarded; PENDING chunks carry the node name
+            case Messages.Response() if event.status in (Status.RUNNING, Status.SUCCESS):
+                method = "messages/response"
+                content = "" if event.chunk is None else str(event.chunk)
+                params = {"content": content, "done": event.status is Status.SUCCESS}
             case Messages.UpdateFiles():
-                coroutine = self._session.notify("messages/update_files", {"count": event.count})
+                method, params = "messages/update_files", {"count": event.count}
             case Messages.UpdateContext():
-                coroutine = self._session.notify("messages/update_context", {"context_count": event.context_count})
+                method, params = "messages/update_context", {"context_count": event.context_count}
             case Messages.CommandExecutionStarted():
-                coroutine = self._session.notify("messages/command_execution_started", {})
+                method, params = "messages/command_execution_started", {}
             case Messages.CommandExecutionCompleted():
-                coroutine = self._session.notify("messages/command_execution_completed", {})
+                method, params = "messages/command_execution_completed", {}
             case Messages.Status() if event.state == "error":
-                coroutine = self._session.notify("messages/status", {"message": event.message or ""})
+                method, params = "messages/status", {"message": event.message or ""}
             case _:
                 return
 
-        asyncio.create_task(coroutine)
+        for session in self.sessions:
+            session.enqueue(method, params)
+
+    def stats(self) -> dict[str, Any]:
+        """Return outbound queue and dispatch metrics for every connected session.
+
+        Usage: `gateway.stats()` -> `{"sessions": 2, "queue_depth": 3, "session_stats": [...]}`
+        """
+        session_stats = [session.stats() for session in self.sessions]
+        return {
+            "sessions": len(session_stats),
+            "queue_depth": sum(stats["queue_depth"] for stats in session_stats),
+            "session_stats": session_stats,
+        }
@@ -1,12 +1,16 @@
+import asyncio
+import uuid
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 import websockets.exceptions
 
-from byte import CommandRegistryService
+from byte import Command, CommandRegistryService
 from byte.files.service.file_service import FileService
 from byte.gateway.protocol import (
     ERR_INTERNAL,
+    ERR_INVALID_REQUEST,
     ERR_METHOD_NOT_FOUND,
     RpcNotification,
     RpcRequest,
@@ -17,9 +21,32 @@ from byte.gateway.utils import GatewayUtils, on
 from byte.knowledge import SessionContextModel, SessionContextService
 from byte.support import Service
 
+if TYPE_CHECKING:
+    from byte.orchestration import WorkflowRun
+
+# Streamed text: consecutive chunks are merged into one frame while they wait in the queue.
+COALESCED_METHODS = frozenset({"messages/response", "agent/delta"})
+# Agent deltas that carry a chunk of a stream, and the param holding the chunk.
+COALESCED_DELTA_FIELDS = {"text": "text", "tool_args": "args"}
+# State snapshots: only the newest value matters, so a queued one is replaced in place.
+LATEST_WINS_METHODS = frozenset({"messages/update_files", "messages/update_context"})
+
 
 class SessionService(Service):
-    """Handle a single authenticated WebSocket session — receive commands and stream events."""
+    """Handle a single authenticated WebSocket session — receive commands and stream events.
+
+    Requests are dispatched as concurrent tasks, at most `gateway.max_in_flight` at a time,
+    so a slow request does not block the ones behind it. Each response carries its request
+    id and is sent as soon as its handler finishes.
+
+    Notifications go through a per-session outbound queue drained by a single writer, so
+    a slow client only delays itself. While a frame is being sent, streamed chunks (response
+    text, agent text and tool arguments) merge into the frame behind it. Past
+    `gateway.outbound_high_water` queued frames, state updates are dropped and a chunk is
+    merged into the latest queued frame of its request when that frame belongs to the same
+    stream. Once `gateway.outbound_queue_limit` frames are queued, any notification that
+    cannot be merged is dropped, so the queue never grows past the limit.
+    """
 
     def _build_dispatch_table(self) -> None:
         """Scan methods for `_gateway_request_type` attribute and build dispatch table."""
@@ -36,12 +63,29 @@ class SessionService(Service):
     def boot(
         self,
         websocket: Any,  # websockets does not export a stable ServerConnection type
+        session_id: str = "",
     ) -> None:
         self._websocket = websocket
+        self.session_id = session_id
         self._command_registry = self.app.make(CommandRegistryService)
         self._subscriptions: list[Any] = []
+        self._in_flight = asyncio.Semaphore(self.app["config"].gateway.max_in_flight)
+        self._tasks: set[asyncio.Task] = set()
         self._build_dispatch_table()
 
+        self._high_water: int = self.app["config"].gateway.outbound_high_water
+        self._queue_limit: int = max(self.app["config"].gateway.outbound_queue_limit, self._high_water)
+        self._outbox: deque[RpcNotification] = deque()
+        self._outbox_ready = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._agent_run_id: str | int | None = None
+        self._agent_run: WorkflowRun | None = None
+
+        self.notifications_sent: int = 0
+        self.notifications_merged: int = 0
+        self.notifications_dropped: int = 0
+        self.peak_queue_depth: int = 0
+
     async def _send(self, message: RpcResponse | RpcNotification) -> None:
         """Serialize and send a message over the WebSocket, ignoring closed connection errors."""
         try:
@@ -173,19 +217,243 @@ class SessionService(Service):
             await self._send(GatewayUtils.make_error_response(request.id, ERR_METHOD_NOT_FOUND, "Unknown method type"))
             return
 
-        await handler(request)
+        try:
+            await handler(request)
+        except Exception as exc:
+            self.app["log"].exception(f"Gateway handler failed for {rpc.method}")
+            await self._send(GatewayUtils.make_error_response(request.id, ERR_INTERNAL, str(exc)))
+
+    async def _run(self, raw: str) -> None:
+        """Dispatch a single request and release its in-flight slot when done."""
+        try:
+            await self._dispatch(raw)
+        finally:
+            self._in_flight.release()
+
+    async def _spawn(self, raw: str) -> None:
+        """Start a dispatch task, waiting while the session is at its in-flight limit.
+
+        Waiting here stops the read loop, which pushes back on the client through the socket.
+        """
+        await self._in_flight.acquire()
+        task = asyncio.create_task(self._run(raw))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _stream_key(notification: RpcNotification) -> tuple | None:
+        """Return the stream a chunk notification belongs to, or None if it is never merged.
+
+        The final response frame and agent deltas other than text and tool arguments are
+        not chunks; tool arguments stream per tool call.
+        """
+        params = notification.params
+        if notification.method == "messages/response":
+            return None if params["done"] else (notification.method,)
+
+        if notification.method == "agent/delta" and params["type"] in COALESCED_DELTA_FIELDS:
+            return (notification.method, params["request_id"], params["type"], params.get("tool_id"))
+
+        return None
+
+    @staticmethod
+    def _same_request(queued: RpcNotification, notification: RpcNotification) -> bool:
+        """Whether a queued frame belongs to the same request stream as a notification."""
+        return queued.method == notification.method and queued.params.get("request_id") == notification.params.get(
+            "request_id"
+        )
+
+    def _can_merge(self, target: RpcNotification, notification: RpcNotification) -> bool:
+        """Whether two frames are chunks of the same stream; a final frame is never folded."""
+        key = self._stream_key(notification)
+        return key is not None and self._stream_key(target) == key
+
+    def _merge(self, target: RpcNotification, notification: RpcNotification) -> None:
+        """Fold a chunk into an already queued frame of the same stream."""
+        if notification.method == "messages/response":
+            target.params["content"] += notification.params["content"]
+        else:
+            field = COALESCED_DELTA_FIELDS[notification.params["type"]]
+            target.params[field] += notification.params[field]
+        self.notifications_merged += 1
+
+    def _enqueue(self, notification: RpcNotification) -> None:
+        """Apply the merge/drop policy and queue a notification for the writer."""
+        outbox = self._outbox
+        method = notification.method
+
+        if method in COALESCED_METHODS and outbox and self._can_merge(outbox[-1], notification):
+            self._merge(outbox[-1], notification)
+            return
+
+        if method in LATEST_WINS_METHODS:
+            for index, queued in enumerate(outbox):
+                if queued.method == method:
+                    outbox[index] = notification
+                    self.notifications_merged += 1
+                    return
+
+        if len(outbox) >= self._high_water:
+            if method in LATEST_WINS_METHODS:
+                self.notifications_dropped += 1
+                return
+
+            if method in COALESCED_METHODS:
+                # Only the request's latest frame may absorb the chunk, so its frames stay in order.
+                latest = next((queued for queued in reversed(outbox) if self._same_request(queued, notification)), None)
+                if latest is not None and self._can_merge(latest, notification):
+                    self._merge(latest, notification)
+                    return
+
+            if len(outbox) >= self._queue_limit:
+                self.notifications_dropped += 1
+                return
+
+        outbox.append(notification)
+        self.peak_queue_depth = max(self.peak_queue_depth, len(outbox))
+        self._outbox_ready.set()
+
+    def enqueue(self, method: str, params: dict[str, Any]) -> None:
+        """Queue a notification for this session; safe to call from any thread.
+
+        Usage: `session.enqueue("messages/response", {"content": "Hel", "done": False})`
+        """
+        notification = RpcNotification(method=method, params=dict(params))
+
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+
+            if running is not loop:
+                loop.call_soon_threadsafe(self._enqueue, notification)
+                return
+
+        self._enqueue(notification)
+
+    async def _drain(self) -> None:
+        """Send queued notifications one at a time for as long as the session is open."""
+        while True:
+            await self._outbox_ready.wait()
+            self._outbox_ready.clear()
 
-    async def notify(self, method: str, params: dict[str, Any]) -> None:
-        """Build and send an RpcNotification for the given method and params."""
-        await self._send(RpcNotification(method=method, params=params))
+            while self._outbox:
+                notification = self._outbox.popleft()
+                await self._send(notification)
+                self.notifications_sent += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue and dispatch metrics for this session.
+
+        Usage: `session.stats()` -> `{"session_id": "...", "queue_depth": 0, "sent": 120, ...}`
+        """
+        return {
+            "session_id": self.session_id,
+            "queue_depth": len(self._outbox),
+            "peak_queue_depth": self.peak_queue_depth,
+            "high_water": self._high_water,
+            "queue_limit": self._queue_limit,
+            "sent": self.notifications_sent,
+            "merged": self.notifications_merged,
+            "dropped": self.notifications_dropped,
+            "in_flight": len(self._tasks),
+        }
+
+    async def _execute_agent(self, command: Command, request: Requests.AgentRun) -> None:
+        """Run the agent command on this thread's event loop with its own response panel.
+
+        The browser the command started on this loop is stopped before the loop closes.
+        """
+        from byte.tui import TUIManagerService
+        from byte.web import BrowserPoolService
+
+        tui_manager_service = self.app.make(TUIManagerService)
+        tui_manager_service.thread_local.panel_id = f"panel_{str(uuid.uuid4()).replace('-', '_')}"
+        tui_manager_service.thread_local.is_interrupted = False
+
+        try:
+            await command.handle(request.input)
+        finally:
+            if self.app.bound(BrowserPoolService):
+                await self.app.make(BrowserPoolService).close_loop()
+
+    @on(Requests.AgentRun)
+    async def handle_agent_run(self, request: Requests.AgentRun) -> None:
+        from byte.orchestration import WorkflowService
+
+        command = self._command_registry.get_slash_command(request.command)
+        if command is None:
+            await self._send(
+                GatewayUtils.make_error_response(request.id, ERR_INVALID_REQUEST, f"Unknown command: {request.command}")
+            )
+            return
+
+        workflow_service = self.app.make(WorkflowService)
+        if not workflow_service.run_lock.acquire(blocking=False):
+            await self._send(
+                GatewayUtils.make_error_response(request.id, ERR_INTERNAL, "An agent run is already in progress")
+            )
+            return
+
+        run = workflow_service.begin_run()
+        self._agent_run_id, self._agent_run = request.id, run
+
+        # Like the TUI, run the workflow on a worker thread with its own event loop so a long
+        # run never stalls the gateway. The run and the delta sink follow it there with the context,
+        # and deltas come back through the thread-safe `enqueue`.
+        try:
+            with workflow_service.stream_deltas(
+                lambda delta: self.enqueue("agent/delta", {"request_id": request.id, **delta})
+            ):
+                await asyncio.to_thread(asyncio.run, self._execute_agent(command, request))
+            cancelled = run.cancelled
+        except asyncio.CancelledError:
+            # The client went away; the worker thread cannot be cancelled, so ask it to stop.
+            run.cancel()
+            raise
+        finally:
+            self._agent_run_id, self._agent_run = None, None
+            workflow_service.run_lock.release()
+
+        self.enqueue("agent/delta", {"request_id": request.id, "type": "done", "cancelled": cancelled})
+        await self._send(RpcResponse(id=request.id, result={"ok": True, "cancelled": cancelled}))
+
+    @on(Requests.AgentCancel)
+    async def handle_agent_cancel(self, request: Requests.AgentCancel) -> None:
+        if self._agent_run is None or self._agent_run_id != request.run_id:
+            await self._send(
+                GatewayUtils.make_error_response(
+                    request.id, ERR_INVALID_REQUEST, f"No running agent run: {request.run_id}"
+                )
+            )
+            return
+
+        self._agent_run.cancel()
+        await self._send(RpcResponse(id=request.id, result={"ok": True, "run_id": request.run_id}))
+
+    @on(Requests.Stats)
+    async def handle_stats(self, request: Requests.Stats) -> None:
+        from byte.gateway.service.gateway_service import GatewayService
+
+        gateway_service = self.app.make(GatewayService)
+        await self._send(RpcResponse(id=request.id, result=gateway_service.stats()))
 
     async def handle_connection(self) -> None:
         """Subscribe to EventBus events and run the inbound message loop until the client disconnects."""
+        self._loop = asyncio.get_running_loop()
+        writer = asyncio.create_task(self._drain())
+
         try:
-            self.app["log"].debug("Gateway started")
+            self.app["log"].debug(f"Gateway session {self.session_id} started")
             async for raw in self._websocket:
-                await self._dispatch(raw)
+                await self._spawn(raw)
         except websockets.exceptions.ConnectionClosed:
-            self.app["log"].debug("Gateway client disconnected")
+            self.app["log"].debug(f"Gateway session {self.session_id} disconnected")
         finally:
-            pass
+            writer.cancel()
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(writer, *self._tasks, return_exceptions=True)
+            self.app["log"].debug(f"Gateway session {self.session_id} stats: {self.stats()}")
@@ -17,9 +17,9 @@ class GatewayServiceProvider(ServiceProvider):
         self.app.singleton(GatewayService)
 
     async def boot(self) -> None:
-        """Start the gateway server in a background task if gateway.enable is True."""
+        """Start the gateway server in a background task if gateway.enable is True or running headless."""
         config: GatewayConfig = self.app["config"].gateway
-        if not config.enable:
+        if not config.enable and not self.app.is_headless():
             return
 
         # TODO: This should use the task service.
@@ -30,7 +30,7 @@ class GatewayServiceProvider(ServiceProvider):
     async def shutdown(self, app: Application) -> None:
         """Stop the gateway server on application shutdown."""
         config: GatewayConfig = app["config"].gateway
-        if not config.enable:
+        if not config.enable and not app.is_headless():
             return
 
         gateway: GatewayService = app.make(GatewayService)
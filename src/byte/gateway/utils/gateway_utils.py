@@ -9,7 +9,7 @@ class GatewayUtils:
     """Gateway utility helper methods."""
 
     REQUEST_TYPES: dict[str, type[GatewayRequest]] = {
-        Str.class_to_snake_case(cls.__name__): cls
+        cls.METHOD or Str.class_to_snake_case(cls.__name__): cls
         for _, cls in inspect.getmembers(Requests, inspect.isclass)
         if issubclass(cls, GatewayRequest) and cls is not GatewayRequest
     }
@@ -10,10 +10,14 @@ if TYPE_CHECKING:
     from byte.knowledge.command.context_drop_command import ContextDropCommand
     from byte.knowledge.command.context_list_command import ContextListCommand
     from byte.knowledge.command.web_command import WebCommand
+    from byte.knowledge.config import KnowledgeConfig, RetrievalConfig
     from byte.knowledge.models import SessionContextModel
+    from byte.knowledge.schemas import SessionContextChunk
+    from byte.knowledge.service.session_context_index_service import SessionContextIndexService
     from byte.knowledge.service.session_context_service import SessionContextService
     from byte.knowledge.service_provider import KnowledgeServiceProvider
     from byte.knowledge.tools.add_files_to_context_tool import AddFilesToContextTool
+    from byte.knowledge.tools.search_session_context_tool import SearchSessionContextTool
 
 __all__ = (
     "AddFilesToContextTool",
@@ -21,7 +25,12 @@ __all__ = (
     "ContextAddFileCommand",
     "ContextDropCommand",
     "ContextListCommand",
+    "KnowledgeConfig",
     "KnowledgeServiceProvider",
+    "RetrievalConfig",
+    "SearchSessionContextTool",
+    "SessionContextChunk",
+    "SessionContextIndexService",
     "SessionContextModel",
     "SessionContextService",
     "WebCommand",
@@ -33,11 +42,16 @@ _dynamic_imports = {
     "ContextAddFileCommand": "command.context_add_file_command",
     "ContextDropCommand": "command.context_drop_command",
     "ContextListCommand": "command.context_list_command",
+    "KnowledgeConfig": "config",
     "KnowledgeServiceProvider": "service_provider",
+    "RetrievalConfig": "config",
+    "SessionContextChunk": "schemas",
+    "SessionContextIndexService": "service.session_context_index_service",
     "SessionContextModel": "models",
     "SessionContextService": "service.session_context_service",
     "WebCommand": "command.web_command",
     "AddFilesToContextTool": "tools.add_files_to_context_tool",
+    "SearchSessionContextTool": "tools.search_session_context_tool",
     # keep-sorted end
 }
 
@@ -7,7 +7,7 @@ from byte.support.mixins import UserInteractive
 from byte.support.utils import slugify
 from byte.tui import InputCancelledError, InteractionService, Messages
 from byte.tui.schemas import Answer
-from byte.web import ChromiumService
+from byte.web import ChromiumService, DocsCrawlerService
 
 
 class WebCommand(Command, UserInteractive):
@@ -15,7 +15,10 @@ class WebCommand(Command, UserInteractive):
 
     Fetches a webpage using headless Chrome, converts the HTML content to
     markdown, displays it for review, and optionally adds it to the LLM context.
+    With `--crawl`, each URL is treated as the start of a documentation site and
+    the pages linked from its navigation are added as well.
     Usage: `/web https://example.com` -> scrapes and displays page as markdown
+    Usage: `/web --crawl https://docs.example.com/` -> crawls the docs and adds every page
     """
 
     @property
@@ -33,6 +36,13 @@ class WebCommand(Command, UserInteractive):
             description="Fetch webpage using headless Chrome, convert HTML to markdown, display for review, and optionally add to LLM context",
         )
         parser.add_argument("urls", nargs="+", help="One or more URLs to scrape (space, comma, or newline separated)")
+        parser.add_argument(
+            "--crawl",
+            action="store_true",
+            help="Follow same-site navigation links from each URL and add every page found",
+        )
+        parser.add_argument("--depth", type=int, help="Navigation link levels to follow when crawling")
+        parser.add_argument("--max-pages", type=int, help="Maximum number of pages to fetch per crawl")
         return parser
 
     async def execute(self, args: Namespace, raw_args: str) -> None:
@@ -59,19 +69,34 @@ class WebCommand(Command, UserInteractive):
                     if stripped:
                         urls.append(stripped)
 
-        for url in urls:
-            try:
-                chromium_service = self.app.make(ChromiumService)
-                markdown_content = await chromium_service.do_scrape(url)
-            except ByteConfigException as e:
+        if args.crawl:
+            await self._crawl(urls, args.depth, args.max_pages)
+            return
+
+        # Load every page up front, in parallel browser tabs, then review them one by one
+        try:
+            chromium_service = self.app.make(ChromiumService)
+            pages = await chromium_service.do_scrape_many(urls)
+        except ByteConfigException as e:
+            self.emit_tui(
+                Messages.CreatePanel(
+                    str(e),
+                    title="Configuration Error",
+                    border_style="error",
+                )
+            )
+            return
+
+        for url, markdown_content in zip(urls, pages):
+            if isinstance(markdown_content, BaseException):
                 self.emit_tui(
                     Messages.CreatePanel(
-                        str(e),
-                        title="Configuration Error",
+                        str(markdown_content),
+                        title=f"Could not load {url}",
                         border_style="error",
                     )
                 )
-                return
+                continue
 
             content_panel_id = self.emit_tui(
                 Messages.CreatePanel(
@@ -125,3 +150,62 @@ class WebCommand(Command, UserInteractive):
 
             if content_panel_id:
                 self.emit_tui(Messages.RemovePanel(panel_id_to_remove=content_panel_id))
+
+    async def _crawl(self, urls: list[str], max_depth: int | None, max_pages: int | None) -> None:
+        """Crawl each URL as a documentation site and offer to add all of its pages to the context."""
+        session_context_service = self.app.make(SessionContextService)
+        crawler = self.app.make(DocsCrawlerService)
+
+        for url in urls:
+            try:
+                result = await crawler.crawl(url, max_depth=max_depth, max_pages=max_pages)
+            except ByteConfigException as e:
+                self.emit_tui(
+                    Messages.CreatePanel(
+                        str(e),
+                        title="Configuration Error",
+                        border_style="error",
+                    )
+                )
+                return
+
+            for failed_url, error in result.failed.items():
+                self.emit_tui(
+                    Messages.CreatePanel(
+                        error,
+                        title=f"Could not load {failed_url}",
+                        border_style="error",
+                    )
+                )
+
+            if not result.pages:
+                await self.notify_warning(f"No pages found at {url}")
+                continue
+
+            summary = "\n".join(f"- {page.url} ({len(page.markdown):,} chars)" for page in result.pages)
+            summary_panel_id = self.emit_tui(
+                Messages.CreatePanel(
+                    summary,
+                    f"Crawled {len(result.pages)} pages: {url}",
+                )
+            )
+
+            try:
+                interaction_service = self.app.make(InteractionService)
+                confirmed = await interaction_service.confirm(
+                    f"Add these {len(result.pages)} pages to the LLM context?",
+                    default=True,
+                )
+            except InputCancelledError:
+                return
+
+            if confirmed:
+                for page in result.pages:
+                    model = self.app.make(SessionContextModel, type="web", key=slugify(page.url), content=page.markdown)
+                    session_context_service.add_context(model)
+                await self.notify_success(f"Added {len(result.pages)} pages to context")
+            else:
+                await self.notify_warning("Content not added to context")
+
+            if summary_panel_id:
+                self.emit_tui(Messages.RemovePanel(panel_id_to_remove=summary_panel_id))
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+
+class RetrievalConfig(BaseModel):
+    """Full-text retrieval over session context instead of inlining every document."""
+
+    enable: bool = Field(
+        default=True,
+        description="Index session context and, once it outgrows `inline_max_tokens`, send only the chunks relevant to the current request",
+    )
+    inline_max_tokens: int = Field(
+        default=4000,
+        ge=0,
+        description="Session context up to this many tokens is sent in full. Above it, only retrieved chunks are sent",
+    )
+    top_k: int = Field(
+        default=6,
+        ge=1,
+        description="Number of retrieved chunks sent with each request",
+    )
+    chunk_chars: int = Field(
+        default=1500,
+        ge=200,
+        description="Maximum characters per indexed chunk. Documents are split at headings, and longer sections at blank lines",
+    )
+
+
+class KnowledgeConfig(BaseModel):
+    """Configure session context and knowledge retrieval."""
+
+    retrieval: RetrievalConfig = RetrievalConfig()
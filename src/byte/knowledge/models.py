@@ -8,8 +8,10 @@ from byte.support.utils import list_to_multiline_text, slugify
 class SessionContextModel(Bootable):
     """Model representing a session context item with file-based persistence.
 
-    Content is stored in .byte/session_context/ and loaded on-demand.
-    Similar to FileContext pattern for consistent file handling.
+    Content is stored in .byte/session_context/ and held in memory, so reading
+    it never touches the disk. Writes go through to the file, and edits made to
+    the file outside Byte are picked up by `reload()`, which the file watcher
+    calls and which only re-reads when the file's mtime or size changed.
     """
 
     def boot(self, type: Literal["web", "file", "agent"], key: str, **kwargs) -> None:
@@ -17,18 +19,17 @@ class SessionContextModel(Bootable):
         self.key = key
 
         self.file_path = self.app.session_context_path(f"{slugify(self.key)}.md")
+        self._content = ""
+        self._signature: tuple[int, int] | None = None
         self.set_content(kwargs.get("content"))
 
     @property
     def content(self) -> str:
-        """Read content from file, returning empty string if unreadable.
+        """Return the in-memory content.
 
         Usage: `text = model.content`
         """
-        try:
-            return self.file_path.read_text(encoding="utf-8")
-        except FileNotFoundError, PermissionError, UnicodeDecodeError:
-            return ""
+        return self._content
 
     def set_content(self, content: str) -> None:
         """Write content to file, creating parent directories if needed.
@@ -37,6 +38,31 @@ class SessionContextModel(Bootable):
         """
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         self.file_path.write_text(content, encoding="utf-8")
+        self._content = content
+        self._signature = self._stat()
+
+    def _stat(self) -> tuple[int, int]:
+        stat = self.file_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self) -> bool:
+        """Re-read the file if its mtime or size changed since it was last read or written.
+
+        A missing or unreadable file leaves the model empty. Returns whether the
+        content changed.
+        Usage: `if model.reload(): ...`
+        """
+        try:
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            content = self.file_path.read_text(encoding="utf-8")
+        except FileNotFoundError, PermissionError, UnicodeDecodeError:
+            signature, content = None, ""
+
+        changed = content != self._content
+        self._content, self._signature = content, signature
+        return changed
 
     def exists(self) -> bool:
         """Check if the content file exists.
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from byte.support import Boundary, BoundaryType
+from byte.support.utils import list_to_multiline_text
+
+
+@dataclass
+class SessionContextChunk:
+    """A section of a session context document returned by full-text search."""
+
+    key: str
+    type: str
+    heading: str
+    content: str
+    score: float = 0.0
+
+    def to_boundary(self) -> str:
+        return list_to_multiline_text(
+            [
+                Boundary.open(
+                    BoundaryType.SESSION_CONTEXT,
+                    meta={"type": self.type, "key": self.key, "section": self.heading},
+                ),
+                self.content,
+                Boundary.close(BoundaryType.SESSION_CONTEXT),
+            ]
+        )
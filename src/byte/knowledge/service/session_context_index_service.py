@@ -0,0 +1,158 @@
+import hashlib
+import re
+import sqlite3
+
+from byte import Service
+from byte.analytics import TokenCounterService
+from byte.knowledge import SessionContextChunk, SessionContextModel
+
+
+class SessionContextIndexService(Service):
+    """Full-text index over session context, chunked by markdown headings.
+
+    Documents are split at headings outside code fences, and sections longer
+    than `knowledge.retrieval.chunk_chars` are split again at blank lines.
+    Chunks are stored in an in-memory SQLite FTS5 table with the
+    `porter unicode61` tokenizer and ranked with BM25, headings weighted above
+    body text. `sync()` only re-indexes documents whose content changed.
+    Usage: `chunks = index.search("configure retries", limit=6)`
+    """
+
+    HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+    FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+    PARAGRAPH_PATTERN = re.compile(r"\n\s*\n")
+    TERM_PATTERN = re.compile(r"\w+")
+
+    # Upper bound on query terms, so a pasted stack trace stays a cheap query
+    MAX_QUERY_TERMS: int = 64
+
+    # BM25 column weights for (key, type, heading, content)
+    COLUMN_WEIGHTS: tuple[float, ...] = (0.0, 0.0, 2.0, 1.0)
+
+    def boot(self) -> None:
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.connection.execute(
+            "CREATE VIRTUAL TABLE chunks USING fts5(key UNINDEXED, type UNINDEXED, heading, content, tokenize='porter unicode61')"
+        )
+        self.signatures: dict[str, str] = {}
+        self.token_counts: dict[str, int] = {}
+
+    @classmethod
+    def chunk(cls, content: str, max_chars: int) -> list[tuple[str, str]]:
+        """Split markdown into `(heading path, text)` chunks.
+
+        The heading path joins the enclosing headings, e.g. "Install > Linux".
+        Usage: `SessionContextIndexService.chunk(markdown, 1500)` -> [("Install > Linux", "## Linux ..."), ...]
+        """
+        sections: list[tuple[str, list[str]]] = [("", [])]
+        headings: list[tuple[int, str]] = []
+        in_fence = False
+
+        for line in content.splitlines():
+            if cls.FENCE_PATTERN.match(line):
+                in_fence = not in_fence
+            elif not in_fence and (match := cls.HEADING_PATTERN.match(line)):
+                level = len(match.group(1))
+                while headings and headings[-1][0] >= level:
+                    headings.pop()
+                headings.append((level, match.group(2)))
+                sections.append((" > ".join(title for _, title in headings), []))
+            sections[-1][1].append(line)
+
+        chunks = []
+        for heading, lines in sections:
+            text = "\n".join(lines).strip()
+            if text:
+                chunks.extend((heading, part) for part in cls._split(text, max_chars))
+        return chunks
+
+    @classmethod
+    def _split(cls, text: str, max_chars: int) -> list[str]:
+        """Split a section at blank lines into parts of at most `max_chars`."""
+        if len(text) <= max_chars:
+            return [text]
+
+        parts: list[str] = []
+        current = ""
+        for paragraph in cls.PARAGRAPH_PATTERN.split(text):
+            while len(paragraph) > max_chars:
+                if current:
+                    parts.append(current)
+                    current = ""
+                parts.append(paragraph[:max_chars])
+                paragraph = paragraph[max_chars:]
+
+            if current and len(current) + len(paragraph) + 2 > max_chars:
+                parts.append(current)
+                current = ""
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+
+        if current.strip():
+            parts.append(current)
+        return parts
+
+    @classmethod
+    def match_query(cls, text: str) -> str:
+        """Turn free text into an FTS5 query matching any of its terms.
+
+        Each term is quoted so FTS5 operators and punctuation in the text are
+        never interpreted.
+        Usage: `SessionContextIndexService.match_query("add a retry!")` -> '"add" OR "a" OR "retry"'
+        """
+        terms = dict.fromkeys(term.lower() for term in cls.TERM_PATTERN.findall(text))
+        return " OR ".join(f'"{term}"' for term in list(terms)[: cls.MAX_QUERY_TERMS])
+
+    def sync(self, contexts: dict[str, SessionContextModel]) -> None:
+        """Bring the index in line with the current session context.
+
+        Usage: `index.sync(session_context_service.get_all_context())`
+        """
+        for key in self.signatures.keys() - contexts.keys():
+            self.remove(key)
+
+        chunk_chars = self.app["config"].knowledge.retrieval.chunk_chars
+        for key, model in contexts.items():
+            content = model.content
+            signature = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+            if self.signatures.get(key) == signature:
+                continue
+
+            self.remove(key)
+            self.connection.executemany(
+                "INSERT INTO chunks (key, type, heading, content) VALUES (?, ?, ?, ?)",
+                [(key, model.type, heading, text) for heading, text in self.chunk(content, chunk_chars)],
+            )
+            self.signatures[key] = signature
+            self.token_counts[key] = self.app.make(TokenCounterService).base_count(content)
+
+    def remove(self, key: str) -> None:
+        """Drop a document's chunks from the index."""
+        self.connection.execute("DELETE FROM chunks WHERE key = ?", (key,))
+        self.signatures.pop(key, None)
+        self.token_counts.pop(key, None)
+
+    def total_tokens(self) -> int:
+        """Estimated tokens of all indexed documents if they were inlined."""
+        return sum(self.token_counts.values())
+
+    def search(self, query: str, limit: int, keys: list[str] | None = None) -> list[SessionContextChunk]:
+        """Return the chunks that best match a query, best first.
+
+        Usage: `index.search("rate limits", limit=6, keys=["docs.example.com"])`
+        """
+        match = self.match_query(query)
+        if not match:
+            return []
+
+        sql = f"SELECT key, type, heading, content, bm25(chunks, {', '.join(map(str, self.COLUMN_WEIGHTS))}) AS score FROM chunks WHERE chunks MATCH ?"
+        params: list = [match]
+        if keys:
+            sql += f" AND key IN ({', '.join('?' * len(keys))})"
+            params.extend(keys)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        return [
+            SessionContextChunk(key=key, type=type, heading=heading, content=content, score=-score)
+            for key, type, heading, content, score in self.connection.execute(sql, params)
+        ]
@@ -1,7 +1,9 @@
+from pathlib import Path
 from typing import Optional
 
 from byte import Service
-from byte.knowledge import SessionContextModel
+from byte.files import FileEvents
+from byte.knowledge import SessionContextChunk, SessionContextIndexService, SessionContextModel
 from byte.orchestration import OrchestrationEvents
 from byte.support import ArrayStore, Boundary, BoundaryType
 from byte.support.utils import list_to_multiline_text
@@ -55,10 +57,64 @@ class SessionContextService(Service):
         """Retrieve all context items from the session store."""
         return self.session_context.all()
 
+    async def reload_context_hook(self, payload: FileEvents.SessionContextChanged) -> FileEvents.SessionContextChanged:
+        """Pick up edits made to a session context file outside Byte."""
+        file_path = Path(payload.file_path)
+        for model in self.session_context.all().values():
+            if model.file_path == file_path and model.reload():
+                self.app["log"].debug(f"Reloaded session context '{model.key}' after external edit")
+
+        return payload
+
+    def search_context(self, query: str, limit: int, keys: list[str] | None = None) -> list[SessionContextChunk]:
+        """Full-text search over all session context, re-indexing changed items first.
+
+        Usage: `chunks = service.search_context("retry policy", limit=6)`
+        """
+        index = self.app.make(SessionContextIndexService)
+        index.sync(self.session_context.all())
+        return index.search(query, limit, keys=keys)
+
+    def format_retrieved_context(self, chunks: list[SessionContextChunk]) -> str:
+        """List every session context item, followed by the chunks retrieved for this request."""
+        from byte.knowledge import SearchSessionContextTool
+
+        index = self.app.make(SessionContextIndexService)
+        lines = [
+            "Session context is too large to include in full. Available items:",
+            *(
+                f"- `{key}` ({model.type}, ~{index.token_counts.get(key, 0):,} tokens)"
+                for key, model in self.session_context.all().items()
+            ),
+            "",
+            f"Sections relevant to the user request are included below. Use `{SearchSessionContextTool.name}` to search the rest.",
+        ]
+        if chunks:
+            lines.extend(["", "\n\n".join(chunk.to_boundary() for chunk in chunks)])
+
+        return list_to_multiline_text(lines)
+
     async def add_session_context_hook(
         self, payload: OrchestrationEvents.GatherProjectContext
     ) -> OrchestrationEvents.GatherProjectContext:
-        """Inject session context items into the prompt state."""
+        """Inject session context items into the prompt state.
+
+        Once the session context outgrows `knowledge.retrieval.inline_max_tokens`,
+        only the chunks matching the user request are injected and the search
+        tool is offered for the rest.
+        """
+        retrieval = self.app["config"].knowledge.retrieval
+        if retrieval.enable and self.session_context.is_not_empty():
+            from byte.knowledge import SearchSessionContextTool
+
+            index = self.app.make(SessionContextIndexService)
+            index.sync(self.session_context.all())
+            if index.total_tokens() > retrieval.inline_max_tokens:
+                chunks = index.search(payload.user_request, retrieval.top_k)
+                payload.session_docs.append(self.format_retrieved_context(chunks))
+                payload.tools.append(SearchSessionContextTool)
+                return payload
+
         if self.session_context.is_not_empty():
             # Format each context item with its own tags
             formatted_contexts = []
@@ -1,9 +1,12 @@
 from byte import EventBus, ServiceProvider
+from byte.files import FileEvents
 from byte.knowledge import (
     AddFilesToContextTool,
     ContextAddFileCommand,
     ContextDropCommand,
     ContextListCommand,
+    SearchSessionContextTool,
+    SessionContextIndexService,
     SessionContextModel,
     SessionContextService,
     WebCommand,
@@ -24,6 +27,7 @@ class KnowledgeServiceProvider(ServiceProvider):
     def services(self):
         return [
             # keep-sorted start
+            SessionContextIndexService,
             SessionContextService,
             # keep-sorted end
         ]
@@ -44,6 +48,7 @@ class KnowledgeServiceProvider(ServiceProvider):
         return [
             # keep-sorted start
             AddFilesToContextTool,
+            SearchSessionContextTool,
             # keep-sorted end
         ]
 
@@ -62,3 +67,9 @@ class KnowledgeServiceProvider(ServiceProvider):
             OrchestrationEvents.GatherProjectContext,
             session_context_service.add_session_context_hook,
         )
+
+        # Pick up edits made to session context files outside Byte
+        event_bus.on(
+            FileEvents.SessionContextChanged,
+            session_context_service.reload_context_hook,
+        )
@@ -0,0 +1,59 @@
+from typing import override
+
+from byte.knowledge import SessionContextService
+from byte.tools import BaseTool, ToolResult
+
+
+class SearchSessionContextTool(BaseTool):
+    name: str = "search_session_context_tool"
+    description: str = (
+        "Full-text search over the session context (scraped web pages, added files, and notes) "
+        "when only part of it was included in the prompt. Returns the best matching sections."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Keywords to search for, e.g. function names, config keys, or error messages.",
+            },
+            "keys": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Only search these session context keys. Omit to search everything.",
+            },
+        },
+        "required": ["query"],
+    }
+    harness_invocable = False
+    phase_exempt = True
+
+    @override
+    async def run(
+        self,
+        query: str,
+        keys: list[str] | None = None,
+        **kwargs,
+    ) -> ToolResult:
+        session_context_service = self.app.make(SessionContextService)
+        limit = self.app["config"].knowledge.retrieval.top_k
+        chunks = session_context_service.search_context(query, limit, keys=keys)
+
+        return ToolResult(
+            result={
+                "query": query,
+                "count": len(chunks),
+                "content": "\n\n".join(chunk.to_boundary() for chunk in chunks)
+                or f"No session context matches '{query}'.",
+            },
+        )
+
+    @classmethod
+    def format_tool_message(cls, result: ToolResult) -> str:
+        return result.result.get("content", "")
+
+    @classmethod
+    def format_tui_message(cls, result: ToolResult) -> str:
+        return (
+            f"Found {result.result.get('count', 0)} session context section(s) for `{result.result.get('query', '')}`."
+        )
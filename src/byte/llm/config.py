@@ -15,6 +15,59 @@ class LLMModelConfig(BaseModel):
     )
 
 
+class ContextBudgetConfig(BaseModel):
+    """Token budget applied to assembled prompts before they are sent to the model."""
+
+    enable: bool = Field(
+        default=True,
+        description="Shrink prompt context when it would exceed the model's input token limit",
+    )
+    reserve_ratio: float = Field(
+        default=0.1,
+        ge=0.0,
+        lt=1.0,
+        description="Fraction of the model's input token limit held back as headroom for tool schemas and estimation error",
+    )
+    shares: Dict[str, float] = Field(
+        default={"scratch": 0.35, "history": 0.2, "references": 0.2, "read_only_files": 0.25},
+        description="Relative share of the remaining budget for each evictable category (scratch, history, references, read_only_files). A category is only shrunk while it uses more than its share",
+    )
+    history_keep: int = Field(
+        default=6,
+        ge=0,
+        description="Number of most recent conversation messages kept verbatim when older history is summarized",
+    )
+
+
+class ScratchCompactionConfig(BaseModel):
+    """Compaction of older tool outputs in the scratch messages resent on every agent call."""
+
+    enable: bool = Field(
+        default=True,
+        description="Replace older tool outputs with short digests when building prompts. Full outputs stay retrievable by tool call id",
+    )
+    keep_recent: int = Field(
+        default=8,
+        ge=0,
+        description="Number of most recent tool outputs always sent verbatim",
+    )
+    min_tokens: int = Field(
+        default=300,
+        ge=0,
+        description="Tool outputs smaller than this many tokens are never compacted",
+    )
+    batch_size: int = Field(
+        default=4,
+        ge=1,
+        description="Older tool outputs are compacted in groups of this size so the prompt prefix, and the provider's prompt cache, only changes every few tool calls",
+    )
+    digest_chars: int = Field(
+        default=400,
+        ge=0,
+        description="Characters from the start of a compacted tool output kept in its digest",
+    )
+
+
 class LLMConfig(BaseModel):
     """LLM domain configuration with provider-specific settings."""
 
@@ -22,3 +75,5 @@ class LLMConfig(BaseModel):
     standard: LLMModelConfig = LLMModelConfig()
     reasoning: LLMModelConfig = LLMModelConfig()
     coding: LLMModelConfig = LLMModelConfig()
+    context_budget: ContextBudgetConfig = ContextBudgetConfig()
+    scratch_compaction: ScratchCompactionConfig = ScratchCompactionConfig()
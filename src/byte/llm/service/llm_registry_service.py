@@ -1,39 +1,72 @@
-from typing import Dict, Optional
+import hashlib
+from typing import Any, Dict, Optional
+
+import orjson
 
 from byte.llm import ModelConstraints, ModelSchema
 from byte.support import Service, Yaml
 
 
 class LLMRegistryService(Service):
-    """Central read-only registry for LLM models loaded from models_data.yaml."""
+    """Central read-only registry for LLM models loaded from models_data.yaml.
+
+    The parsed YAML is cached as JSON in `.byte/cache/llm_registry.json` keyed by
+    the YAML's SHA-256, so PyYAML only runs when models_data.yaml changes.
+    `ModelSchema` objects are built on first lookup rather than for every model.
+    Usage: `schema = registry.get_model("claude-sonnet-4-5")`
+    """
 
     def boot(self) -> None:
-        """Load LLM models from models_data.yaml on boot."""
+        """Load raw model data from the JSON cache, rebuilding it if models_data.yaml changed."""
+        self._raw_models: Dict[str, Dict[str, Any]] = self._load_raw_models()
+        self._models: Dict[str, ModelSchema] = {}
 
+    def _load_raw_models(self) -> Dict[str, Dict[str, Any]]:
+        """Return raw model data, preferring the cache when its hash matches the YAML."""
         models_data_path = self.app.app_path("llm/resources/models_data.yaml")
+        digest = hashlib.sha256(models_data_path.read_bytes()).hexdigest()
+
+        cache_path = self.app.cache_path("llm_registry.json")
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+            if cached.get("hash") == digest:
+                return cached["models"]
+        except OSError, orjson.JSONDecodeError, AttributeError, KeyError:
+            pass
+
         raw_models = Yaml.load_as_dict(models_data_path)
-        self._models: Dict[str, ModelSchema] = {}
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(orjson.dumps({"hash": digest, "models": raw_models}))
+        except OSError as e:
+            self.app["log"].warning(f"Could not write LLM registry cache: {e}")
 
-        for model_id, model_data in raw_models.items():
-            constraints = ModelConstraints(
-                max_input_tokens=model_data["limit"]["context"],
-                max_output_tokens=model_data["limit"]["output"],
-                input_cost_per_token=model_data["cost"]["input"],
-                cache_write_input_token_cost=model_data["cost"]["cache_write"],
-                cache_read_input_token_cost=model_data["cost"]["cache_read"],
-                output_cost_per_token=model_data["cost"]["output"],
-            )
-            model = ModelSchema(
-                model=model_id,
-                provider=model_data["provider"],
-                constraints=constraints,
-            )
-            self._models[model_id] = model
+        return raw_models
+
+    def _build_model(self, model_id: str, model_data: Dict[str, Any]) -> ModelSchema:
+        """Build a ModelSchema from a raw models_data.yaml entry."""
+        constraints = ModelConstraints(
+            max_input_tokens=model_data["limit"]["context"],
+            max_output_tokens=model_data["limit"]["output"],
+            input_cost_per_token=model_data["cost"]["input"],
+            cache_write_input_token_cost=model_data["cost"]["cache_write"],
+            cache_read_input_token_cost=model_data["cost"]["cache_read"],
+            output_cost_per_token=model_data["cost"]["output"],
+        )
+        return ModelSchema(
+            model=model_id,
+            provider=model_data["provider"],
+            constraints=constraints,
+        )
 
     def get_model(self, model_id: str) -> Optional[ModelSchema]:
         """Retrieve a registered model by ID."""
-        return self._models.get(model_id)
+        model = self._models.get(model_id)
+        if model is None and model_id in self._raw_models:
+            model = self._build_model(model_id, self._raw_models[model_id])
+            self._models[model_id] = model
+        return model
 
     def get_all_models(self) -> Dict[str, ModelSchema]:
         """Retrieve all registered models."""
-        return self._models.copy()
+        return {model_id: self.get_model(model_id) for model_id in self._raw_models}  # ty:ignore[invalid-return-type]
@@ -26,12 +26,14 @@ if TYPE_CHECKING:
     from byte.lsp.service.lsp_client import LSPClient
     from byte.lsp.service.lsp_service import LSPService
     from byte.lsp.service_provider import LSPServiceProvider
+    from byte.lsp.tools.batch_query import BatchQueryTool
     from byte.lsp.tools.find_references import FindReferencesTool
     from byte.lsp.tools.get_definition import GetDefinitionTool
     from byte.lsp.tools.get_hover_info import GetHoverInfoTool
 
 
 __all__ = (
+    "BatchQueryTool",
     "CompletionItem",
     "ContainerServerConfig",
     "CustomServerConfig",
@@ -57,6 +59,7 @@ __all__ = (
 
 _dynamic_imports = {
     # keep-sorted start
+    "BatchQueryTool": "tools.batch_query",
     "CompletionItem": "schemas",
     "ContainerServerConfig": "config",
     "CustomServerConfig": "config",
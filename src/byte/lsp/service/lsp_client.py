@@ -1,9 +1,10 @@
 import asyncio
-import json
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from byte.lsp import (
     CompletionItem,
     Diagnostic,
@@ -12,6 +13,8 @@ from byte.lsp import (
     LspServerState,
 )
 
+HEADER_TERMINATOR = b"\r\n\r\n"
+
 
 class LSPClient:
     """Client for communicating with a single LSP server process."""
@@ -34,10 +37,10 @@ class LSPClient:
 
     async def _write_message(self, message: Dict[str, Any]) -> None:
         """Write a JSON-RPC message to the server."""
-        content = json.dumps(message)
-        header = f"Content-Length: {len(content)}\r\n\r\n"
+        content = orjson.dumps(message)
+        header = f"Content-Length: {len(content)}\r\n\r\n".encode("ascii")
         if self.writer:
-            self.writer.write((header + content).encode("utf-8"))
+            self.writer.write(header + content)
             await self.writer.drain()
 
     async def _send_request(self, method: str, params: Dict[str, Any]) -> Optional[Any]:
@@ -66,7 +69,7 @@ class LSPClient:
         self.pending_requests[request_id] = future
 
         self.app["log"].debug(f"[LSP {self.name}] Sending request #{request_id}: {method}")
-        self.app["log"].debug(f"[LSP {self.name}] Request message: {message}")
+        self.app["log"].opt(lazy=True).trace("[LSP {}] Request message: {}", lambda: self.name, lambda: message)
         self.app["log"].debug(f"[LSP {self.name}] Pending requests: {list(self.pending_requests.keys())}")
 
         # Send request
@@ -173,53 +176,49 @@ class LSPClient:
             except Exception as e:
                 self.app["log"].error(f"[LSP {self.name}] Failed to parse diagnostics: {e}")
 
-    async def _read_message(self) -> Optional[Dict[str, Any]]:
-        """Read a single JSON-RPC message from the server."""
-        try:
-            # Read headers
-            headers = {}
-            while True:
-                if self.reader is None:
-                    self.app["log"].warning(f"[LSP {self.name}] Reader is None")
-                    return None
-                line = await self.reader.readline()
-                if not line:
-                    self.app["log"].warning(f"[LSP {self.name}] EOF while reading headers")
+    @staticmethod
+    def _parse_content_length(header_block: bytes) -> Optional[int]:
+        """Extract the Content-Length value from a raw JSON-RPC header block."""
+        for header in header_block.split(b"\r\n"):
+            key, sep, value = header.partition(b":")
+            if sep and key.strip().lower() == b"content-length":
+                try:
+                    return int(value.strip())
+                except ValueError:
                     return None
-                if line == b"\r\n":
-                    break
+        return None
+
+    async def _read_message(self) -> Optional[Dict[str, Any]]:
+        """Read a single JSON-RPC message from the server.
 
-                decoded = line.decode("utf-8").strip()
-                if ": " in decoded:
-                    key, value = decoded.split(": ", 1)
-                    headers[key] = value
+        Headers are consumed in one `readuntil` call and the body with a single
+        `readexactly`, so large payloads are never rebuilt chunk by chunk.
+        """
+        if self.reader is None:
+            self.app["log"].warning(f"[LSP {self.name}] Reader is None")
+            return None
 
-            # Read content
-            if "Content-Length" not in headers:
-                self.app["log"].warning(f"[LSP {self.name}] No Content-Length in headers: {headers}")
+        try:
+            try:
+                header_block = await self.reader.readuntil(HEADER_TERMINATOR)
+            except asyncio.IncompleteReadError:
+                self.app["log"].warning(f"[LSP {self.name}] EOF while reading headers")
                 return None
 
-            content_length = int(headers["Content-Length"])
-            self.app["log"].debug(f"[LSP {self.name}] Reading {content_length} bytes of content")
-
-            # Read content in chunks to ensure we get all of it
-            content = b""
-            remaining = content_length
-            while remaining > 0:
-                chunk = await self.reader.read(min(remaining, 4096))
-                if not chunk:
-                    self.app["log"].warning(
-                        f"[LSP {self.name}] EOF while reading content, got {len(content)}/{content_length} bytes"
-                    )
-                    return None
-                content += chunk
-                remaining -= len(chunk)
+            content_length = self._parse_content_length(header_block)
+            if content_length is None:
+                self.app["log"].warning(f"[LSP {self.name}] No Content-Length in headers: {header_block!r}")
+                return None
 
-            message = json.loads(content.decode("utf-8"))
-            self.app["log"].debug(
-                f"[LSP {self.name}] Parsed message type: {message.get('method', message.get('id', 'unknown'))}"
-            )
-            return message
+            try:
+                content = await self.reader.readexactly(content_length)
+            except asyncio.IncompleteReadError as e:
+                self.app["log"].warning(
+                    f"[LSP {self.name}] EOF while reading content, got {len(e.partial)}/{content_length} bytes"
+                )
+                return None
+
+            return orjson.loads(content)
 
         except Exception as e:
             self.app["log"].error(f"[LSP {self.name}] Error reading LSP message: {e}")
@@ -231,13 +230,14 @@ class LSPClient:
         self.app["log"].debug(f"[LSP {self.name}] Read loop started")
         try:
             while True:
-                self.app["log"].debug(f"[LSP {self.name}] Waiting for message...")
                 message = await self._read_message()
                 if message is None:
                     self.app["log"].warning(f"[LSP {self.name}] Read message returned None, stopping read loop")
                     break
 
-                self.app["log"].debug(f"[LSP {self.name}] Received message: {message}")
+                self.app["log"].opt(lazy=True).trace(
+                    "[LSP {}] Received message: {}", lambda: self.name, lambda: message
+                )
 
                 # Handle response
                 if "id" in message and message["id"] in self.pending_requests:
@@ -383,7 +383,7 @@ class LSPClient:
                 if self.process.returncode is None:
                     self.process.terminate()
                     await asyncio.wait_for(self.process.wait(), timeout=5.0)
-            except (ProcessLookupError, TimeoutError):
+            except ProcessLookupError, TimeoutError:
                 # Process already gone or timeout - try kill
                 try:
                     if self.process.returncode is None:
@@ -1,14 +1,8 @@
+from importlib import import_module
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type
 
-from lsp_client import Client, Position, PyreflyClient
-from lsp_client.clients.basedpyright import BasedpyrightClient
-from lsp_client.clients.deno import DenoClient
-from lsp_client.clients.gopls import GoplsClient
-from lsp_client.clients.pyright import PyrightClient
-from lsp_client.clients.rust_analyzer import RustAnalyzerClient
-from lsp_client.clients.ty import TyClient
-from lsp_client.clients.typescript import TypescriptClient
+from lsp_client import Client, Position
 from lsp_client.server import ContainerServer, LocalServer
 
 from byte import Service, TaskManager
@@ -25,16 +19,16 @@ from byte.lsp import (
 )
 from byte.support.utils import get_language_from_filename
 
-# Mapping of preset names to their client classes
-PRESET_CLIENTS: Dict[str, Type[Client]] = {
-    "pyright": PyrightClient,
-    "basedpyright": BasedpyrightClient,
-    "pyrefly": PyreflyClient,
-    "ty": TyClient,
-    "rust_analyzer": RustAnalyzerClient,
-    "deno": DenoClient,
-    "typescript": TypescriptClient,
-    "gopls": GoplsClient,
+# Mapping of preset names to their client classes, imported only when a preset is used
+PRESET_CLIENTS: Dict[str, str] = {
+    "pyright": "lsp_client.clients.pyright:PyrightClient",
+    "basedpyright": "lsp_client.clients.basedpyright:BasedpyrightClient",
+    "pyrefly": "lsp_client:PyreflyClient",
+    "ty": "lsp_client.clients.ty:TyClient",
+    "rust_analyzer": "lsp_client.clients.rust_analyzer:RustAnalyzerClient",
+    "deno": "lsp_client.clients.deno:DenoClient",
+    "typescript": "lsp_client.clients.typescript:TypescriptClient",
+    "gopls": "lsp_client.clients.gopls:GoplsClient",
 }
 
 # Mapping of preset names to their supported languages
@@ -73,7 +67,8 @@ class LSPService(Service):
 
     async def _create_preset_client(self, server_name: str, config: PresetServerConfig) -> Client:
         """Create a preset client from configuration."""
-        client_class = PRESET_CLIENTS[config.preset]
+        module_name, class_name = PRESET_CLIENTS[config.preset].split(":")
+        client_class: Type[Client] = getattr(import_module(module_name), class_name)
 
         # Get the default servers from the client class
         temp_client = client_class()
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Type
 
 from byte import Command, Service, ServiceProvider
-from byte.lsp import FindReferencesTool, GetDefinitionTool, GetHoverInfoTool, LSPService
 from byte.tools import BaseTool
 
 if TYPE_CHECKING:
@@ -16,17 +15,36 @@ class LSPServiceProvider(ServiceProvider):
     Registers LSP services for multi-language code intelligence features
     like hover information, references, definitions, and completions.
     Usage: Register with container to enable LSP functionality
+
+    Nothing is registered unless `lsp.enable` is set, so lsp_client is never
+    imported for users who do not use LSP.
     """
 
+    def enabled(self) -> bool:
+        """Return True if LSP is configured and enabled."""
+        lsp_config = getattr(self.app["config"], "lsp", None)
+        return lsp_config is not None and lsp_config.enable
+
     def tools(self) -> List[Type[BaseTool]]:
+        if not self.enabled():
+            return []
+
+        from byte.lsp import BatchQueryTool, FindReferencesTool, GetDefinitionTool, GetHoverInfoTool
+
         return [
             GetHoverInfoTool,
             GetDefinitionTool,
             FindReferencesTool,
+            BatchQueryTool,
         ]
 
     def services(self) -> List[Type[Service]]:
         """Return list of LSP services to register."""
+        if not self.enabled():
+            return []
+
+        from byte.lsp import LSPService
+
         return [LSPService]
 
     def commands(self) -> List[Type[Command]]:
@@ -35,7 +53,8 @@ class LSPServiceProvider(ServiceProvider):
 
     async def shutdown(self, app: Application) -> None:
         """Shutdown all LSP servers gracefully."""
-        config = self.app["config"]
-        if config.lsp.enable:
+        if self.enabled():
+            from byte.lsp import LSPService
+
             lsp_service = app.make(LSPService)
             await lsp_service.shutdown_all()
@@ -0,0 +1,149 @@
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, override
+
+from byte.lsp import HoverResult, Location, LSPService
+from byte.tools import BaseTool, ToolResult
+from byte.tools.exceptions import ToolValidationException
+
+LOCATION_OPERATIONS = ("definition", "declaration", "type_definition", "references")
+SUPPORTED_OPERATIONS = ("hover", *LOCATION_OPERATIONS)
+
+
+class BatchQueryTool(BaseTool):
+    name: str = "lsp_batch_query"
+    description: str = "Run several Language Server Protocol lookups (hover, definition, declaration, type_definition, references) in a single call. Queries are dispatched concurrently and every referenced source line is shown once, even when several queries point at it. Prefer this over repeated single-symbol LSP tools when inspecting multiple symbols."
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "description": "The lookups to perform",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "file_path": {
+                            "type": "string",
+                            "description": "The path to the file (relative or absolute)",
+                        },
+                        "line": {
+                            "type": "integer",
+                            "description": "The line number (one-based, as shown in editors)",
+                        },
+                        "character": {
+                            "type": "integer",
+                            "description": "The character position on the line (zero-based)",
+                        },
+                        "operation": {
+                            "type": "string",
+                            "enum": list(SUPPORTED_OPERATIONS),
+                            "description": "The lookup to perform at this position",
+                        },
+                    },
+                    "required": ["file_path", "line", "character", "operation"],
+                },
+            },
+        },
+        "required": ["queries"],
+    }
+
+    async def _run_query(self, lsp_service: LSPService, query: Dict[str, Any]) -> Any:
+        """Dispatch a single query through the LSP service."""
+        path_obj = Path(query["file_path"]).resolve()
+        if not path_obj.exists():
+            raise FileNotFoundError(f"File '{query['file_path']}' does not exist")
+
+        return await lsp_service.handle(
+            operation=query["operation"],
+            file_path=path_obj,
+            line=max(0, int(query["line"]) - 1),
+            character=int(query["character"]),
+        )
+
+    def _read_line(self, file_cache: Dict[str, List[str] | None], file_path: str, line: int) -> str | None:
+        """Read a single source line, caching each file's lines for the duration of the call."""
+        if file_path not in file_cache:
+            try:
+                file_cache[file_path] = Path(file_path).read_text(encoding="utf-8").splitlines()
+            except OSError, UnicodeDecodeError:
+                file_cache[file_path] = None
+
+        lines = file_cache[file_path]
+        if lines is None or line >= len(lines):
+            return None
+        return lines[line].strip()
+
+    @override
+    async def run(
+        self,
+        queries: List[Dict[str, Any]] = [],
+        **kwargs,
+    ) -> ToolResult:
+        if not queries:
+            raise ToolValidationException("At least one query is required.")
+
+        for index, query in enumerate(queries, start=1):
+            missing = [field for field in ("file_path", "line", "character", "operation") if field not in query]
+            if missing:
+                raise ToolValidationException(f"Query #{index} is missing: {', '.join(missing)}")
+            if query["operation"] not in SUPPORTED_OPERATIONS:
+                raise ToolValidationException(
+                    f"Query #{index} has unsupported operation '{query['operation']}'. "
+                    f"Use one of: {', '.join(SUPPORTED_OPERATIONS)}"
+                )
+
+        lsp_service = self.app.make(LSPService)
+        results = await asyncio.gather(
+            *(self._run_query(lsp_service, query) for query in queries),
+            return_exceptions=True,
+        )
+
+        # Each unique location is keyed by file and start position so that a symbol
+        # found by several queries (e.g. definition + references) is only listed once.
+        seen_locations: Dict[tuple[str, int, int], str] = {}
+        file_cache: Dict[str, List[str] | None] = {}
+        sections = []
+
+        for index, (query, result) in enumerate(zip(queries, results), start=1):
+            header = f"#{index} {query['operation']} {query['file_path']}:{query['line']}:{query['character']}"
+
+            if isinstance(result, BaseException):
+                sections.append(f"{header}\nError: {result!s}")
+                continue
+
+            if query["operation"] == "hover":
+                if isinstance(result, HoverResult) and result.contents:
+                    sections.append(f"{header}\n{result.contents}")
+                else:
+                    sections.append(f"{header}\nNo hover information available")
+                continue
+
+            locations: List[Location] = result or []
+            if not locations:
+                sections.append(f"{header}\nNo locations found")
+                continue
+
+            refs = []
+            for loc in locations:
+                file_path = loc.uri.removeprefix("file://")
+                key = (file_path, loc.range.start.line, loc.range.start.character)
+                ref = f"{file_path}:L{key[1] + 1}:C{key[2] + 1}"
+                if key not in seen_locations:
+                    seen_locations[key] = ref
+                if ref not in refs:
+                    refs.append(ref)
+
+            sections.append(f"{header}\n" + "\n".join(refs))
+
+        if seen_locations:
+            source_lines = []
+            for (file_path, line, _), ref in sorted(seen_locations.items()):
+                text = self._read_line(file_cache, file_path, line)
+                source_lines.append(f"{ref} | {text}" if text is not None else ref)
+            sections.append("Locations:\n" + "\n".join(source_lines))
+
+        return ToolResult(result={"content": "\n\n---\n\n".join(sections)})
+
+    @classmethod
+    def format_tool_message(cls, result: ToolResult) -> str:
+        return result.result.get("content", "")
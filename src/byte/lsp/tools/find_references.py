@@ -48,7 +48,7 @@ class FindReferencesTool(BaseTool):
             return ToolResult(result={"content": f"Error: File '{file_path}' does not exist"})
 
         try:
-            locations: List[Location] = await lsp_service.find_references(path_obj, line, character)
+            locations: List[Location] = await lsp_service.find_references(path_obj, max(0, line - 1), character)
 
             if not locations:
                 return ToolResult(result={"content": f"No references found at {file_path}:{line}:{character}"})
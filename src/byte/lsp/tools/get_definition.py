@@ -43,7 +43,7 @@ class GetDefinitionTool(BaseTool):
             return ToolResult(result={"content": f"Error: File '{file_path}' does not exist"})
 
         try:
-            locations: List[Location] = await lsp_service.goto_definition(path_obj, line, character)
+            locations: List[Location] = await lsp_service.goto_definition(path_obj, max(0, line - 1), character)
 
             if not locations:
                 return ToolResult(result={"content": f"No definition found at {file_path}:{line}:{character}"})
@@ -43,7 +43,7 @@ class GetHoverInfoTool(BaseTool):
             return ToolResult(result={"content": f"Error: File '{file_path}' does not exist"})
 
         try:
-            hover_result = await lsp_service.get_hover(path_obj, line, character)
+            hover_result = await lsp_service.get_hover(path_obj, max(0, line - 1), character)
 
             if hover_result:
                 return ToolResult(result={"content": hover_result.contents})
@@ -9,7 +9,7 @@ from langchain_core.runnables import Runnable
 from langgraph.graph.state import RunnableConfig
 from langgraph.types import Command
 
-from byte.analytics import LastMessageUsage, UsageMetrics
+from byte.analytics import LastMessageUsage, TokenCounterService, UsageMetrics
 from byte.development import RecordResponseService
 from byte.llm import LLMRegistryService, LLMService, ModelSchema
 from byte.node import (
@@ -22,6 +22,7 @@ from byte.orchestration import (
     PhaseModel,
     PhaseUtils,
     PromptAssembler,
+    RecallToolOutputTool,
 )
 from byte.support import Str
 from byte.tools import ToolRegistryService
@@ -137,6 +138,8 @@ class BaseAgentNode(BaseNode):
         if usage is None:
             return
 
+        self.app.make(TokenCounterService).calibrate(model_schema.provider, usage.get("input_tokens", 0))
+
         # Build a LastMessageUsage from the result
         last_usage = LastMessageUsage(
             input=usage.get("input_tokens", 0),
@@ -198,8 +201,11 @@ class BaseAgentNode(BaseNode):
 
         agent_state = await prompt_assembler.generate_messages()
 
-        scratch_messages = state.get("scratch_messages", [])
-        _, memory_percent = UsageMetrics.estimate_prompt_tokens(agent_state, scratch_messages)
+        scratch_messages = prompt_assembler.generate_scratch_state()
+        model_schema, _ = self.get_model()
+        token_counter = self.app.make(TokenCounterService)
+        prompt_tokens = token_counter.estimate_prompt(agent_state, scratch_messages, model_schema.provider)
+        memory_percent = UsageMetrics.memory_percent(prompt_tokens, model_schema.constraints.max_input_tokens)
 
         self.app.emit_tui(
             Messages.UpdateMemory(
@@ -245,6 +251,14 @@ class BaseAgentNode(BaseNode):
                     tool_schema = PhaseUtils.inject_phase_input_schema_args(tool.tool_schema())
                 tool_schemas.append(tool_schema)
 
+        # Compacted tool outputs point the model at the recall tool
+        if prompt_assembler.has_compacted_scratch():
+            tool_schemas.append(RecallToolOutputTool.tool_schema())
+
+        # Leaves that inject partial context bind the tools to fetch the rest
+        for tool_class in prompt_assembler.get_leaf_tools():
+            tool_schemas.append(tool_class.tool_schema())
+
         # Bind tool schemas to the model
         if tool_choice:
             model = model.bind_tools(tool_schemas, tool_choice=tool_choice)
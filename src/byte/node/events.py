@@ -22,3 +22,15 @@ class NodeEvents:
 
         state: dict
         config: RunnableConfig
+
+    @dataclass
+    class PreToolCalls(Event):
+        """Emitted before the tool node runs the tool calls of one assistant message."""
+
+        state: BaseState
+
+    @dataclass
+    class PostToolCalls(Event):
+        """Emitted after the tool node has run every tool call of one assistant message."""
+
+        state: BaseState
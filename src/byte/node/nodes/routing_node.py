@@ -32,7 +32,7 @@ class RoutingNode(BaseNode):
 
         # Check if the user has cancelled execution
         workflow_service = self.app.make(WorkflowService)
-        if workflow_service.cancel_event.is_set():
+        if workflow_service.current_run().cancelled:
             return Command(goto="end_node")
 
         # Check where we are in the workflow
@@ -1,8 +1,8 @@
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import Command
 
-from byte.node import BaseNode
-from byte.orchestration import BaseState, PhaseModel, PhaseUtils
+from byte.node import BaseNode, NodeEvents
+from byte.orchestration import BaseState, PhaseModel, PhaseUtils, WorkflowService
 from byte.support.utils import get_last_message
 from byte.tools import ToolMessage, ToolRegistryService
 from byte.tools.exceptions import ToolException, ToolNotFoundException
@@ -16,6 +16,7 @@ class ToolNode(BaseNode):
         **kwargs,
     ):
         self.tool_registry_service = self.app.make(ToolRegistryService)
+        self.workflow_service = self.app.make(WorkflowService)
 
     def _update_tui(self, tool_message: ToolMessage, tool_result: ToolResult | None = None) -> None:
 
@@ -30,6 +31,14 @@ class ToolNode(BaseNode):
                 content=content,
             )
         )
+        self.workflow_service.emit_delta(
+            {
+                "type": "tool_result",
+                "tool_id": str(tool_message.tool_call_id),
+                "status": tool_message.status,
+                "content": content,
+            }
+        )
 
     async def __call__(
         self,
@@ -48,64 +57,70 @@ class ToolNode(BaseNode):
             workflow_phases = state["workflow_phases"]
             current_phase = PhaseUtils.get_pending_phase(state)
 
-        # TODO: we should make this truly async with a gather
-        for tool_call in message.tool_calls:
-            try:
-                if is_workflow_agent and isinstance(current_phase, PhaseModel):
-                    allowed_tool_names = [str(t.name) for t in current_phase.tools]
-                    if tool_call["name"] not in allowed_tool_names:
-                        raise ToolException(
-                            f"Tool '{tool_call['name']}' is NOT allowed in the current phase. "
-                            f"Allowed tools: {', '.join(allowed_tool_names) if allowed_tool_names else 'none'}"
+        # Let services defer persistence until every tool call of this message has run
+        await self.emit(NodeEvents.PreToolCalls(state=state))
+        try:
+            # TODO: we should make this truly async with a gather
+            for tool_call in message.tool_calls:
+                try:
+                    tool = self.tool_registry_service.get_tool(tool_call["name"])
+
+                    if is_workflow_agent and isinstance(current_phase, PhaseModel) and not (tool and tool.phase_exempt):
+                        allowed_tool_names = [str(t.name) for t in current_phase.tools]
+                        if tool_call["name"] not in allowed_tool_names:
+                            raise ToolException(
+                                f"Tool '{tool_call['name']}' is NOT allowed in the current phase. "
+                                f"Allowed tools: {', '.join(allowed_tool_names) if allowed_tool_names else 'none'}"
+                            )
+
+                    if not tool:
+                        raise ToolNotFoundException(
+                            f"Error: Tool '{tool_call['name']}' is not available or does not exist."
                         )
 
-                tool = self.tool_registry_service.get_tool(tool_call["name"])
-                if not tool:
-                    raise ToolNotFoundException(
-                        f"Error: Tool '{tool_call['name']}' is not available or does not exist."
+                    tool_result = await tool.invoke(
+                        args=tool_call["args"],
+                        state=state,
+                        tool_call_id=tool_call["id"],
+                    )
+
+                    tool_message = ToolMessage(
+                        content=[
+                            {
+                                "type": "text",
+                                "text": tool.format_tool_message(tool_result),
+                            }
+                        ],
+                        name=tool_call["name"],
+                        tool_call_id=tool_call["id"],
                     )
 
-                tool_result = await tool.invoke(
-                    args=tool_call["args"],
-                    state=state,
-                    tool_call_id=tool_call["id"],
-                )
-
-                tool_message = ToolMessage(
-                    content=[
-                        {
-                            "type": "text",
-                            "text": tool.format_tool_message(tool_result),
-                        }
-                    ],
-                    name=tool_call["name"],
-                    tool_call_id=tool_call["id"],
-                )
-
-                # TODO: This prob needs to have a deep merge.
-                if tool_result.extra:
-                    merged_extra.update(tool_result.extra)
-
-                self._update_tui(tool_message, tool_result)
-                outputs.append(tool_message)
-
-                # If we are in a workflow we also need to update the state of the phase
-                if is_workflow_agent:
-                    workflow_phases = PhaseUtils.update_phase_with_tool_args(tool_call, workflow_phases)  # ty:ignore[invalid-argument-type]
-            except ToolException as err:
-                tool_message = ToolMessage(
-                    status="error",
-                    content=[
-                        {
-                            "type": "text",
-                            "text": str(err),
-                        }
-                    ],
-                    name=tool_call["name"],
-                    tool_call_id=tool_call["id"],
-                )
-                self._update_tui(tool_message)
-                outputs.append(tool_message)
+                    # TODO: This prob needs to have a deep merge.
+                    if tool_result.extra:
+                        merged_extra.update(tool_result.extra)
+
+                    self._update_tui(tool_message, tool_result)
+                    outputs.append(tool_message)
+
+                    # If we are in a workflow we also need to update the state of the phase
+                    if is_workflow_agent:
+                        workflow_phases = PhaseUtils.update_phase_with_tool_args(tool_call, workflow_phases)  # ty:ignore[invalid-argument-type]
+                except ToolException as err:
+                    tool_message = ToolMessage(
+                        status="error",
+                        content=[
+                            {
+                                "type": "text",
+                                "text": str(err),
+                            }
+                        ],
+                        name=tool_call["name"],
+                        tool_call_id=tool_call["id"],
+                    )
+                    self._update_tui(tool_message)
+                    outputs.append(tool_message)
+        finally:
+            await self.emit(NodeEvents.PostToolCalls(state=state))
 
         update = {"scratch_messages": outputs, "workflow_phases": workflow_phases, **merged_extra}
 
@@ -26,19 +26,22 @@ if TYPE_CHECKING:
         TokenUsageSchema,
     )
     from byte.orchestration.service_provider import OrchestrationServiceProvider
-    from byte.orchestration.services.workflow_service import WorkflowService
+    from byte.orchestration.services.workflow_service import WorkflowRun, WorkflowService
     from byte.orchestration.state import BaseState, RoutingState
     from byte.orchestration.tools.complete_simple_turn_tool import CompleteSimpleTurnTool
     from byte.orchestration.tools.complete_turn_tool import CompleteTurnTool
     from byte.orchestration.tools.create_analysis_tool import CreateAnalysisTool
     from byte.orchestration.tools.create_plan_tool import CreatePlanTool
+    from byte.orchestration.tools.recall_tool_output_tool import RecallToolOutputTool
     from byte.orchestration.tools.update_phase_tool import UpdatePhaseTool
     from byte.orchestration.tools.user_confirm_phase_tool import UserConfirmPhaseTool
+    from byte.orchestration.utils.context_budget import BudgetDecision, ContextBudget
     from byte.orchestration.utils.graph_builder import GraphBuilder
     from byte.orchestration.utils.harness_state_utils import HarnessStateUtils
     from byte.orchestration.utils.phase_utils import PhaseUtils
     from byte.orchestration.utils.prompt_assembler import PromptAssembler
     from byte.orchestration.utils.reducer import Reducer
+    from byte.orchestration.utils.scratch_compactor import ScratchCompactor
 
 
 __all__ = (
@@ -49,10 +52,12 @@ __all__ = (
     "AssistantContextSchema",
     "BaseState",
     "BaseWorkflow",
+    "BudgetDecision",
     "ByteAgentException",
     "CompleteSimpleTurnTool",
     "CompleteTurnTool",
     "ConstraintSchema",
+    "ContextBudget",
     "CreateAnalysisTool",
     "CreatePlanTool",
     "DummyNodeReachedException",
@@ -69,12 +74,15 @@ __all__ = (
     "PhaseUtils",
     "PromptAssembler",
     "PromptSettingsSchema",
+    "RecallToolOutputTool",
     "Reducer",
     "RoutePhaseModel",
     "RoutingState",
+    "ScratchCompactor",
     "TokenUsageSchema",
     "UpdatePhaseTool",
     "UserConfirmPhaseTool",
+    "WorkflowRun",
     "WorkflowService",
 )
 
@@ -88,10 +96,12 @@ _dynamic_imports = {
     "AssistantContextSchema": "schemas",
     "BaseState": "state",
     "BaseWorkflow": "base_workflow",
+    "BudgetDecision": "utils.context_budget",
     "ByteAgentException": "exceptions",
     "CompleteSimpleTurnTool": "tools.complete_simple_turn_tool",
     "CompleteTurnTool": "tools.complete_turn_tool",
     "ConstraintSchema": "schemas",
+    "ContextBudget": "utils.context_budget",
     "CreateAnalysisTool": "tools.create_analysis_tool",
     "CreatePlanTool": "tools.create_plan_tool",
     "DummyNodeReachedException": "exceptions",
@@ -108,12 +118,15 @@ _dynamic_imports = {
     "PhaseUtils": "utils.phase_utils",
     "PromptAssembler": "utils.prompt_assembler",
     "PromptSettingsSchema": "schemas",
+    "RecallToolOutputTool": "tools.recall_tool_output_tool",
     "Reducer": "utils.reducer",
     "RoutePhaseModel": "models.route_phase_model",
     "RoutingState": "state",
+    "ScratchCompactor": "utils.scratch_compactor",
     "TokenUsageSchema": "schemas",
     "UpdatePhaseTool": "tools.update_phase_tool",
     "UserConfirmPhaseTool": "tools.user_confirm_phase_tool",
+    "WorkflowRun": "services.workflow_service",
     "WorkflowService": "services.workflow_service",
     # keep-sorted end
 }
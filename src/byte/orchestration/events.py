@@ -23,6 +23,9 @@ class OrchestrationEvents:
         # TODO: Doc String here.
         """"""
 
+        user_request: str = ""
         conventions: list[str] = field(default_factory=list)
         session_docs: list[str] = field(default_factory=list)
         system_context: list[str] = field(default_factory=list)
+        # Tool classes the injected context refers to, bound for this prompt
+        tools: list[type] = field(default_factory=list)
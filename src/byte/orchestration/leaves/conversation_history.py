@@ -1,5 +1,8 @@
+import re
 from typing import TYPE_CHECKING
 
+from langchain_core.messages import BaseMessage
+
 from byte.orchestration import Leaf
 from byte.support import Boundary, BoundaryType, Section, SectionType
 from byte.support.utils import list_to_multiline_text
@@ -9,13 +12,20 @@ if TYPE_CHECKING:
 
 
 class ConversationHistory(Leaf):
+    category = "history"
+    eviction = "summarized"
+
+    # Characters of an older message kept in its one-line digest
+    DIGEST_CHARS: int = 160
+
     def __init__(self, has_section: bool = False):
         self.has_section = has_section
 
-    async def assemble(self, prompt_assembler: PromptAssembler) -> str:
+    def _messages(self, prompt_assembler: PromptAssembler) -> list[BaseMessage]:
         messages = prompt_assembler.get_state().get("history_messages", [])
-        messages = prompt_assembler.get_agent_node().filter_message_history(messages)  # ty:ignore[invalid-argument-type]
+        return prompt_assembler.get_agent_node().filter_message_history(messages)  # ty:ignore[invalid-argument-type]
 
+    def _render(self, message_texts: list[str]) -> str:
         # Create masked_messages list identical to messages except for processed AIMessages
 
         masked_messages = [
@@ -28,7 +38,7 @@ class ConversationHistory(Leaf):
             "```",
         ]
 
-        if not messages:
+        if not message_texts:
             masked_messages.extend(
                 [
                     "The conversation history is empty.",
@@ -38,8 +48,7 @@ class ConversationHistory(Leaf):
             )
             return list_to_multiline_text(masked_messages)
 
-        for message in messages:
-            masked_messages.append(message.text)
+        masked_messages.extend(message_texts)
 
         masked_messages.extend(
             [
@@ -51,3 +60,37 @@ class ConversationHistory(Leaf):
         )
 
         return list_to_multiline_text(masked_messages)
+
+    def _digest(self, message: BaseMessage) -> str:
+        """Reduce a message to its type and the start of its first line of content."""
+        content_lines = [
+            line.strip() for line in message.text.splitlines() if not re.fullmatch(r"\s*</?\w+[^>]*>\s*", line)
+        ]
+        first_line = next((line for line in content_lines if line), "")
+        if len(first_line) > self.DIGEST_CHARS:
+            first_line = first_line[: self.DIGEST_CHARS].rstrip() + "..."
+        return f"- {message.type}: {first_line}"
+
+    async def assemble(self, prompt_assembler: PromptAssembler) -> str:
+        return self._render([message.text for message in self._messages(prompt_assembler)])
+
+    async def shrink(self, prompt_assembler: PromptAssembler, content: str, max_tokens: int) -> str:
+        """Keep the most recent messages verbatim and reduce older ones to one-line digests."""
+        messages = self._messages(prompt_assembler)
+        keep = prompt_assembler.get_app()["config"].llm.context_budget.history_keep
+        split = max(len(messages) - keep, 0)
+
+        if split == 0:
+            return await super().shrink(prompt_assembler, content, max_tokens)
+
+        digests = [self._digest(message) for message in messages[:split]]
+        shrunk = self._render(
+            [
+                f"Earlier conversation, summarized to fit the context window ({split} messages):",
+                *digests,
+                "",
+                *(message.text for message in messages[split:]),
+            ]
+        )
+
+        return await super().shrink(prompt_assembler, shrunk, max_tokens)
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class FileContext(Leaf):
+    category = "files"
+
     def __init__(self, as_section: bool = True):
         self.as_section = as_section
 
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class HarnessWorkspaceFiles(Leaf):
+    category = "files"
+
     async def assemble(self, prompt_assembler: PromptAssembler) -> str:
         editable_files = HarnessStateUtils.get_editable_files(prompt_assembler.get_state())
         file_service = prompt_assembler.get_app().make(FileService)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import TYPE_CHECKING
 
 from byte.files import FileService
@@ -6,37 +7,62 @@ from byte.support import Section, SectionType
 from byte.support.utils import list_to_multiline_text
 
 if TYPE_CHECKING:
+    from byte.files import FileContext
     from byte.orchestration import PromptAssembler
 
 
 class HarnessWorkspaceReferenceFiles(Leaf):
     """Harness leaf that renders reference files for the workspace."""
 
-    async def assemble(self, prompt_assembler: PromptAssembler) -> str:
+    category = "read_only_files"
+    eviction = "outlined"
+
+    def _file_contexts(self, prompt_assembler: PromptAssembler) -> list[FileContext]:
         reference_files = HarnessStateUtils.get_reference_files(prompt_assembler.get_state())
         file_service = prompt_assembler.get_app().make(FileService)
+        return [ctx for ctx in (file_service.get_file_context(path) for path in reference_files) if ctx]
+
+    def _render(self, rendered_files: list[str]) -> str:
+        lines = [
+            Section.start(SectionType.PROJECT_REFERENCE),
+            "",
+            "Below are files for reference only. Any edits to these files will be rejected",
+            "",
+            "```",
+            *rendered_files,
+            "```",
+            Section.end(),
+        ]
+
+        return list_to_multiline_text(lines)
 
-        lines = []
+    async def assemble(self, prompt_assembler: PromptAssembler) -> str:
+        reference_files = HarnessStateUtils.get_reference_files(prompt_assembler.get_state())
 
         if not reference_files:
             return ""
 
-        lines.extend(
-            [
-                Section.start(SectionType.PROJECT_REFERENCE),
-                "",
-                "Below are files for reference only. Any edits to these files will be rejected",
-                "",
-                "```",
-            ]
-        )
+        return self._render([file_context.to_boundary() for file_context in self._file_contexts(prompt_assembler)])
 
-        for file_path in reference_files:
-            file_context = file_service.get_file_context(file_path)
-            if file_context:
-                lines.append(file_context.to_boundary())
+    async def shrink(self, prompt_assembler: PromptAssembler, content: str, max_tokens: int) -> str:
+        """Replace the largest reference files with outlines until the section fits in `max_tokens`."""
+        file_contexts = self._file_contexts(prompt_assembler)
+        rendered = [file_context.to_boundary() for file_context in file_contexts]
+        sizes = [prompt_assembler.count_tokens(text) for text in rendered]
+        overflow = prompt_assembler.count_tokens(content) - max_tokens
 
-        lines.append("```")
-        lines.append(Section.end())
+        for index in sorted(range(len(rendered)), key=lambda i: sizes[i], reverse=True):
+            if overflow <= 0:
+                break
 
-        return list_to_multiline_text(lines)
+            outline = await asyncio.to_thread(file_contexts[index].to_summary)
+            if outline is None:
+                continue
+
+            overflow -= sizes[index] - prompt_assembler.count_tokens(outline)
+            rendered[index] = outline
+
+        shrunk = self._render(rendered)
+        if overflow > 0:
+            return await super().shrink(prompt_assembler, shrunk, max_tokens)
+        return shrunk
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class HarnessWorkspaceReferenceMaterials(Leaf):
+    category = "references"
+
     async def assemble(self, prompt_assembler: PromptAssembler) -> str:
         harness = prompt_assembler.get_state().get("harness", {})
         reference_materials = harness.get("reference_materials")
@@ -1,10 +1,27 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from byte.orchestration import ContextBudget
+
 if TYPE_CHECKING:
     from byte.orchestration import PromptAssembler
 
 
 class Leaf(ABC):
+    # Budget category of the assembled text. Only categories listed in
+    # `ContextBudget.EVICTION_ORDER` are ever shrunk.
+    category: str = "instructions"
+
+    # Verb reported in budget decisions when this leaf is shrunk
+    eviction: str = "truncated"
+
     @abstractmethod
     async def assemble(self, prompt_assembler: PromptAssembler) -> str: ...
+
+    async def shrink(self, prompt_assembler: PromptAssembler, content: str, max_tokens: int) -> str:
+        """Reduce assembled content to roughly `max_tokens` when the prompt is over budget.
+
+        The default cuts the middle out of the content; leaves override this
+        with something that keeps more meaning, such as outlines or digests.
+        """
+        return ContextBudget.truncate(content, prompt_assembler.count_tokens(content), max_tokens)
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class ReferenceMaterials(Leaf):
+    category = "references"
+
     def boot(self, has_section: bool = False):
         self.has_section = has_section
 
@@ -24,7 +26,15 @@ class ReferenceMaterials(Leaf):
         Usage: `context_messages = await self._gather_project_context()`
         """
 
-        project_context = await prompt_assembler.emit(OrchestrationEvents.GatherProjectContext())
+        project_context = await prompt_assembler.emit(
+            OrchestrationEvents.GatherProjectContext(
+                user_request=prompt_assembler.get_state().get("user_request", ""),
+            )
+        )
+
+        # Context that was only partially injected brings along the tools to fetch the rest
+        for tool_class in project_context.tools:
+            prompt_assembler.add_tool(tool_class)
 
         # TODO: Add a descrption here.
         project_information_and_context = [
@@ -4,6 +4,7 @@ from byte.orchestration import (
     CompleteTurnTool,
     CreateAnalysisTool,
     CreatePlanTool,
+    RecallToolOutputTool,
     UpdatePhaseTool,
     UserConfirmPhaseTool,
     WorkflowService,
@@ -20,6 +21,7 @@ class OrchestrationServiceProvider(ServiceProvider):
             CompleteTurnTool,
             CreateAnalysisTool,
             CreatePlanTool,
+            RecallToolOutputTool,
             UpdatePhaseTool,
             UserConfirmPhaseTool,
             # keep-sorted end
@@ -1,5 +1,8 @@
 import threading
-from typing import Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
 
 from langchain.messages import AIMessageChunk
 from langchain_core.callbacks import get_usage_metadata_callback
@@ -7,20 +10,86 @@ from langchain_core.callbacks import get_usage_metadata_callback
 from byte import Service
 from byte.analytics import AgentAnalyticsService
 from byte.orchestration import BaseWorkflow, TokenUsageSchema
-from byte.tui import Messages, Status
+from byte.tui import Messages, Status, StreamCoalescerService
 
 
-class WorkflowService(Service):
-    """Service for executing workflows with compiled graphs."""
+@dataclass
+class WorkflowRun:
+    """Cancel flag and open stream blocks of one agent run, shared by every workflow it executes."""
 
-    def boot(self) -> None:
-        """Initialize workflow service with cancel event."""
-        self.cancel_event = threading.Event()
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    message_chunks: dict[int, dict[str, Any]] = field(default_factory=dict)
 
     def cancel(self) -> None:
-        """Signal the current workflow execution to stop."""
+        """Ask the run to stop at its next routing step."""
         self.cancel_event.set()
 
+    @property
+    def cancelled(self) -> bool:
+        """Whether a cancel was requested for this run."""
+        return self.cancel_event.is_set()
+
+
+# Consumer of compact stream deltas (text, tool calls, usage) for the run in the current context,
+# e.g. a gateway agent run. `asyncio.to_thread` copies the context, so it follows the run onto its worker thread.
+_delta_sink: ContextVar[Callable[[dict[str, Any]], None] | None] = ContextVar("workflow_delta_sink", default=None)
+
+# The run started by `begin_run` in the current context; it follows the run onto its worker thread the same way.
+_current_run: ContextVar[WorkflowRun | None] = ContextVar("workflow_run", default=None)
+
+
+class WorkflowService(Service):
+    """Service for executing workflows with compiled graphs."""
+
+    def boot(self) -> None:
+        """Initialize workflow service with the stream coalescer and run lock."""
+        self.stream_coalescer = self.app.make(StreamCoalescerService)
+        # Held for the whole of a TUI or gateway agent run; both render through the same stream coalescer,
+        # so only one run executes at a time.
+        self.run_lock = threading.Lock()
+
+    @contextmanager
+    def stream_deltas(self, sink: Callable[[dict[str, Any]], None]) -> Iterator[None]:
+        """Send the stream deltas of runs started inside the block to `sink`.
+
+        Usage: `with workflow_service.stream_deltas(send): await asyncio.to_thread(asyncio.run, run())`
+        """
+        token = _delta_sink.set(sink)
+        try:
+            yield
+        finally:
+            _delta_sink.reset(token)
+
+    def emit_delta(self, delta: dict[str, Any]) -> None:
+        """Forward a compact stream delta to the delta sink of the current run, if any.
+
+        Usage: `workflow_service.emit_delta({"type": "text", "text": "Hel"})`
+        """
+        sink = _delta_sink.get()
+        if sink is not None:
+            sink(delta)
+
+    def begin_run(self) -> WorkflowRun:
+        """Start a run in the current context and return it so the caller can cancel it.
+
+        Called when a run is accepted rather than when its workflow starts, so a
+        cancel that arrives while the command is still preparing is not lost.
+        Usage: `run = workflow_service.begin_run()` -> before dispatching the command, later `run.cancel()`
+        """
+        run = WorkflowRun()
+        _current_run.set(run)
+        return run
+
+    def current_run(self) -> WorkflowRun:
+        """Return the run of the current context, starting one if the caller did not.
+
+        Usage: `if workflow_service.current_run().cancelled: ...`
+        """
+        run = _current_run.get()
+        if run is None:
+            run = self.begin_run()
+        return run
+
     def _is_tool_call_chunk(self, block: dict) -> bool:
         """Check if block is a tool call chunk."""
         return block.get("type") == ("input_json_delta")
@@ -53,6 +122,8 @@ class WorkflowService(Service):
     async def _handle_stream_event(self, chunk: dict[str, Any] | Any) -> dict[str, Any] | Any:
         """Handle individual stream events for display and final message extraction."""
 
+        run = self.current_run()
+
         if chunk["type"] == "messages":
             message_chunk, metadata = chunk["data"]
             if isinstance(message_chunk, AIMessageChunk):
@@ -61,62 +132,67 @@ class WorkflowService(Service):
 
                 # Handle agents that dont have tools. they respond with just string content.
                 if isinstance(message_chunk.content, str):
-                    self.emit_tui(
+                    self.stream_coalescer.push(
                         Messages.Response(
                             status=Status.RUNNING,
                             with_indicator=False,
                             chunk=message_chunk.content,
                         )
                     )
+                    if message_chunk.content:
+                        self.emit_delta({"type": "text", "text": message_chunk.content})
                 else:
                     for block in message_chunk.content:
                         if isinstance(block, dict):
                             # First we try and complete any open streams.
-                            for idx, tracked in self.message_chunks.items():
+                            for idx, tracked in run.message_chunks.items():
                                 if idx != block["index"] and tracked["completed"] == False:
-                                    self.message_chunks[idx]["completed"] = True
+                                    run.message_chunks[idx]["completed"] = True
 
                                     if tracked["type"] == "text":
-                                        self.emit_tui(Messages.Response(status=Status.SUCCESS))
+                                        self.stream_coalescer.push(Messages.Response(status=Status.SUCCESS))
 
                                     elif tracked["type"] == "tool_use" and "id" in tracked:
-                                        self.emit_tui(
+                                        self.stream_coalescer.push(
                                             Messages.ToolResponse(
-                                                tool_id=self.message_chunks[idx]["id"],
+                                                tool_id=run.message_chunks[idx]["id"],
                                                 status=Status.SUCCESS,
                                             )
                                         )
 
                             # Next start a new stream if needed
-                            if not self.message_chunks.get(block["index"]):
-                                self.message_chunks[block["index"]] = {
+                            if not run.message_chunks.get(block["index"]):
+                                run.message_chunks[block["index"]] = {
                                     "completed": False,
                                     "type": block.get("type"),
                                 }
 
                                 if block.get("type") == "text":
-                                    self.emit_tui(
+                                    self.stream_coalescer.push(
                                         Messages.Response(status=Status.PENDING, chunk=metadata.get("langgraph_node"))
                                     )
 
                                 elif block.get("type") == "tool_use":
-                                    self.message_chunks[block["index"]]["id"] = block.get("id")
-                                    self.message_chunks[block["index"]]["name"] = block.get("name")
-                                    self.emit_tui(
+                                    run.message_chunks[block["index"]]["id"] = block.get("id")
+                                    run.message_chunks[block["index"]]["name"] = block.get("name")
+                                    self.stream_coalescer.push(
                                         Messages.ToolResponse(
                                             status=Status.PENDING,
                                             tool_name=block.get("name"),
                                             tool_id=block.get("id"),
                                         )
                                     )
+                                    self.emit_delta(
+                                        {"type": "tool_start", "tool_id": block.get("id"), "name": block.get("name")}
+                                    )
 
                             if self._is_starting_tool_call_chunk(block):
                                 pass
 
                             if self._is_tool_call_chunk(block):
-                                tracked = self.message_chunks.get(block["index"], {})
+                                tracked = run.message_chunks.get(block["index"], {})
                                 if "id" in tracked:
-                                    self.emit_tui(
+                                    self.stream_coalescer.push(
                                         Messages.ToolResponse(
                                             status=Status.RUNNING,
                                             tool_id=tracked["id"],
@@ -124,31 +200,41 @@ class WorkflowService(Service):
                                             chunk=block.get("partial_json", ""),
                                         )
                                     )
+                                    if block.get("partial_json"):
+                                        self.emit_delta(
+                                            {
+                                                "type": "tool_args",
+                                                "tool_id": tracked["id"],
+                                                "args": block["partial_json"],
+                                            }
+                                        )
 
                             elif self._is_message_content_chunk(block):
-                                self.emit_tui(
+                                self.stream_coalescer.push(
                                     Messages.Response(
                                         status=Status.RUNNING,
                                         with_indicator=False,
                                         chunk=block.get("text", ""),
                                     )
                                 )
+                                if block.get("text"):
+                                    self.emit_delta({"type": "text", "text": block["text"]})
 
         elif chunk["type"] == "tasks":
             # Close any open streams when we switch tasks
-            for idx, tracked in self.message_chunks.items():
-                self.message_chunks[idx]["completed"] = True
+            for idx, tracked in run.message_chunks.items():
+                run.message_chunks[idx]["completed"] = True
                 if tracked["completed"] == False:
                     if tracked["type"] == "text":
-                        self.emit_tui(Messages.Response(status=Status.SUCCESS))
+                        self.stream_coalescer.push(Messages.Response(status=Status.SUCCESS))
 
                     elif tracked["type"] == "tool_use" and "id" in tracked:
-                        self.emit_tui(
-                            Messages.ToolResponse(tool_id=self.message_chunks[idx]["id"], status=Status.SUCCESS)
+                        self.stream_coalescer.push(
+                            Messages.ToolResponse(tool_id=run.message_chunks[idx]["id"], status=Status.SUCCESS)
                         )
 
             # Reset message_chunks betwean tasks
-            self.message_chunks = {}
+            run.message_chunks = {}
 
         return chunk
 
@@ -163,24 +249,30 @@ class WorkflowService(Service):
 
         processed_event = None
 
-        # Reset Message chunks and our cancel Listener
-        self.message_chunks = {}
-        self.cancel_event = threading.Event()
+        # Reset message chunks; a cancel requested since `begin_run` still applies
+        self.current_run().message_chunks = {}
 
         self.emit_tui(Messages.CreateHeading(workflow.human_name, "text-primary"))
 
         with get_usage_metadata_callback() as usage_metadata_callback:
-            async for chunk in graph.astream(
-                input=initial_state,
-                config=config,
-                stream_mode=["messages", "tasks"],
-                version="v2",
-                subgraphs=True,
-            ):
-                processed_event = await self._handle_stream_event(chunk)
+            try:
+                async for chunk in graph.astream(
+                    input=initial_state,
+                    config=config,
+                    stream_mode=["messages", "tasks"],
+                    version="v2",
+                    subgraphs=True,
+                ):
+                    processed_event = await self._handle_stream_event(chunk)
+            finally:
+                # Make sure no buffered frames are left behind when the stream ends or fails.
+                self.stream_coalescer.flush()
+                self.app["log"].debug(f"Stream coalescer frames: {self.stream_coalescer.stats()}")
 
             # await event_bus.emit(Events.TextualMessageReceived(Messages.AgentResponseComplete()))
 
             await self._track_token_usage(usage_metadata_callback.usage_metadata)
+            if usage_metadata_callback.usage_metadata:
+                self.emit_delta({"type": "usage", "models": dict(usage_metadata_callback.usage_metadata)})
 
         return processed_event
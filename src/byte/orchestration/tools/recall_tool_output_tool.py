@@ -0,0 +1,54 @@
+from typing import override
+
+from byte.orchestration import ScratchCompactor
+from byte.tools import BaseTool, ToolResult
+from byte.tools.exceptions import ToolValidationException
+
+
+class RecallToolOutputTool(BaseTool):
+    name: str = "recall_tool_output_tool"
+    description: str = (
+        "Retrieve the full output of an earlier tool call that was compacted to a digest to save context."
+    )
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "tool_call_id": {
+                "type": "string",
+                "description": "The tool_call_id shown in the compacted output's header.",
+            },
+        },
+        "required": ["tool_call_id"],
+    }
+    harness_invocable = False
+    phase_exempt = True
+
+    @override
+    async def run(
+        self,
+        tool_call_id: str,
+        **kwargs,
+    ) -> ToolResult:
+        state = kwargs.get("state") or {}
+
+        message = ScratchCompactor.find_original(state.get("scratch_messages", []), tool_call_id)
+        if message is None:
+            raise ToolValidationException(f"No tool output with tool_call_id '{tool_call_id}' in this turn.")
+
+        return ToolResult(
+            result={
+                "tool_call_id": tool_call_id,
+                "name": message.name,
+                "content": message.text,
+            },
+        )
+
+    @classmethod
+    def format_tool_message(cls, result: ToolResult) -> str:
+        content = result.result.get("content", "")
+        return content
+
+    @classmethod
+    def format_tui_message(cls, result: ToolResult) -> str:
+        name = result.result.get("name", "")
+        return f"Recalled full output of `{name}`."
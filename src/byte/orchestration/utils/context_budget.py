@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class BudgetDecision:
+    """A single eviction applied to fit an assembled prompt into its token budget."""
+
+    category: str
+    action: str
+    source: str
+    tokens_before: int
+    tokens_after: int
+
+    def __str__(self) -> str:
+        return f"{self.category}: {self.action} {self.source} ({self.tokens_before:,} -> {self.tokens_after:,} tokens)"
+
+
+class ContextBudget:
+    """Split a prompt token limit across leaf categories and decide which ones must shrink.
+
+    Categories outside `EVICTION_ORDER` (instructions, editable files, the user
+    request) are fixed. Whatever the fixed categories leave is divided between
+    the evictable categories by their configured shares. When the prompt is over
+    the limit, categories are shrunk in `EVICTION_ORDER`, each only while it uses
+    more than its share, and only as far as needed to remove the overflow.
+    Usage: `targets = ContextBudget(180000, config.shares).plan({"instructions": 9000, "history": 200000})`
+    """
+
+    # Cheapest context to lose comes first: stale tool output, then old history,
+    # then reference material, then read-only files.
+    EVICTION_ORDER: tuple[str, ...] = ("scratch", "history", "references", "read_only_files")
+
+    def __init__(self, limit: int, shares: Dict[str, float]):
+        self.limit = limit
+        self.shares = {category: max(shares.get(category, 0.0), 0.0) for category in self.EVICTION_ORDER}
+
+    def allowances(self, usage: Dict[str, int]) -> Dict[str, int]:
+        """Return the token allowance of each evictable category given the current usage."""
+        fixed = sum(tokens for category, tokens in usage.items() if category not in self.EVICTION_ORDER)
+        available = max(self.limit - fixed, 0)
+        total_share = sum(self.shares.values()) or 1.0
+        return {category: int(available * share / total_share) for category, share in self.shares.items()}
+
+    def plan(self, usage: Dict[str, int]) -> Dict[str, int]:
+        """Return the target token count for each category that has to shrink.
+
+        An empty dict means the prompt already fits within the limit.
+        Usage: `budget.plan({"instructions": 4000, "scratch": 90000})` -> `{"scratch": 60000}`
+        """
+        overflow = sum(usage.values()) - self.limit
+        if overflow <= 0:
+            return {}
+
+        allowances = self.allowances(usage)
+        targets: Dict[str, int] = {}
+        for category in self.EVICTION_ORDER:
+            if overflow <= 0:
+                break
+
+            used = usage.get(category, 0)
+            if used <= allowances[category]:
+                continue
+
+            target = max(allowances[category], used - overflow)
+            targets[category] = target
+            overflow -= used - target
+
+        return targets
+
+    @staticmethod
+    def truncate(text: str, tokens: int, max_tokens: int) -> str:
+        """Cut the middle out of text so roughly `max_tokens` of its `tokens` remain.
+
+        The head keeps two thirds of the kept text and the tail one third, since
+        tool output and documents usually carry their most useful lines at the
+        start with errors and summaries at the end.
+        Usage: `ContextBudget.truncate(output, 8000, 500)`
+        """
+        if tokens <= max_tokens or not text:
+            return text
+
+        keep_chars = max(len(text) * max_tokens // tokens, 0)
+        head = keep_chars * 2 // 3
+        tail = keep_chars - head
+        marker = f"\n... [{tokens - max_tokens:,} tokens truncated to fit the context window] ...\n"
+        return text[:head] + marker + (text[-tail:] if tail else "")
@@ -2,11 +2,20 @@ import asyncio
 import re
 from typing import TYPE_CHECKING, List, Type, TypeVar
 
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, ToolMessage
 
+from byte.analytics import TokenCounterService
 from byte.llm import ModelSchema
-from byte.orchestration import Leaf, PhaseModel, PhaseUtils
-from byte.support.mixins import Bootable, Eventable
+from byte.orchestration import (
+    BudgetDecision,
+    ContextBudget,
+    Leaf,
+    PhaseModel,
+    PhaseUtils,
+    RecallToolOutputTool,
+    ScratchCompactor,
+)
+from byte.support.mixins import Bootable, Notifiable
 from byte.support.utils import list_to_multiline_text
 from byte.tools.service.tool_registry_service import ToolRegistryService
 
@@ -19,8 +28,17 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
-class PromptAssembler(Bootable, Eventable):
-    """Assemble prompts from templates by gathering context from various services."""
+class PromptAssembler(Bootable, Notifiable):
+    """Assemble prompts from templates by gathering context from various services.
+
+    Assembled context is held to the model's input token limit: when leaves and
+    scratch messages would exceed it, evictable categories are shrunk according
+    to `ContextBudget` and each eviction is logged, reported to the user, and
+    kept in `get_budget_decisions()`.
+    """
+
+    # Tokens an older tool output is never truncated below
+    TOOL_OUTPUT_FLOOR: int = 200
 
     def boot(self, agent_node: BaseAgentNode | None, state: BaseState, extra: dict | None = None, **kwargs) -> None:
 
@@ -46,8 +64,12 @@ class PromptAssembler(Bootable, Eventable):
         self.model_schema = model_schema
 
         self.prompt_state = state
+        self.scratch_messages: list[BaseMessage] = state.get("scratch_messages", [])
+        self.compacted_tool_outputs = 0
+        self.leaf_tools: list[Type[BaseTool]] = []
 
         self.assembled_state = {}
+        self.budget_decisions: list[BudgetDecision] = []
 
         # TODO: this needs to be done better.
         self.merged_state = {**state, **extra}
@@ -72,6 +94,33 @@ class PromptAssembler(Bootable, Eventable):
         """Retrieve the assembled prompt state."""
         return self.assembled_state
 
+    def get_budget_decisions(self) -> list[BudgetDecision]:
+        """Retrieve the evictions applied while fitting the prompt into the context window."""
+        return self.budget_decisions
+
+    def has_compacted_scratch(self) -> bool:
+        """Whether any tool outputs were replaced with digests, making the recall tool necessary."""
+        return self.compacted_tool_outputs > 0
+
+    def add_tool(self, tool_class: Type[BaseTool]) -> None:
+        """Bind an extra tool for this prompt, for leaves whose content refers to it.
+
+        Usage: `prompt_assembler.add_tool(SearchSessionContextTool)`
+        """
+        if tool_class not in self.leaf_tools:
+            self.leaf_tools.append(tool_class)
+
+    def get_leaf_tools(self) -> List[Type[BaseTool]]:
+        """Retrieve the tools added by leaves during assembly."""
+        return self.leaf_tools
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text for the provider of this assembler's model.
+
+        Usage: `tokens = prompt_assembler.count_tokens(file_context.to_boundary())`
+        """
+        return self.app.make(TokenCounterService).count(text, self.model_schema.provider)
+
     def get_tools(self) -> List[Type[BaseTool]]:
         """Collect tools from the phase and agent node."""
         tool_schemas = []
@@ -92,10 +141,19 @@ class PromptAssembler(Bootable, Eventable):
         if agent_tools:
             tool_schemas.extend(agent_tools)
 
+        # Compacted tool outputs reference the recall tool, so it must be callable
+        if self.has_compacted_scratch():
+            tool_schemas.append(tool_registry_service.get_tool(RecallToolOutputTool.name))
+
+        for tool_class in self.leaf_tools:
+            tool_schemas.append(tool_registry_service.get_tool(tool_class.name))
+
         return tool_schemas
 
     async def generate_messages(self) -> dict:
         """Assemble system, user, and context messages from templates and leaves."""
+        self.compact_scratch()
+
         templates = {
             "system_message": self.agent_node.get_system_template(),
             "user_message": self.agent_node.get_user_template(),
@@ -112,6 +170,7 @@ class PromptAssembler(Bootable, Eventable):
 
         # Gather all leaf assemblies concurrently
         assembled = await asyncio.gather(*(leaf.assemble(self) for _, _, leaf in leaf_tasks))
+        assembled = await self.apply_budget(templates, [leaf for _, _, leaf in leaf_tasks], list(assembled))
 
         # Build mutable copies of each template with leaves replaced by their assembled strings
         built: dict[str, list[str]] = {key: list(template) for key, template in templates.items()}
@@ -131,6 +190,131 @@ class PromptAssembler(Bootable, Eventable):
 
         return self.assembled_state
 
+    def compact_scratch(self) -> None:
+        """Replace older tool outputs in scratch with digests, as configured in `llm.scratch_compaction`."""
+        compactor = ScratchCompactor(self.app["config"].llm.scratch_compaction, self.count_tokens)
+        self.scratch_messages, self.compacted_tool_outputs = compactor.compact(self.scratch_messages)
+
+        if self.compacted_tool_outputs:
+            self.app["log"].debug(f"Compacted {self.compacted_tool_outputs} older tool outputs in scratch")
+
+    async def apply_budget(self, templates: dict, leaves: list[Leaf], assembled: list[str]) -> list[str]:
+        """Shrink assembled leaves and scratch messages until the prompt fits the model's context window.
+
+        Token usage is measured per leaf category, with template text counted as
+        instructions, and `ContextBudget.plan()` decides which categories shrink
+        and to what size. Leaves in a category share its target in proportion to
+        their size. Returns the assembled leaf strings, shrunk where needed.
+        """
+        config = self.app["config"].llm.context_budget
+        max_input_tokens = self.model_schema.constraints.max_input_tokens
+        if not config.enable or max_input_tokens <= 0:
+            return assembled
+
+        leaf_tokens = [self.count_tokens(text) for text in assembled]
+        scratch_tokens = [self.count_tokens(message.text) for message in self.scratch_messages]
+
+        usage: dict[str, int] = {"scratch": sum(scratch_tokens)}
+        for leaf, tokens in zip(leaves, leaf_tokens):
+            usage[leaf.category] = usage.get(leaf.category, 0) + tokens
+        usage["instructions"] = usage.get("instructions", 0) + sum(
+            self.count_tokens(self.assemble_message([line for line in template if isinstance(line, str)]))
+            for template in templates.values()
+        )
+
+        budget = ContextBudget(int(max_input_tokens * (1 - config.reserve_ratio)), config.shares)
+        targets = budget.plan(usage)
+        if not targets:
+            return assembled
+
+        for category, target in targets.items():
+            if category == "scratch":
+                self.shrink_scratch(scratch_tokens, target)
+                continue
+
+            for index, leaf in enumerate(leaves):
+                if leaf.category != category or leaf_tokens[index] == 0:
+                    continue
+
+                leaf_target = target * leaf_tokens[index] // usage[category]
+                assembled[index] = await leaf.shrink(self, assembled[index], leaf_target)
+                self.budget_decisions.append(
+                    BudgetDecision(
+                        category=category,
+                        action=leaf.eviction,
+                        source=type(leaf).__name__,
+                        tokens_before=leaf_tokens[index],
+                        tokens_after=self.count_tokens(assembled[index]),
+                    )
+                )
+
+        for decision in self.budget_decisions:
+            self.app["log"].info(f"Context budget ({self.model_schema.model}): {decision}")
+
+        remaining = sum(usage.values()) - sum(d.tokens_before - d.tokens_after for d in self.budget_decisions)
+        if remaining > budget.limit:
+            self.app["log"].warning(
+                f"Context budget ({self.model_schema.model}): prompt still uses {remaining:,} of {budget.limit:,} tokens after eviction"
+            )
+
+        if self.budget_decisions:
+            summary = ", ".join(f"{d.category} {d.action}" for d in self.budget_decisions)
+            await self.notify_warning(f"Context trimmed to fit {self.model_schema.model}: {summary}")
+
+        return assembled
+
+    def shrink_scratch(self, scratch_tokens: list[int], max_tokens: int) -> None:
+        """Truncate older tool outputs, oldest first, until scratch fits in `max_tokens`.
+
+        The most recent tool output is left intact since the model is usually
+        acting on it, and no message is dropped so tool calls stay paired with
+        their results.
+        """
+        last_tool_idx = next(
+            (
+                len(self.scratch_messages) - 1 - i
+                for i, m in enumerate(reversed(self.scratch_messages))
+                if isinstance(m, ToolMessage)
+            ),
+            None,
+        )
+
+        overflow = sum(scratch_tokens) - max_tokens
+        scratch = list(self.scratch_messages)
+        truncated = 0
+
+        for i, message in enumerate(scratch):
+            if overflow <= 0:
+                break
+            if not isinstance(message, ToolMessage) or i == last_tool_idx:
+                continue
+            if scratch_tokens[i] <= self.TOOL_OUTPUT_FLOOR:
+                continue
+
+            target = max(self.TOOL_OUTPUT_FLOOR, scratch_tokens[i] - overflow)
+            scratch[i] = ToolMessage(
+                content=ContextBudget.truncate(message.text, scratch_tokens[i], target),
+                tool_call_id=message.tool_call_id,
+                name=message.name,
+                status=message.status,
+            )
+            overflow -= scratch_tokens[i] - target
+            truncated += 1
+
+        if truncated == 0:
+            return
+
+        self.scratch_messages = scratch
+        self.budget_decisions.append(
+            BudgetDecision(
+                category="scratch",
+                action="truncated",
+                source=f"{truncated} tool outputs",
+                tokens_before=sum(scratch_tokens),
+                tokens_after=sum(self.count_tokens(message.text) for message in scratch),
+            )
+        )
+
     def assemble_message(self, template: list[str]) -> str:
         """Replace placeholder tokens in template with values from state."""
 
@@ -154,6 +338,6 @@ class PromptAssembler(Bootable, Eventable):
         return list_to_multiline_text(result_lines)
 
     def generate_scratch_state(self) -> list[BaseMessage]:
-        """Retrieve scratch messages from the current state."""
+        """Retrieve scratch messages from the current state, with any budget truncation applied."""
 
-        return self.prompt_state.get("scratch_messages", [])
+        return self.scratch_messages
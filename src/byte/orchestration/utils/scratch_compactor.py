@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING, Callable, Optional
+
+from langchain_core.messages import BaseMessage, ToolMessage
+
+if TYPE_CHECKING:
+    from byte.llm.config import ScratchCompactionConfig
+
+
+class ScratchCompactor:
+    """Replace older tool outputs in scratch messages with short digests.
+
+    The most recent `keep_recent` tool outputs stay verbatim. Older outputs of at
+    least `min_tokens` become a digest naming the tool, its size and its
+    `tool_call_id`, followed by the start of the output. Outputs are compacted in
+    groups of `batch_size`, so the prompt prefix only changes every few tool calls
+    and provider prompt caches stay warm in between.
+
+    Compaction only changes the messages sent to the model; the originals stay in
+    graph state, where `find_original()` (and `RecallToolOutputTool`) look them up.
+    Usage: `messages, compacted = ScratchCompactor(config, count_tokens).compact(scratch_messages)`
+    """
+
+    def __init__(self, config: ScratchCompactionConfig, count_tokens: Callable[[str], int]):
+        self.config = config
+        self.count_tokens = count_tokens
+
+    def compact(self, messages: list[BaseMessage]) -> tuple[list[BaseMessage], int]:
+        """Return the scratch messages with older tool outputs digested, and how many were digested."""
+        if not self.config.enable:
+            return messages, 0
+
+        tool_messages = [(i, message) for i, message in enumerate(messages) if isinstance(message, ToolMessage)]
+        compactable = len(tool_messages) - self.config.keep_recent
+        if self.config.batch_size > 1:
+            compactable -= compactable % self.config.batch_size
+        if compactable <= 0:
+            return messages, 0
+
+        compacted_messages = list(messages)
+        compacted = 0
+        for i, message in tool_messages[:compactable]:
+            tokens = self.count_tokens(message.text)
+            if tokens < self.config.min_tokens:
+                continue
+
+            compacted_messages[i] = ToolMessage(
+                content=self.digest(message, tokens),
+                tool_call_id=message.tool_call_id,
+                name=message.name,
+                status=message.status,
+            )
+            compacted += 1
+
+        return compacted_messages, compacted
+
+    def digest(self, message: ToolMessage, tokens: int) -> str:
+        """Summarize a tool output as a header line plus its first `digest_chars` characters."""
+        from byte.orchestration import RecallToolOutputTool
+
+        text = message.text.strip()
+        preview = text[: self.config.digest_chars].rstrip()
+        if len(text) > len(preview):
+            preview += "\n..."
+
+        header = (
+            f"[Compacted output of `{message.name}` ({tokens:,} tokens). "
+            f'Call `{RecallToolOutputTool.name}` with tool_call_id "{message.tool_call_id}" for the full output.]'
+        )
+        return f"{header}\n{preview}"
+
+    @staticmethod
+    def find_original(messages: list[BaseMessage], tool_call_id: str) -> Optional[ToolMessage]:
+        """Return the uncompacted tool message with the given id from graph state, if present."""
+        return next(
+            (
+                message
+                for message in messages
+                if isinstance(message, ToolMessage) and message.tool_call_id == tool_call_id
+            ),
+            None,
+        )
@@ -2,35 +2,67 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from byte.support import MD, Section
+from byte.support import MD, Section, Str
 from byte.support.boundary import Boundary, BoundaryType
+from byte.support.yaml import Yaml
 
 
 @dataclass
 class Skill:
     """Represents a parsed SKILL.md file.
 
+    Only the frontmatter is read when skills are discovered. The instruction
+    body and the reference files are loaded on first use, through
+    `get_instructions()` and `get_references()`.
+
     Attributes:
         name: Unique skill name (from frontmatter).
         description: Short description of the skill (from frontmatter).
-        instructions: Body content of the skill file (after frontmatter).
         path: Directory containing the SKILL.md file.
         skill_file_path: Absolute path to the SKILL.md file.
+        instructions: Body content of the skill file (after frontmatter), None until loaded.
         builtin: True if this skill was loaded from the Byte builtin skills directory.
         version: Optional version string (from frontmatter).
+        references: Reference files keyed by normalized name, None until loaded.
     """
 
     id: str
     name: str
     description: str
-    instructions: str
     path: Path
     skill_file_path: Path
+    instructions: Optional[str] = field(default=None, repr=False)
     builtin: bool = False
     version: Optional[str] = None
     allowed_tools: Optional[list[str]] = None
     active: bool = True
-    references: dict[str, Path] = field(default_factory=dict)
+    references: Optional[dict[str, Path]] = None
+
+    def get_instructions(self) -> str:
+        """Return the instruction body, reading it from SKILL.md on first use.
+
+        Usage: `body = skill.get_instructions()`
+        """
+        if self.instructions is None:
+            try:
+                _, self.instructions = Yaml.parse_frontmatter(self.skill_file_path.read_text(encoding="utf-8-sig"))
+            except OSError, UnicodeDecodeError:
+                return ""
+        return self.instructions
+
+    def get_references(self) -> dict[str, Path]:
+        """Return the skill's reference files, discovering them on first use.
+
+        Usage: `path = skill.get_references().get("examples")`
+        """
+        if self.references is None:
+            references_dir = self.path / "references"
+            self.references = (
+                {Str.normalize_id(ref.stem): ref.resolve() for ref in sorted(references_dir.glob("*.md"))}
+                if references_dir.is_dir()
+                else {}
+            )
+        return self.references
 
     def to_xml(self) -> str:
         """Convert the skill to an XML string for prompt injection."""
@@ -48,11 +80,12 @@ class Skill:
 
     def to_markdown(self) -> str:
         """Convert the skill to a markdown representation."""
-        lines: list[str] = [Section.sub_heading(self.name, 2), "", self.instructions]
-        if self.references:
+        lines: list[str] = [Section.sub_heading(self.name, 2), "", self.get_instructions()]
+        references = self.get_references()
+        if references:
             lines.append("")
             lines.append(Boundary.open(BoundaryType.SKILL_REFERENCES))
-            for name in self.references.keys():
+            for name in references.keys():
                 lines.append(f"    {Boundary.open(BoundaryType.NAME)}{name}{Boundary.close(BoundaryType.NAME)}")
             lines.append(Boundary.close(BoundaryType.SKILL_REFERENCES))
         return MD.list_to_text(lines)
@@ -1,6 +1,10 @@
+import hashlib
+import os
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from byte import Service
 from byte.skills.schemas import Skill
 from byte.support.boundary import Boundary, BoundaryType
@@ -9,6 +13,9 @@ from byte.support.yaml import Yaml
 
 SKILL_FILE_NAME = "SKILL.md"
 
+# Bump when the manifest layout changes so stale caches are ignored
+MANIFEST_VERSION = 1
+
 
 class SkillLoaderService(Service):
     """Service for discovering and loading skills from multiple source directories.
@@ -26,6 +33,7 @@ class SkillLoaderService(Service):
     def boot(self) -> None:
         """Discover and load skills on service initialization."""
         self._skills: dict[str, Skill] = {}
+        self.manifest_path = self.app.cache_path("skills.json")
         self.reload()
 
     # ------------------------------------------------------------------
@@ -68,50 +76,68 @@ class SkillLoaderService(Service):
 
         return "\n".join(lines)
 
-    def _find_skill_files(self, directory: Path) -> list[Path]:
-        """Recursively find all SKILL.md files under *directory*.
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _find_skill_files(self, directory: Path) -> tuple[list[Path], dict[str, int]]:
+        """Find all SKILL.md files under *directory*.
 
-        Performs case-insensitive matching so "skill.md" and "Skill.MD" are
-        also discovered on case-sensitive filesystems.
+        Walks directories only, and stops descending at the first directory
+        that contains a SKILL.md, so references and other files inside skills
+        are never listed or stat'ed. Matching is case-insensitive so
+        "skill.md" and "Skill.MD" are also discovered on case-sensitive
+        filesystems.
 
         Args:
             directory: Root directory to search.
 
         Returns:
-            List of absolute paths to SKILL.md files.
+            Absolute paths to SKILL.md files, and the mtime of every directory
+            walked, which tells a later reload whether the walk can be skipped.
         """
         found: list[Path] = []
-        try:
-            for item in directory.rglob("*"):
-                if item.is_file() and item.name.upper() == SKILL_FILE_NAME.upper():
-                    found.append(item.resolve())
-        except PermissionError:
-            self.app["log"].warning(f"Permission denied scanning: {directory}")
-        except OSError as exc:
-            self.app["log"].warning(f"Error scanning directory {directory}: {exc}")
-        return found
-
-    def _parse_skill_file(self, skill_file: Path, builtin: bool = False) -> Optional[Skill]:
-        """Parse a single SKILL.md file into a Skill dataclass.
-
-        Reads YAML frontmatter for *name*, *description*, and *version*, and
-        treats the remainder of the file as the skill instructions.
+        directories: dict[str, int] = {}
+        pending = [directory]
+
+        while pending:
+            current = pending.pop()
+            try:
+                directories[str(current)] = current.stat().st_mtime_ns
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except PermissionError:
+                self.app["log"].warning(f"Permission denied scanning: {current}")
+                continue
+            except OSError as exc:
+                self.app["log"].warning(f"Error scanning directory {current}: {exc}")
+                continue
+
+            skill_file = next(
+                (e for e in entries if e.name.upper() == SKILL_FILE_NAME.upper() and e.is_file()),
+                None,
+            )
+            if skill_file is not None:
+                found.append(Path(skill_file.path).resolve())
+                continue
+
+            pending.extend(Path(e.path) for e in entries if e.is_dir())
+
+        return sorted(found), directories
+
+    def _parse_frontmatter(self, skill_file: Path, content: str) -> Optional[dict]:
+        """Validate the frontmatter of a SKILL.md file and keep the fields the manifest needs.
 
         Args:
-            skill_file: Absolute path to the SKILL.md file.
-            builtin:    Mark the resulting Skill as builtin when True.
+            skill_file: Path of the file, for log messages.
+            content:    Full text of the file.
 
         Returns:
-            A populated Skill instance, or None if parsing fails.
+            Dict with *name*, *description*, and *version*, or None if the
+            frontmatter is missing or invalid.
         """
         try:
-            content = skill_file.read_text(encoding="utf-8-sig")
-        except (OSError, UnicodeDecodeError) as exc:
-            self.app["log"].warning(f"Could not read skill file {skill_file}: {exc}")
-            return None
-
-        try:
-            frontmatter, body = Yaml.parse_frontmatter(content)
+            frontmatter, _ = Yaml.parse_frontmatter(content)
         except Exception as exc:
             self.app["log"].warning(f"Failed to parse frontmatter in {skill_file}: {exc}")
             return None
@@ -135,37 +161,80 @@ class SkillLoaderService(Service):
         if version is not None and not isinstance(version, str):
             version = str(version)
 
-        references_dir = skill_file.parent / "references"
-        references: dict[str, Path] = {}
-        if references_dir.is_dir():
-            for ref_file in sorted(references_dir.glob("*.md")):
-                references[Str.normalize_id(ref_file.stem)] = ref_file.resolve()
-
-        return Skill(
-            id=Str.normalize_id(name),
-            name=name.strip(),
-            description=description.strip(),
-            instructions=body,
-            path=skill_file.parent,
-            skill_file_path=skill_file,
-            builtin=builtin,
-            version=version.strip() if isinstance(version, str) else None,
-            references=references,
+        return {
+            "name": name.strip(),
+            "description": description.strip(),
+            "version": version.strip() if isinstance(version, str) else None,
+        }
+
+    def _manifest_entry(self, skill_file: Path, cached: Optional[dict]) -> Optional[dict]:
+        """Return the manifest entry for a SKILL.md file, reading it only if it changed.
+
+        An entry whose mtime and size match is reused without opening the
+        file. Otherwise the file is read and hashed, and the frontmatter is
+        only parsed again if the hash differs.
+
+        Args:
+            skill_file: Absolute path to the SKILL.md file.
+            cached:     The entry stored by the previous load, if any.
+
+        Returns:
+            The entry, or None if the file could not be read.
+        """
+        try:
+            stat = skill_file.stat()
+            if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                return cached
+
+            raw = skill_file.read_bytes()
+            content = raw.decode("utf-8-sig")
+        except (OSError, UnicodeDecodeError) as exc:
+            self.app["log"].warning(f"Could not read skill file {skill_file}: {exc}")
+            return None
+
+        digest = hashlib.sha256(raw).hexdigest()
+        frontmatter = (
+            cached["frontmatter"]
+            if cached and cached["sha256"] == digest
+            else self._parse_frontmatter(skill_file, content)
         )
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "frontmatter": frontmatter,
+        }
+
+    def _read_manifest(self) -> dict:
+        try:
+            manifest = orjson.loads(self.manifest_path.read_bytes())
+        except OSError, orjson.JSONDecodeError:
+            return {}
+        return manifest.get("sources", {}) if manifest.get("version") == MANIFEST_VERSION else {}
 
-    def _load_from_directory(self, directory: Path, builtin: bool = False) -> dict[str, Skill]:
-        """Scan *directory* recursively for SKILL.md files and parse each one.
+    def _write_manifest(self, sources: dict) -> None:
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_name(f".{self.manifest_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(orjson.dumps({"version": MANIFEST_VERSION, "sources": sources}))
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as exc:
+            self.app["log"].warning(f"Could not write skill manifest {self.manifest_path}: {exc}")
+
+    def _load_from_directory(self, directory: Path, cached: Optional[dict]) -> dict:
+        """Load the manifest for the SKILL.md files under *directory*.
+
+        The directory walk is skipped when no walked directory's mtime has
+        changed since the cached manifest was written, since adding or
+        removing a skill always touches a parent directory.
 
         Args:
             directory: Root directory to scan.
-            builtin:   Mark loaded skills as builtin when True.
+            cached:    The manifest stored for this directory by the previous load, if any.
 
         Returns:
-            Dict of successfully parsed Skill objects keyed by id (empty if dir missing).
+            The manifest for this directory (empty if the dir is missing).
         """
         if not directory.exists():
             self.app["log"].debug(f"Skills directory does not exist, skipping: {directory}")
@@ -175,14 +244,48 @@ class SkillLoaderService(Service):
             self.app["log"].warning(f"Skills path is not a directory, skipping: {directory}")
             return {}
 
-        skills: dict[str, Skill] = {}
+        cached = cached or {}
+        directories = cached.get("directories", {})
+        if directories and all(self._mtime_ns(Path(path)) == mtime for path, mtime in directories.items()):
+            skill_files = [Path(path) for path in cached.get("skills", {})]
+        else:
+            skill_files, directories = self._find_skill_files(directory)
+
+        entries: dict[str, dict] = {}
+        for skill_file in skill_files:
+            entry = self._manifest_entry(skill_file, cached.get("skills", {}).get(str(skill_file)))
+            if entry is not None:
+                entries[str(skill_file)] = entry
 
-        for skill_file in self._find_skill_files(directory):
-            skill = self._parse_skill_file(skill_file, builtin=builtin)
-            if skill is not None:
-                skills[skill.id] = skill
+        return {"directories": directories, "skills": entries}
 
-        self.app["log"].debug(f"Found {len(skills)} skill(s) in {directory}")
+    @staticmethod
+    def _mtime_ns(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _skills_from_manifest(manifest: dict, builtin: bool = False) -> dict[str, Skill]:
+        """Build Skill objects, without instruction bodies, from a directory manifest."""
+        skills: dict[str, Skill] = {}
+        for path, entry in manifest.get("skills", {}).items():
+            frontmatter = entry["frontmatter"]
+            if frontmatter is None:
+                continue
+
+            skill_file = Path(path)
+            skill = Skill(
+                id=Str.normalize_id(frontmatter["name"]),
+                name=frontmatter["name"],
+                description=frontmatter["description"],
+                path=skill_file.parent,
+                skill_file_path=skill_file,
+                builtin=builtin,
+                version=frontmatter["version"],
+            )
+            skills[skill.id] = skill
         return skills
 
     def reload(self, *args) -> None:
@@ -190,21 +293,31 @@ class SkillLoaderService(Service):
 
         Collects skills from all sources in ascending priority order so that
         higher-priority (user) skills override lower-priority (builtin) ones.
+        Parsed frontmatter is kept in a manifest under `.byte/cache`, so
+        unchanged skills are not read again.
 
         """
+        cached = self._read_manifest()
+        sources: dict[str, dict] = {}
         merged: dict[str, Skill] = {}
 
-        # 1. Builtin skills (lowest priority)
-        builtin_dir = self.app.app_path("skills/builtin")
-        merged.update(self._load_from_directory(builtin_dir, builtin=True))
-
-        # 2. Agent-level skills — .agent/skills in the git root
-        agent_skills_dir = self.app.root_path(".agent/skills")
-        merged.update(self._load_from_directory(agent_skills_dir))
-
-        # 3. Project-level skills — .byte/skills (highest priority)
-        project_skills_dir = self.app.skills_path()
-        merged.update(self._load_from_directory(project_skills_dir))
+        for directory, builtin in (
+            # 1. Builtin skills (lowest priority)
+            (self.app.app_path("skills/builtin"), True),
+            # 2. Agent-level skills — .agent/skills in the git root
+            (self.app.root_path(".agent/skills"), False),
+            # 3. Project-level skills — .byte/skills (highest priority)
+            (self.app.skills_path(), False),
+        ):
+            manifest = self._load_from_directory(directory, cached.get(str(directory)))
+            sources[str(directory)] = manifest
+
+            skills = self._skills_from_manifest(manifest, builtin=builtin)
+            self.app["log"].debug(f"Found {len(skills)} skill(s) in {directory}")
+            merged.update(skills)
+
+        if sources != cached:
+            self._write_manifest(sources)
 
         self._skills = merged
 
@@ -36,12 +36,12 @@ class DeleteSkillReferenceTool(BaseTool):
         if skill is None:
             raise ToolValidationException(f"Skill '{skill_id}' not found.")
 
-        if reference_name not in skill.references:
+        if reference_name not in skill.get_references():
             raise ToolValidationException(
                 f"Reference '{reference_name}' not found in skill '{skill_id}'."
             )
 
-        reference_file = skill.references[reference_name]
+        reference_file = skill.get_references()[reference_name]
         try:
             reference_file.unlink()
         except (OSError, PermissionError) as exc:
@@ -40,7 +40,7 @@ class LoadSkillReferenceTool(BaseTool):
             raise ToolValidationException(f"Skill '{skill_id}' not found.")
 
         normalized_reference_name = Str.normalize_id(reference_name)
-        reference_path = skill.references.get(normalized_reference_name)
+        reference_path = skill.get_references().get(normalized_reference_name)
         if reference_path is None:
             raise ToolValidationException(
                 f"Reference '{reference_name}' not found in skill '{skill_id}'."
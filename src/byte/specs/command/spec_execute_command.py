@@ -43,12 +43,9 @@ class SpecExecuteCommand(Command):
 
         # Specs are executed via the coder workflow one by one and are just passed in via a user request and a files context.
         spec_loader_service = self.app.make(SpecLoaderService)
-        tasks = spec_loader_service.load_tasks(args.spec)
+        tasks = spec_loader_service.load_tasks(args.spec, statuses=("pending", "in_progress", "blocked"))
 
         for task in tasks:
-            if task.status == "completed":
-                continue
-
             workflow_phases = PhaseUtils.to_phase_dict(coder_workflow.get_phases())
 
             await file_service.clear_context()
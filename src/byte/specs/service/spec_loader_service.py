@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from byte import Service
+from byte.files import FileEvents
 from byte.specs import SpecTask
 from byte.specs.schemas import Spec, SpecTaskFiles
 from byte.support import Str
@@ -18,6 +19,13 @@ class SpecLoaderService(Service):
     a ``SPEC.md`` file with YAML frontmatter, parsed into
     :class:`~byte.specs.schemas.Spec` instances.
 
+    Specs and tasks are loaded incrementally. Each parsed file is cached with
+    its mtime and size, so a reload only re-parses files that changed, and
+    the file watcher refreshes single files as they are edited through
+    ``file_changed_hook``. Every spec's tasks are indexed by status when the
+    specs are loaded, kept current by the same reload and file events, and
+    updated by ``save_task`` as it writes.
+
     Usage:
         spec_loader = app.make(SpecLoaderService)
         specs = spec_loader.specs          # dict of active Spec objects keyed by name
@@ -30,6 +38,13 @@ class SpecLoaderService(Service):
         Usage: Called automatically when the service is resolved from the container.
         """
         self._specs: dict[str, Spec] = {}
+        # (mtime_ns, size) of every parsed SPEC.md and task file
+        self._signatures: dict[Path, tuple[int, int]] = {}
+        # Spec id -> task file -> task, for every loaded spec
+        self._tasks: dict[str, dict[Path, SpecTask]] = {}
+        # Spec id -> status -> task files, using the status each task was indexed with
+        self._tasks_by_status: dict[str, dict[str, set[Path]]] = {}
+        self._task_status: dict[Path, str] = {}
         self.reload()
 
     # ------------------------------------------------------------------
@@ -69,18 +84,13 @@ class SpecLoaderService(Service):
             directory: Root directory to search.
 
         Returns:
-            List of absolute paths to SPEC.md files.
+            Sorted list of paths to SPEC.md files.
         """
-        found: list[Path] = []
         try:
-            for item in directory.rglob("*"):
-                if item.is_file() and item.name.upper() == SPEC_FILE_NAME.upper():
-                    found.append(item.resolve())
-        except PermissionError:
-            self.app["log"].warning(f"Permission denied scanning: {directory}")
+            return sorted(directory.glob(f"*/{SPEC_FILE_NAME}", case_sensitive=False))
         except OSError as exc:
             self.app["log"].warning(f"Error scanning directory {directory}: {exc}")
-        return found
+            return []
 
     def _parse_spec_file(self, spec_file: Path, specs_root: Path) -> Optional[Spec]:
         """Parse a single ``SPEC.md`` file into a Spec dataclass.
@@ -138,32 +148,97 @@ class SpecLoaderService(Service):
             reference_files=reference_files,
         )
 
-    def _load_from_directory(self, directory: Path) -> dict[str, Spec]:
-        """Scan *directory* for spec subdirectories each containing a ``SPEC.md`` file and parse each one.
+    @staticmethod
+    def _stat(path: Path) -> Optional[tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
-        Args:
-            directory: Root directory to scan.
+    def _refresh_spec(self, spec_file: Path, specs_root: Path) -> None:
+        """Re-parse a ``SPEC.md`` file if it changed, or drop its spec if it is gone.
 
-        Returns:
-            Dict of successfully parsed Spec objects keyed by id (empty if dir missing).
+        Args:
+            spec_file: Path to the spec file.
+            specs_root: Root directory for computing relative spec ID.
         """
-        if not directory.exists():
-            self.app["log"].debug(f"Specs directory does not exist, skipping: {directory}")
-            return {}
+        signature = self._stat(spec_file)
+        if signature is not None and signature == self._signatures.get(spec_file):
+            return
+
+        spec_id = str(spec_file.parent.relative_to(specs_root))
+        self._signatures.pop(spec_file, None)
+        self._specs.pop(spec_id, None)
+
+        if signature is None:
+            self._drop_tasks(spec_id)
+            return
+
+        spec = self._parse_spec_file(spec_file, specs_root=specs_root)
+        if spec is not None:
+            self._specs[spec.id] = spec
+            self._signatures[spec_file] = signature
+
+    def _index_task(self, spec_id: str, task_file: Path, task: Optional[SpecTask]) -> None:
+        """Store *task* as the content of *task_file*, or remove the file's task when None."""
+        tasks = self._tasks.setdefault(spec_id, {})
+        by_status = self._tasks_by_status.setdefault(spec_id, {})
+
+        tasks.pop(task_file, None)
+        previous_status = self._task_status.pop(task_file, None)
+        if previous_status is not None:
+            by_status[previous_status].discard(task_file)
+
+        if task is not None:
+            tasks[task_file] = task
+            self._task_status[task_file] = task.status
+            by_status.setdefault(task.status, set()).add(task_file)
+
+    def _refresh_task(self, spec_id: str, task_file: Path) -> None:
+        """Re-parse a task file if it changed, or drop its task if it is gone."""
+        signature = self._stat(task_file)
+        if signature is not None and signature == self._signatures.get(task_file):
+            return
+
+        self._signatures.pop(task_file, None)
+        task = self._parse_task_file(task_file) if signature is not None else None
+        self._index_task(spec_id, task_file, task)
+        if task is not None:
+            self._signatures[task_file] = signature
+
+    def _sync_tasks(self, spec: Spec) -> None:
+        """Bring the task index of *spec* in line with its ``tasks/`` directory."""
+        tasks_dir = spec.path / TASKS_DIR_NAME
+        try:
+            task_files = set(tasks_dir.glob("*.md")) if tasks_dir.is_dir() else set()
+        except OSError as exc:
+            self.app["log"].warning(f"Could not scan tasks directory {tasks_dir}: {exc}")
+            task_files = set()
 
-        if not directory.is_dir():
-            self.app["log"].warning(f"Specs path is not a directory, skipping: {directory}")
-            return {}
+        for task_file in self._tasks.get(spec.id, {}).keys() - task_files:
+            self._index_task(spec.id, task_file, None)
+            self._signatures.pop(task_file, None)
 
-        specs: dict[str, Spec] = {}
+        self._tasks.setdefault(spec.id, {})
+        for task_file in task_files:
+            self._refresh_task(spec.id, task_file)
 
-        for spec_file in self._find_spec_files(directory):
-            spec = self._parse_spec_file(spec_file, specs_root=directory)
-            if spec is not None:
-                specs[spec.id] = spec
+    def _drop_tasks(self, spec_id: str) -> None:
+        for task_file in self._tasks.pop(spec_id, {}):
+            self._signatures.pop(task_file, None)
+            self._task_status.pop(task_file, None)
+        self._tasks_by_status.pop(spec_id, None)
+
+    def _spec_tasks(self, spec_name: str) -> Optional[dict[Path, SpecTask]]:
+        """Return the indexed tasks of a spec, indexing its tasks directory if reload has not yet."""
+        spec = self.get_spec(spec_name)
+        if spec is None:
+            return None
 
-        self.app["log"].debug(f"Found {len(specs)} spec(s) in {directory}")
-        return specs
+        if spec.id not in self._tasks:
+            self._sync_tasks(spec)
+        return self._tasks[spec.id]
 
     def _parse_task_file(self, task_file: Path) -> Optional[SpecTask]:
         """Parse a single task markdown file with YAML frontmatter.
@@ -240,54 +315,38 @@ class SpecLoaderService(Service):
 
         Usage: `task = service.load_task("my-feature", "lint-files")`
         """
-        spec = self.get_spec(spec_name)
-        if spec is None:
+        tasks = self._spec_tasks(spec_name)
+        if tasks is None:
             return None
 
-        tasks_dir = spec.path / TASKS_DIR_NAME
-        if not tasks_dir.exists():
-            return None
+        spec = self._specs[spec_name]
+        return tasks.get(spec.path / TASKS_DIR_NAME / f"{Str.normalize_id(task_id)}.md")
 
-        normalized_id = Str.normalize_id(task_id)
-        task_file = tasks_dir / f"{normalized_id}.md"
-
-        if not task_file.exists():
-            return None
-
-        return self._parse_task_file(task_file)
-
-    def load_tasks(self, spec_name: str) -> list[SpecTask]:
-        """Load tasks for a spec from its ``tasks/`` subdirectory.
+    def load_tasks(self, spec_name: str, statuses: Optional[Iterable[str]] = None) -> list[SpecTask]:
+        """Load tasks for a spec from its ``tasks/`` subdirectory, ordered by their ``order`` field.
 
         tasks are stored as individual markdown files with YAML frontmatter.
         Returns an empty list if the spec does not exist or no tasks directory is present.
 
         Args:
             spec_name: The name of the spec to load tasks for.
+            statuses: Only return tasks with one of these statuses. Answered from the status index.
 
-        Usage: `tasks = service.load_tasks("my-feature")`
+        Usage: `tasks = service.load_tasks("my-feature", statuses=("pending", "in_progress"))`
         """
-        spec = self.get_spec(spec_name)
-        if spec is None:
+        tasks = self._spec_tasks(spec_name)
+        if not tasks:
             return []
 
-        tasks_dir = spec.path / TASKS_DIR_NAME
-        if not tasks_dir.exists():
-            return []
-
-        tasks: list[SpecTask] = []
-        try:
-            for task_file in sorted(tasks_dir.glob("*.md")):
-                task = self._parse_task_file(task_file)
-                if task is not None:
-                    tasks.append(task)
-        except (OSError, PermissionError) as exc:
-            self.app["log"].warning(f"Could not scan tasks directory {tasks_dir}: {exc}")
-            return []
+        if statuses is None:
+            selected = list(tasks.values())
+        else:
+            by_status = self._tasks_by_status.get(self._specs[spec_name].id, {})
+            selected = [tasks[task_file] for status in statuses for task_file in by_status.get(status, ())]
 
         # Sort by order field
-        tasks.sort(key=lambda p: (p.order, p.id))
-        return tasks
+        selected.sort(key=lambda p: (p.order, p.id))
+        return selected
 
     def save_tasks(self, spec_name: str, tasks: list[SpecTask]) -> bool:
         """Persist *tasks* for a spec as individual markdown files in ``tasks/`` subdirectory.
@@ -341,6 +400,9 @@ class SpecLoaderService(Service):
             except OSError as exc:
                 self.app["log"].warning(f"Could not write task file {task_file}: {exc}")
                 all_success = False
+                continue
+
+            self._write_through(spec, task_file, task)
 
         return all_success
 
@@ -390,17 +452,56 @@ class SpecLoaderService(Service):
 
         try:
             task_file.write_text(content, encoding="utf-8")
-            return True
         except OSError as exc:
             self.app["log"].warning(f"Could not write task file {task_file}: {exc}")
             return False
 
+        self._write_through(spec, task_file, task)
+        return True
+
+    def _write_through(self, spec: Spec, task_file: Path, task: SpecTask) -> None:
+        """Index a task that was just written, if the spec's tasks are loaded."""
+        if spec.id not in self._tasks:
+            return
+
+        self._index_task(spec.id, task_file, task)
+        signature = self._stat(task_file)
+        if signature is not None:
+            self._signatures[task_file] = signature
+
+    async def file_changed_hook(self, payload: FileEvents.SpecChanged) -> FileEvents.SpecChanged:
+        """Refresh the spec or task whose file changed on disk."""
+        file_path = Path(payload.file_path)
+        specs_dir = self.app.specs_path()
+
+        if file_path.name.upper() == SPEC_FILE_NAME.upper() and file_path.parent.parent == specs_dir:
+            self._refresh_spec(file_path, specs_root=specs_dir)
+            spec = self.get_spec(str(file_path.parent.relative_to(specs_dir)))
+            if spec is not None:
+                self._sync_tasks(spec)
+        elif file_path.suffix == ".md" and file_path.parent.name == TASKS_DIR_NAME:
+            spec_id = str(file_path.parent.parent.relative_to(specs_dir))
+            if spec_id in self._tasks:
+                self._refresh_task(spec_id, file_path)
+
+        return payload
+
     def reload(self, *args) -> None:
-        """Re-scan the specs directory and refresh the loaded specs dict.
+        """Re-scan the specs directory, re-parsing only the spec and task files that changed.
 
         Usage: `service.reload()`
         """
         specs_dir = self.app.specs_path()
-        self._specs = self._load_from_directory(specs_dir)
+        spec_files = set(self._find_spec_files(specs_dir)) if specs_dir.is_dir() else set()
+
+        known = {spec.spec_file_path for spec in self._specs.values()}
+        for spec_file in known | spec_files:
+            self._refresh_spec(spec_file, specs_root=specs_dir)
+
+        # Keep the task and status index warm so status filters never hit the disk
+        for spec_id in self._tasks.keys() - self._specs.keys():
+            self._drop_tasks(spec_id)
+        for spec in self._specs.values():
+            self._sync_tasks(spec)
 
         self.app["log"].debug(f"SpecLoaderService loaded {len(self._specs)} spec(s)")
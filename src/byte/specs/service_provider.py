@@ -1,4 +1,5 @@
-from byte import ServiceProvider
+from byte import EventBus, ServiceProvider
+from byte.files import FileEvents
 from byte.specs import (
     CreateQuickSpecWorkflow,
     CreateRefractorWorkflow,
@@ -74,3 +75,7 @@ class SpecsServiceProvider(ServiceProvider):
         """Boot spec services."""
         spec_loader_service = self.app.make(SpecLoaderService)
         self.app.booted(spec_loader_service.reload)
+
+        # Refresh single specs and tasks as their files are edited
+        event_bus = self.app.make(EventBus)
+        event_bus.on(FileEvents.SpecChanged, spec_loader_service.file_changed_hook)
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from byte.support.command_runner import CommandRunner
     from byte.support.concerns.array_store import ArrayStore
     from byte.support.json import Json
+    from byte.support.json_stream import JsonDelta, JsonStreamParser
     from byte.support.markdown import MD
     from byte.support.section import Section, SectionType
     from byte.support.service import Service
@@ -25,6 +26,8 @@ __all__ = (
     "BoundaryType",
     "CommandRunner",
     "Json",
+    "JsonDelta",
+    "JsonStreamParser",
     "Section",
     "SectionType",
     "Service",
@@ -42,6 +45,8 @@ _dynamic_imports = {
     "BoundaryType": "boundary",
     "CommandRunner": "command_runner",
     "Json": "json",
+    "JsonDelta": "json_stream",
+    "JsonStreamParser": "json_stream",
     "MD": "markdown",
     "Section": "section",
     "SectionType": "section",
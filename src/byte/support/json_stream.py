@@ -0,0 +1,278 @@
+import json
+import re
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List
+
+_STRING_STOP = re.compile(r'["\\]')
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class _ParseState(Enum):
+    START = "start"
+    KEY_OR_END = "key_or_end"
+    KEY = "key"
+    COLON = "colon"
+    VALUE_START = "value_start"
+    STRING_VALUE = "string_value"
+    RAW_VALUE = "raw_value"
+    AFTER_VALUE = "after_value"
+    DONE = "done"
+    INVALID = "invalid"
+
+
+@dataclass
+class JsonDelta:
+    """A change to a single top-level key produced by `JsonStreamParser.feed()`.
+
+    Args:
+        key: The top-level object key that changed.
+        text: Newly decoded text for string values, or newly received raw JSON for other values.
+        complete: True once the value has been fully received.
+        value: The parsed value once complete, otherwise None.
+    """
+
+    key: str
+    text: str
+    complete: bool = False
+    value: Any = None
+
+
+class JsonStreamParser:
+    """Incrementally parse a streamed JSON object and emit per-key deltas.
+
+    Each fragment is scanned exactly once, so feeding a payload in N fragments
+    costs O(total size) instead of re-parsing the accumulated text each time.
+    Only the top-level object is tracked: string values are decoded as they
+    arrive and any other value (numbers, arrays, nested objects) is buffered as
+    raw JSON until it is complete.
+
+    Usage:
+        parser = JsonStreamParser()
+        for delta in parser.feed('{"file_path": "a.py", "content": "pri'):
+            ...
+        parser.value("content")  # -> "pri"
+    """
+
+    def __init__(self) -> None:
+        self._state = _ParseState.START
+        self._fragments: List[str] = []
+        self._parts: Dict[str, List[str]] = {}
+        self._values: Dict[str, Any] = {}
+        self._key_parts: List[str] = []
+        self._key = ""
+        self._escape = ""
+        self._high_surrogate: int | None = None
+        self._raw_depth = 0
+        self._raw_in_string = False
+        self._raw_escaped = False
+
+    @property
+    def is_invalid(self) -> bool:
+        """Return True if the stream is not a JSON object."""
+        return self._state is _ParseState.INVALID
+
+    @property
+    def is_complete(self) -> bool:
+        """Return True once the closing brace of the object has been received."""
+        return self._state is _ParseState.DONE
+
+    def raw(self) -> str:
+        """Return every fragment received so far."""
+        return "".join(self._fragments)
+
+    def keys(self) -> List[str]:
+        """Return the keys seen so far in arrival order."""
+        return list(self._parts)
+
+    def value(self, key: str) -> Any:
+        """Return the parsed value for a key, or the partial text if it is still streaming."""
+        if key in self._values:
+            return self._values[key]
+        parts = self._parts.get(key)
+        return "".join(parts) if parts is not None else None
+
+    def is_value_complete(self, key: str) -> bool:
+        """Return True if the value for a key has been fully received."""
+        return key in self._values
+
+    def _emit(self, deltas: List[JsonDelta], text: str) -> None:
+        """Record and emit newly received text for the current key."""
+        if not text:
+            return
+        self._parts[self._key].append(text)
+        if deltas and deltas[-1].key == self._key and not deltas[-1].complete:
+            deltas[-1].text += text
+        else:
+            deltas.append(JsonDelta(key=self._key, text=text))
+
+    def _complete(self, deltas: List[JsonDelta], value: Any) -> None:
+        """Mark the current key's value as complete."""
+        self._values[self._key] = value
+        deltas.append(JsonDelta(key=self._key, text="", complete=True, value=value))
+
+    def _decode_escape(self) -> str | None:
+        """Decode the buffered escape sequence, returning None while more characters are needed."""
+        kind = self._escape[1]
+        if kind != "u":
+            return _ESCAPES.get(kind, kind)
+        if len(self._escape) < 6:
+            return None
+
+        try:
+            code = int(self._escape[2:6], 16)
+        except ValueError:
+            return self._escape
+
+        if 0xD800 <= code <= 0xDBFF:
+            self._high_surrogate = code
+            return ""
+        if 0xDC00 <= code <= 0xDFFF and self._high_surrogate is not None:
+            high, self._high_surrogate = self._high_surrogate, None
+            return chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+        return chr(code)
+
+    def _read_string(self, text: str, i: int, sink: List[str]) -> tuple[int, bool]:
+        """Decode string characters into `sink` until the closing quote or the end of `text`."""
+        length = len(text)
+        while i < length:
+            if self._escape:
+                self._escape += text[i]
+                i += 1
+                decoded = self._decode_escape()
+                if decoded is not None:
+                    sink.append(decoded)
+                    self._escape = ""
+                continue
+
+            match = _STRING_STOP.search(text, i)
+            if match is None:
+                sink.append(text[i:])
+                return length, False
+
+            stop = match.start()
+            if stop > i:
+                sink.append(text[i:stop])
+            if text[stop] == '"':
+                return stop + 1, True
+
+            self._escape = "\\"
+            i = stop + 1
+
+        return i, False
+
+    def _read_raw(self, text: str, i: int) -> tuple[int, bool]:
+        """Consume a non-string value, returning the index after it and whether it ended."""
+        length = len(text)
+        while i < length:
+            char = text[i]
+            if self._raw_in_string:
+                if self._raw_escaped:
+                    self._raw_escaped = False
+                elif char == "\\":
+                    self._raw_escaped = True
+                elif char == '"':
+                    self._raw_in_string = False
+            elif char == '"':
+                self._raw_in_string = True
+            elif char in "[{":
+                self._raw_depth += 1
+            elif char in "]}":
+                if self._raw_depth == 0:
+                    return i, True
+                self._raw_depth -= 1
+                if self._raw_depth == 0:
+                    return i + 1, True
+            elif self._raw_depth == 0 and (char == "," or char.isspace()):
+                return i, True
+            i += 1
+        return i, False
+
+    def feed(self, fragment: str) -> List[JsonDelta]:
+        """Consume a fragment and return the per-key changes it produced.
+
+        Usage: `deltas = parser.feed(chunk)`
+        """
+        self._fragments.append(fragment)
+        deltas: List[JsonDelta] = []
+        length = len(fragment)
+        i = 0
+
+        while i < length and self._state not in (_ParseState.DONE, _ParseState.INVALID):
+            state = self._state
+            char = fragment[i]
+
+            if state in (_ParseState.START, _ParseState.KEY_OR_END, _ParseState.COLON, _ParseState.AFTER_VALUE):
+                if char.isspace():
+                    i += 1
+                    continue
+
+            if state is _ParseState.START:
+                self._state = _ParseState.KEY_OR_END if char == "{" else _ParseState.INVALID
+                i += 1
+
+            elif state is _ParseState.KEY_OR_END:
+                if char == '"':
+                    self._key_parts = []
+                    self._state = _ParseState.KEY
+                elif char == "}":
+                    self._state = _ParseState.DONE
+                elif char != ",":
+                    self._state = _ParseState.INVALID
+                i += 1
+
+            elif state is _ParseState.KEY:
+                i, closed = self._read_string(fragment, i, self._key_parts)
+                if closed:
+                    self._key = "".join(self._key_parts)
+                    self._parts[self._key] = []
+                    self._values.pop(self._key, None)
+                    self._state = _ParseState.COLON
+
+            elif state is _ParseState.COLON:
+                self._state = _ParseState.VALUE_START if char == ":" else _ParseState.INVALID
+                i += 1
+
+            elif state is _ParseState.VALUE_START:
+                if char.isspace():
+                    i += 1
+                elif char == '"':
+                    self._state = _ParseState.STRING_VALUE
+                    i += 1
+                else:
+                    self._raw_depth = 0
+                    self._raw_in_string = False
+                    self._raw_escaped = False
+                    self._state = _ParseState.RAW_VALUE
+
+            elif state is _ParseState.STRING_VALUE:
+                sink: List[str] = []
+                i, closed = self._read_string(fragment, i, sink)
+                self._emit(deltas, "".join(sink))
+                if closed:
+                    self._complete(deltas, "".join(self._parts[self._key]))
+                    self._state = _ParseState.AFTER_VALUE
+
+            elif state is _ParseState.RAW_VALUE:
+                start = i
+                i, ended = self._read_raw(fragment, i)
+                self._emit(deltas, fragment[start:i])
+                if ended:
+                    raw = "".join(self._parts[self._key])
+                    try:
+                        value = json.loads(raw)
+                    except json.JSONDecodeError:
+                        value = raw
+                    self._complete(deltas, value)
+                    self._state = _ParseState.AFTER_VALUE
+
+            elif state is _ParseState.AFTER_VALUE:
+                if char == ",":
+                    self._state = _ParseState.KEY_OR_END
+                elif char == "}":
+                    self._state = _ParseState.DONE
+                else:
+                    self._state = _ParseState.INVALID
+                i += 1
+
+        return deltas
@@ -140,6 +140,26 @@ class ServiceProvider(ABC):
             self.app.bind(workflow_class)
             self.app["console"].print_boot_status("ok", "Registered", workflow_class.__name__)
 
+    def boots_concurrently(self) -> bool:
+        """Return whether this provider may boot alongside the providers before it.
+
+        Providers boot one after another in registration order by default, so a
+        boot() may rely on anything an earlier provider set up. Opt in only when
+        boot() needs nothing beyond what depends_on() lists.
+        Usage: `return True`
+        """
+        return False
+
+    def depends_on(self) -> List[Type[ServiceProvider]]:
+        """Return providers that must finish booting before this provider boots.
+
+        Only consulted when boots_concurrently() is True; other providers wait
+        for every provider registered before them. Dependencies must be
+        registered earlier in the provider list.
+        Usage: `return [FileServiceProvider]`
+        """
+        return []
+
     def set_application(self, app: Application):
         """Set the container instance for providers that need container access.
 
@@ -19,6 +19,8 @@ class BaseTool(ABC, Bootable):
     input_schema: Dict[str, Any]
     harness_invocable: bool = True
     terminates_turn: bool = False
+    # Callable in every workflow phase, regardless of the phase's tool list
+    phase_exempt: bool = False
 
     @abstractmethod
     async def run(self, *args: Any, **kwargs: Any) -> ToolResult:
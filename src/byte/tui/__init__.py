@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from byte.tui.schemas import AutocompleteOption
     from byte.tui.service.interactions_service import InteractionService
     from byte.tui.service.prompt_history_service import PromptHistoryService
+    from byte.tui.service.stream_coalescer_service import StreamCoalescerService
     from byte.tui.service.tui_manager_service import TUIManagerService
     from byte.tui.service_provider import TUIServiceProvider
 
@@ -24,6 +25,7 @@ __all__ = (
     "Messages",
     "PromptHistoryService",
     "Status",
+    "StreamCoalescerService",
     "TUIManagerService",
     "TUIServiceProvider",
     "TuiEvents",
@@ -39,6 +41,7 @@ _dynamic_imports = {
     "Messages": "messages",
     "PromptHistoryService": "service.prompt_history_service",
     "Status": "messages",
+    "StreamCoalescerService": "service.stream_coalescer_service",
     "TUIManagerService": "service.tui_manager_service",
     "TUIServiceProvider": "service_provider",
     "TuiEvents": "events",
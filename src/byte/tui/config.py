@@ -14,3 +14,13 @@ class TUIConfig(BaseModel):
         default="monokai",
         description="Pygments theme for code block syntax highlighting in CLI output",
     )
+    stream_fps: int = Field(
+        default=30,
+        ge=0,
+        description="Maximum frames per second for rendering streamed responses. Token chunks arriving faster are merged into a single frame (0 disables batching)",
+    )
+    offscreen_margin: int = Field(
+        default=1,
+        ge=0,
+        description="Screen heights of conversation kept fully rendered above and below the viewport. Finished messages further away are collapsed into lightweight markdown snapshots",
+    )
@@ -47,10 +47,9 @@ class ConversationScreen(Screen[None]):
     ]
 
     def action_cancel_request(self) -> None:
-        from byte.orchestration import WorkflowService
+        from byte.tui import TUIManagerService
 
-        workflow_service = self.app.byte.make(WorkflowService)
-        workflow_service.cancel()
+        self.app.byte.make(TUIManagerService).cancel_run()
         self.post_message(Messages.Notify(content="Cancel requested — stopping after current step..."))
 
     def action_scroll_to_panel(self, panel_id: str) -> None:
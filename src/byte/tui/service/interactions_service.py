@@ -11,9 +11,18 @@ class InteractionService(Service):
 
     Provides standardized methods for getting user input during tool execution
     or command processing, with consistent styling and error handling.
+
+    When running headless there is no TUI to answer prompts, so each prompt
+    resolves immediately: confirmations and selections take their default,
+    and free-text input is treated as cancelled.
     Usage: `await interaction_service.confirm("Delete this file?")` -> bool response
     """
 
+    def _log_headless_answer(self, message: str, answers: List[Answer]) -> None:
+        """Log the answer given on the user's behalf to a prompt nobody can see."""
+        labels = ", ".join(answer.label for answer in answers) or "nothing"
+        self.app["log"].info(f"Headless: answered '{message}' with {labels}")
+
     async def confirm(self, message: str, default: bool = False) -> bool:
         """Ask user for yes/no confirmation with default value.
 
@@ -26,6 +35,10 @@ class InteractionService(Service):
             Answer(label="No", value=False, is_default=not default),
         ]
 
+        if self.app.is_headless():
+            self._log_headless_answer(message, [answer_options[0 if default else 1]])
+            return default
+
         result_future: asyncio.Future[Answer | list[Answer] | str | AnswerCancelled] = asyncio.Future()
         self.emit_tui(Messages.Status(state="question"))
         self.emit_tui(
@@ -54,6 +67,11 @@ class InteractionService(Service):
         if not choices:
             raise ValueError("Choices list cannot be empty")
 
+        if self.app.is_headless():
+            choice = next((choice for choice in choices if choice.is_default), choices[0])
+            self._log_headless_answer(message, [choice])
+            return choice
+
         result_future: asyncio.Future[Answer | list[Answer] | str | AnswerCancelled] = asyncio.Future()
         self.emit_tui(Messages.Status(state="question"))
         self.emit_tui(
@@ -79,6 +97,10 @@ class InteractionService(Service):
 
         Usage: `text = await interaction_service.input_text("Enter name:", "default_name")`
         """
+        if self.app.is_headless():
+            self.app["log"].info(f"Headless: cancelled text input '{message}'")
+            raise InputCancelledError
+
         result_future: asyncio.Future[Answer | list[Answer] | str | AnswerCancelled] = asyncio.Future()
         self.emit_tui(Messages.Status(state="question"))
         self.emit_tui(
@@ -107,6 +129,11 @@ class InteractionService(Service):
         if not choices:
             raise ValueError("Choices list cannot be empty")
 
+        if self.app.is_headless():
+            selected = [choice for choice in choices if choice.is_default]
+            self._log_headless_answer(message, selected)
+            return selected
+
         result_future: asyncio.Future[Answer | list[Answer] | str | AnswerCancelled] = asyncio.Future()
         self.emit_tui(Messages.Status(state="question"))
         self.emit_tui(
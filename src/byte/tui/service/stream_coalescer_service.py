@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+from textual.message import Message
+
+from byte.support import Service
+from byte.tui import Messages, Status
+
+
+class StreamCoalescerService(Service):
+    """Batch streamed token chunks into frame-rate-limited TUI messages.
+
+    Running `Response`/`ToolResponse` chunks are buffered per stream and emitted as
+    a single merged message at most once per frame. Any other message (stream
+    start, stream end, status changes) flushes every pending frame first so
+    ordering is preserved.
+    Usage: `coalescer.push(Messages.Response(status=Status.RUNNING, chunk="Hel"))`
+    """
+
+    def boot(self) -> None:
+        stream_fps = self.app["config"].tui.stream_fps
+        self._interval: float = 1 / stream_fps if stream_fps > 0 else 0.0
+        self._pending: dict[str, tuple[Messages.Response | Messages.ToolResponse, list[str]]] = {}
+        self._last_flush: dict[str, float] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+
+        self.frames_emitted: int = 0
+        self.frames_merged: int = 0
+        self.frames_dropped: int = 0
+
+    def _stream_key(self, payload: Message) -> str | None:
+        """Return the buffer key for a running chunk, or None if the payload is not a frame."""
+        match payload:
+            case Messages.Response(status=Status.RUNNING):
+                return "response"
+            case Messages.ToolResponse(status=Status.RUNNING):
+                return f"tool:{payload.tool_id}"
+            case _:
+                return None
+
+    def push(self, payload: Message) -> None:
+        """Queue a TUI message, merging running chunks into the next frame."""
+        key = self._stream_key(payload)
+        if key is None:
+            self.flush()
+            self.emit_tui(payload)
+            return
+
+        chunk = getattr(payload, "chunk", None)
+        if not chunk:
+            self.frames_dropped += 1
+            return
+
+        if self._interval == 0:
+            self.frames_emitted += 1
+            self.emit_tui(payload)
+            return
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = (payload, [chunk])  # ty:ignore[invalid-assignment]
+        else:
+            pending[1].append(chunk)
+            self.frames_merged += 1
+
+        now = time.monotonic()
+        due = self._last_flush.get(key, 0.0) + self._interval
+        if now >= due:
+            self._flush_key(key)
+        elif key not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[key] = loop.call_later(due - now, self._flush_key, key)
+
+    def _flush_key(self, key: str) -> None:
+        """Emit the merged frame for a single stream."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+
+        payload, chunks = pending
+        payload.chunk = "".join(chunks)
+        self._last_flush[key] = time.monotonic()
+        self.frames_emitted += 1
+        self.emit_tui(payload)
+
+    def flush(self) -> None:
+        """Emit every pending frame immediately.
+
+        Usage: `coalescer.flush()` -> call before a stream ends or the workflow finishes
+        """
+        for key in list(self._pending):
+            self._flush_key(key)
+
+        self._last_flush.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return frame counters for the lifetime of the service.
+
+        Usage: `coalescer.stats()` -> `{"emitted": 120, "merged": 2400, "dropped": 3}`
+        """
+        return {
+            "emitted": self.frames_emitted,
+            "merged": self.frames_merged,
+            "dropped": self.frames_dropped,
+        }
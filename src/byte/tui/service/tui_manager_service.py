@@ -1,10 +1,15 @@
 import threading
 import uuid
+from typing import TYPE_CHECKING
 
 from byte import CommandRegistryService
 from byte.support import Service
 from byte.tui import Messages, PromptHistoryService, TuiEvents
 
+if TYPE_CHECKING:
+    from byte.orchestration import WorkflowRun
+    from byte.tui import ByteTUI
+
 
 class TUIManagerService(Service):
     """ """
@@ -17,9 +22,14 @@ class TUIManagerService(Service):
         Usage: Called automatically during service container boot process
         """
 
-        self.tui = self.app.tui()
         self.command_registry = self.app.make(CommandRegistryService)
         self.thread_local = threading.local()
+        self.active_run: WorkflowRun | None = None
+
+    @property
+    def tui(self) -> ByteTUI:
+        """Resolve the ByteTUI lazily so headless runs never construct the Textual app."""
+        return self.app.tui()
 
     async def run_async(self):
         await self.tui.run_async()
@@ -59,22 +69,55 @@ class TUIManagerService(Service):
         self.emit_tui(Messages.CommandExecutionCompleted())
 
     async def handle_user_message(self, event: TuiEvents.UserInputSubmitted):
-        user_input = event.message
-
-        panel_id = f"panel_{str(uuid.uuid4()).replace('-', '_')}"
-        self.thread_local.panel_id = panel_id
-
-        self.thread_local.is_interrupted = event.interrupted
+        from byte.orchestration import WorkflowService
 
-        self.tui.conversation.post_message(Messages.CommandExecutionStarted(panel_id=self.thread_local.panel_id))
-        # User Messages are always our primary entrypoint. As a result we always create a pending panel here and mount it empty.
-        if user_input.startswith("/"):
-            await self._handle_command_input(event.message)
-        else:
-            # Assume this is a coder command so prepend that
-            await self._handle_command_input(f"/coder {event.message}")
-
-        self.tui.conversation.post_message(Messages.CommandExecutionCompleted(panel_id=self.thread_local.panel_id))
+        user_input = event.message
+        workflow_service = self.app.make(WorkflowService)
+        if not workflow_service.run_lock.acquire(blocking=False):
+            # A gateway agent run owns the workflow; hand the prompt back instead of interleaving with it.
+            self.tui.conversation.post_message(
+                Messages.Notify(content="An agent run is already in progress", style="warning")
+            )
+            self.tui.conversation.post_message(Messages.CommandExecutionCompleted())
+            return
+
+        try:
+            self.active_run = workflow_service.begin_run()
+
+            panel_id = f"panel_{str(uuid.uuid4()).replace('-', '_')}"
+            self.thread_local.panel_id = panel_id
+
+            self.thread_local.is_interrupted = event.interrupted
+
+            self.tui.conversation.post_message(Messages.CommandExecutionStarted(panel_id=self.thread_local.panel_id))
+            # User Messages are always our primary entrypoint. As a result we always create a pending panel here and mount it empty.
+            if user_input.startswith("/"):
+                await self._handle_command_input(event.message)
+            else:
+                # Assume this is a coder command so prepend that
+                await self._handle_command_input(f"/coder {event.message}")
+
+            self.tui.conversation.post_message(Messages.CommandExecutionCompleted(panel_id=self.thread_local.panel_id))
+        finally:
+            self.active_run = None
+            workflow_service.run_lock.release()
+            await self._close_browser_pool()
+
+    async def _close_browser_pool(self) -> None:
+        """Stop the browser this worker's event loop started, before the loop closes."""
+        from byte.web import BrowserPoolService
+
+        if self.app.bound(BrowserPoolService):
+            await self.app.make(BrowserPoolService).close_loop()
+
+    def cancel_run(self) -> None:
+        """Ask the run started from the TUI to stop, if one is in progress.
+
+        Usage: `tui_manager_service.cancel_run()` -> bound to ctrl+z in the conversation screen
+        """
+        run = self.active_run
+        if run is not None:
+            run.cancel()
 
     def get_panel_id(self) -> str:
         """Get the current panel ID for this thread.
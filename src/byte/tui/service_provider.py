@@ -1,6 +1,6 @@
 from byte import EventBus
 from byte.support import ServiceProvider
-from byte.tui import PromptHistoryService, TuiEvents, TUIManagerService
+from byte.tui import PromptHistoryService, StreamCoalescerService, TuiEvents, TUIManagerService
 
 
 class TUIServiceProvider(ServiceProvider):
@@ -10,6 +10,7 @@ class TUIServiceProvider(ServiceProvider):
         return [
             # keep-sorted start
             PromptHistoryService,
+            StreamCoalescerService,
             TUIManagerService,
             # keep-sorted end
         ]
@@ -6,6 +6,7 @@ from textual.binding import Binding
 from textual.containers import VerticalScroll
 from textual.css.query import NoMatches
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.worker import Worker, WorkerState
 
@@ -72,12 +73,54 @@ class Conversation(Widget):
         )
 
         self.event_bus = self.app.byte.make(EventBus)
+        self.offscreen_margin: int = self.app.byte["config"].tui.offscreen_margin
+        self._virtualize_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with VerticalScroll(id="chat-container") as vertical_scroll:
             vertical_scroll.can_focus = False
         yield PromptPanel(id="prompt").data_bind(allow_input_submit=Conversation.allow_input_submit)
 
+    def on_mount(self) -> None:
+        self.watch(self.chat_container, "scroll_y", self.schedule_virtualize, init=False)
+
+    def schedule_virtualize(self) -> None:
+        """Debounce `virtualize_panels` so scrolling and streaming don't trigger it per frame."""
+        if self._virtualize_timer is None:
+            self._virtualize_timer = self.set_timer(0.25, self.virtualize_panels)
+
+    async def virtualize_panels(self) -> None:
+        """Collapse, release, or restore panels depending on whether they are near the viewport.
+
+        Only the viewport and `tui.offscreen_margin` screen heights above and below
+        it keep their full widget trees. A settled panel outside that window is
+        replaced by a single markdown snapshot; on a later pass, once the snapshot
+        has been laid out, the snapshot itself is unmounted and only the panel's
+        height is kept. Scrolling a released panel back into the window mounts its
+        snapshot again, so rendered widgets stay bounded by what is near the
+        viewport no matter how long the session runs.
+        """
+        self._virtualize_timer = None
+        container = self.chat_container
+        panels = list(container.query_children(ResponsePanel))
+
+        viewport_height = container.scrollable_content_region.height
+        margin = viewport_height * self.offscreen_margin
+        window_top = container.scroll_y - margin
+        window_bottom = container.scroll_y + viewport_height + margin
+
+        # The latest panel is never collapsed; it may still receive messages.
+        for panel in panels[:-1]:
+            region = panel.virtual_region
+            if region.bottom >= window_top and region.y <= window_bottom:
+                await panel.restore()
+            elif not panel.is_settled:
+                continue
+            elif panel.collapsed:
+                await panel.release()
+            else:
+                await panel.collapse()
+
     def scroll_to_latest_message(self):
         container = self.chat_container
         container.refresh()
@@ -177,6 +220,7 @@ class Conversation(Widget):
         self.post_message(Messages.Status())
         self.move_focus_to_prompt()
         self.allow_input_submit = True
+        self.schedule_virtualize()
 
     @on(Messages.CreatePanel)
     async def create_panel(self, event: Messages.CreatePanel) -> None:
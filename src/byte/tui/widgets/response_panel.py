@@ -47,6 +47,97 @@ class ResponsePanel(VerticalGroup):
         self.total_output_tokens: int = 0
         self.turn_count: int = 0
         self.aggregate_usage: TokenUsageRule | None = None
+        self.open_streams: set[str] = set()
+        self.pending_asks: list[Ask] = []
+        self.collapsed: bool = False
+        self.released: bool = False
+        self.snapshot_markdown: str = ""
+
+    @property
+    def is_settled(self) -> bool:
+        """Return True when nothing in the panel is streaming, focused, or waiting on the user."""
+        if self.open_streams or self.has_focus_within:
+            return False
+        if self.current_linting is not None and self.current_linting.is_active:
+            return False
+        return all(ask.result_future.done() for ask in self.pending_asks)
+
+    def snapshot(self) -> str:
+        """Render the panel's messages as a single markdown document.
+
+        Usage: `markdown = panel.snapshot()`
+        """
+        parts = []
+        for child in self.children:
+            match child:
+                case HumanMessage():
+                    parts.append(f"❯ {child.content}")  # noqa: RUF001
+                case TextRule():
+                    parts.append(f"**{child.text}**")
+                case SelectableMarkdown():
+                    title = str(child.border_title or "").strip()
+                    parts.append(f"**{title}**\n\n{child.message}" if title else str(child.message))
+                case ToolCall() | Linting():
+                    parts.append(child.to_markdown())
+                case TokenUsageRule():
+                    parts.append(f"*{child.text}*")
+                case Markdown():
+                    parts.append(child.source)
+                case Select() | MultiSelect() | TextInput():
+                    parts.append(child.ask.question if child.ask else "")
+
+        return "\n\n".join(part for part in parts if part)
+
+    async def collapse(self) -> None:
+        """Replace every child widget with a single markdown snapshot of the panel.
+
+        Only call this on settled panels; streams, prompts and linting state are
+        released along with the widgets.
+        Usage: `await panel.collapse()`
+        """
+        if self.collapsed:
+            return
+
+        self.snapshot_markdown = self.snapshot()
+        async with self.batch():
+            await self.remove_children()
+            await self.mount(SelectableMarkdown(self.snapshot_markdown, classes="snapshot"))
+
+        self.collapsed = True
+        self.current_stream = None
+        self.streams = {}
+        self.current_linting = None
+        self.pending_asks = []
+        self.aggregate_usage = None
+
+    async def release(self) -> None:
+        """Unmount the snapshot of a collapsed panel, keeping its height so the scroll position holds.
+
+        Usage: `await panel.release()` -> once a collapsed panel is far outside the viewport
+        """
+        if not self.collapsed or self.released:
+            return
+
+        # A fixed height is applied to the box named by box-sizing: the border box (padding and
+        # border, never margin) by default, or the content area alone for content-box panels.
+        if self.styles.box_sizing == "content-box":
+            self.styles.height = self.size.height
+        else:
+            self.styles.height = self.outer_size.height
+        await self.remove_children()
+        self.released = True
+
+    async def restore(self) -> None:
+        """Mount the snapshot of a released panel again as it scrolls back into view.
+
+        Usage: `await panel.restore()`
+        """
+        if not self.released:
+            return
+
+        await self.mount(SelectableMarkdown(self.snapshot_markdown, classes="snapshot"))
+        self.styles.height = None
+        self.released = False
 
     async def add_user_message(self, event: Messages.AddUserInput):
         await self.mount(HumanMessage(f"/{event.command} {event.body}"))
@@ -62,6 +153,7 @@ class ResponsePanel(VerticalGroup):
     async def start_markdown_stream(self, border_title: str = ""):
         markdown_widget = await self.add_static_markdown("", border_title)
         self.current_stream = SelectableMarkdown.get_stream(markdown_widget)
+        self.open_streams.add("markdown")
         return self.current_stream
 
     async def add_markdown_chunk(self, chunk: str):
@@ -76,6 +168,7 @@ class ResponsePanel(VerticalGroup):
             return
 
         await self.current_stream.stop()
+        self.open_streams.discard("markdown")
 
     async def start_tool_stream(
         self,
@@ -85,6 +178,7 @@ class ResponsePanel(VerticalGroup):
         tool_widget = ToolCall(tool_name=tool_name, id=f"{tool_id}")
         await self.mount(tool_widget)
         self.streams[tool_id] = ToolCall.get_stream(tool_widget)
+        self.open_streams.add(tool_id)
         return self.streams[tool_id]
 
     async def add_tool_chunk(self, tool_id: str, chunk: str):
@@ -96,21 +190,25 @@ class ResponsePanel(VerticalGroup):
             return
 
         await self.streams[tool_id].stop()
+        self.open_streams.discard(tool_id)
 
     async def mount_select(self, ask: Ask) -> Select:
         select = Select(ask)
+        self.pending_asks.append(ask)
         await self.mount(select)
         select.focus()
         return select
 
     async def mount_multi_select(self, ask: Ask) -> MultiSelect:
         multi_select = MultiSelect(ask)
+        self.pending_asks.append(ask)
         await self.mount(multi_select)
         multi_select.focus()
         return multi_select
 
     async def mount_input(self, ask: Ask) -> TextInput:
         input_widget = TextInput(ask)
+        self.pending_asks.append(ask)
         await self.mount(input_widget)
         input_widget.focus()
         return input_widget
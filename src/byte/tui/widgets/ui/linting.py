@@ -73,6 +73,7 @@ class Linting(VerticalGroup):
             classes=classes,
             disabled=disabled,
         )
+        self.summary: str = ""
 
     def compose(self) -> ComposeResult:
         with HorizontalGroup():
@@ -143,10 +144,11 @@ class Linting(VerticalGroup):
         self.remove_class("border-top-round-secondary")
         if success:
             self.add_class("border-top-round-success")
-            label.update(f"Linting complete: {total_files} files processed, no errors")
+            self.summary = f"Linting complete: {total_files} files processed, no errors"
         else:
             self.add_class("border-top-round-error")
-            label.update(f"Linting complete: {failed_files}/{total_files} files with errors")
+            self.summary = f"Linting complete: {failed_files}/{total_files} files with errors"
+        label.update(self.summary)
 
         self.refresh(layout=True)
 
@@ -162,3 +164,8 @@ class Linting(VerticalGroup):
         results_widget.refresh(layout=True)
 
         self.refresh(layout=True)
+
+    def to_markdown(self) -> str:
+        """Return the lint summary and results as markdown for conversation snapshots."""
+        results = self.query_one("#lint-results", Markdown).source
+        return "\n\n".join(part for part in (self.summary, results) if part)
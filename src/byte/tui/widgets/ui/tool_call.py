@@ -1,7 +1,6 @@
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from partial_json_parser import OBJ, loads
 from rich.console import RenderableType
 from rich.markdown import Markdown
 from rich.text import Text
@@ -11,6 +10,7 @@ from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Collapsible
 
+from byte.support import JsonStreamParser
 from byte.tui.constants import ANGLE_DOWN, ANGLE_RIGHT
 from byte.tui.messages import Messages
 
@@ -18,19 +18,50 @@ if TYPE_CHECKING:
     from byte.tui import ByteTUI
 
 
+class ToolArgField(Widget, can_focus=False):
+    """Displays a single top-level tool call argument."""
+
+    DEFAULT_CSS = """
+    ToolArgField {
+        height: auto;
+        width: 100%;
+    }
+    """
+
+    def __init__(self, key: str | None) -> None:
+        super().__init__()
+        self.key = key
+        self._parts: list[str] = []
+
+    def append_text(self, text: str) -> None:
+        """Append streamed text to the displayed value."""
+        self._parts.append(text)
+        self.refresh(layout=True)
+
+    def set_value(self, value: Any) -> None:
+        """Replace the displayed value once it has been fully parsed."""
+        self._parts = [str(value)]
+        self.refresh(layout=True)
+
+    def render(self) -> RenderableType:
+        value = "".join(self._parts)
+        if self.key is None:
+            return Text(f"\n{value}")
+        return Text(f"\n╰─ {self.key}: {value}")
+
+
 class ToolArgs(Widget, can_focus=False):
-    """Displays streaming tool call arguments."""
+    """Displays streaming tool call arguments.
+
+    Fragments are fed to an incremental JSON parser and only the fields touched
+    by each fragment are refreshed.
+    """
 
     app: ByteTUI
 
     DEFAULT_CSS = """
     ToolArgs {
         height: auto;
-
-        & Label {
-            height: auto;
-            width: 100%;
-        }
     }
     """
 
@@ -47,38 +78,46 @@ class ToolArgs(Widget, can_focus=False):
             classes=classes,
             disabled=disabled,
         )
-        self.raw_args = ""
-
-    def render(self) -> RenderableType:
-        """Render the tool call display."""
-        try:
-            parsed = loads(self.raw_args, OBJ)
-        except Exception:
-            parsed = None
-
-        # Build the output text
-        output = Text("")
-
-        # If we have a valid parsed dictionary, display its contents
-        if parsed is not None and isinstance(parsed, dict) and parsed:
-            phase_id = parsed.get("phase_id")
-            phase_status = parsed.get("phase_status")
-            if phase_id or phase_status:
-                self.post_message(Messages.PhaseUpdated(phase_id, phase_status))
-
-            for key, value in parsed.items():
-                output.append(f"\n╰─ {key}: {value}")
-        elif self.raw_args:
-            # If parsing failed but we have raw args, show them
-            output.append(f"\n{self.raw_args}")
-
-        return output
+        self.parser = JsonStreamParser()
+        self.fields: dict[str | None, ToolArgField] = {}
+        self._showing_raw = False
+
+    async def _get_or_mount_field(self, key: str | None) -> ToolArgField:
+        field = self.fields.get(key)
+        if field is None:
+            field = ToolArgField(key)
+            self.fields[key] = field
+            await self.mount(field)
+        return field
 
     async def append(self, fragment: str) -> None:
-        self.raw_args = self.raw_args + fragment
-        self.refresh(layout=True)
+        deltas = self.parser.feed(fragment)
+
+        if self.parser.is_invalid:
+            # Not a JSON object, show the raw arguments instead: everything so far once, then each new fragment.
+            raw_field = await self._get_or_mount_field(None)
+            if self._showing_raw:
+                raw_field.append_text(fragment)
+            else:
+                raw_field.set_value(self.parser.raw())
+                self._showing_raw = True
+        else:
+            phase_changed = False
+            for delta in deltas:
+                field = await self._get_or_mount_field(delta.key)
+                if delta.complete:
+                    field.set_value(delta.value)
+                else:
+                    field.append_text(delta.text)
+                phase_changed = phase_changed or delta.key in ("phase_id", "phase_status")
+
+            if phase_changed:
+                phase_id = self.parser.value("phase_id")
+                phase_status = self.parser.value("phase_status")
+                if phase_id or phase_status:
+                    self.post_message(Messages.PhaseUpdated(phase_id, phase_status))
 
-        # Allow the task to wake up and actually display the new markdown
+        # Allow the task to wake up and actually display the new arguments
         await asyncio.sleep(0)
 
 
@@ -260,6 +299,11 @@ class ToolCall(Widget, can_focus=False):
         result_widget.message = f" {content or status}"
         result_widget.styles.display = "block"
 
+    def to_markdown(self) -> str:
+        """Return a one-line summary of the call and its result for conversation snapshots."""
+        result = str(self.query_one(ToolResult).message).strip()
+        return f"`{self.tool_name}()` {result}".rstrip()
+
     @classmethod
     def get_stream(cls, widget: ToolCall) -> ToolCallStream:
         tool_args = widget.query_one(ToolArgs)
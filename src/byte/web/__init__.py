@@ -14,15 +14,22 @@ if TYPE_CHECKING:
     from byte.web.parser.mkdocs_parser import MkDocsParser
     from byte.web.parser.raw_content_parser import RawContentParser
     from byte.web.parser.sphinx_parser import SphinxParser
+    from byte.web.schemas import CrawlResult, WebPage
+    from byte.web.service.browser_pool_service import BrowserPoolService
     from byte.web.service.chromium_service import ChromiumService
     from byte.web.service.content_cleaner import ContentCleaner
+    from byte.web.service.docs_crawler_service import DocsCrawlerService
+    from byte.web.service.web_cache_service import WebCacheEntry, WebCacheService
     from byte.web.service_provider import WebServiceProvider
     from byte.web.tools.search_web_tool import SearchWebTool
 
 __all__ = (
     "BaseWebParser",
+    "BrowserPoolService",
     "ChromiumService",
     "ContentCleaner",
+    "CrawlResult",
+    "DocsCrawlerService",
     "GenericParser",
     "GitBookParser",
     "GitHubParser",
@@ -30,16 +37,22 @@ __all__ = (
     "RawContentParser",
     "SearchWebTool",
     "SphinxParser",
+    "WebCacheEntry",
+    "WebCacheService",
     "WebConfig",
     "WebNotEnabledException",
+    "WebPage",
     "WebServiceProvider",
 )
 
 _dynamic_imports = {
     # keep-sorted start
     "BaseWebParser": "parser.base",
+    "BrowserPoolService": "service.browser_pool_service",
     "ChromiumService": "service.chromium_service",
     "ContentCleaner": "service.content_cleaner",
+    "CrawlResult": "schemas",
+    "DocsCrawlerService": "service.docs_crawler_service",
     "GenericParser": "parser.generic_parser",
     "GitBookParser": "parser.gitbook_parser",
     "GitHubParser": "parser.github_parser",
@@ -47,8 +60,11 @@ _dynamic_imports = {
     "RawContentParser": "parser.raw_content_parser",
     "SearchWebTool": "tools.search_web_tool",
     "SphinxParser": "parser.sphinx_parser",
+    "WebCacheEntry": "service.web_cache_service",
+    "WebCacheService": "service.web_cache_service",
     "WebConfig": "config",
     "WebNotEnabledException": "exceptions",
+    "WebPage": "schemas",
     "WebServiceProvider": "service_provider",
     # keep-sorted end
 }
@@ -15,3 +15,67 @@ class WebConfig(BaseModel):
     chrome_binary_location: Path | None = Field(
         description="Path to Chrome/Chromium binary executable for headless browser automation", default=None
     )
+
+    http_first: bool = Field(
+        default=True,
+        description="Fetch pages with a plain HTTP request first and only render them in Chrome when they need JavaScript or no content is found",
+    )
+
+    http_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds to wait for a plain HTTP fetch before falling back to the browser",
+    )
+
+    max_tabs: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of browser tabs used concurrently when scraping several pages",
+    )
+
+    browser_idle_timeout: float = Field(
+        default=120.0,
+        gt=0,
+        description="Seconds the headless browser stays open with no pages loading before it is shut down",
+    )
+
+    crawl_max_depth: int = Field(
+        default=2,
+        ge=0,
+        description="Navigation link levels followed from the start page when crawling documentation with /web --crawl",
+    )
+
+    crawl_max_pages: int = Field(
+        default=50,
+        ge=1,
+        description="Maximum number of pages fetched by one documentation crawl",
+    )
+
+    crawl_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of pages fetched at once while crawling",
+    )
+
+    cache_enable: bool = Field(
+        default=True,
+        description="Cache scraped pages and search results on disk in .byte/cache/web",
+    )
+
+    cache_ttl: float = Field(
+        default=86400.0,
+        ge=0,
+        description="Seconds a cached page is used without revalidating it with the server",
+    )
+
+    search_cache_ttl: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Seconds cached web search results are reused before searching again",
+    )
+
+    cache_max_age: float = Field(
+        default=2592000.0,
+        ge=0,
+        description="Seconds after which a cached page that was not fetched or revalidated again is deleted at startup; 0 keeps pages forever",
+    )
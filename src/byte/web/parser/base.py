@@ -14,6 +14,9 @@ class BaseWebParser(ABC, Bootable):
     and provide a method to extract clean text from that content.
     """
 
+    # CSS selectors for the site navigation, tried in order by extract_nav_element()
+    NAV_SELECTORS: tuple[str, ...] = ()
+
     @abstractmethod
     def can_parse(self, soup: BeautifulSoup, url: str) -> bool:
         """Determine if this parser can handle the given HTML content.
@@ -43,6 +46,27 @@ class BaseWebParser(ABC, Bootable):
         """
         pass
 
+    def extract_nav_element(self, soup: BeautifulSoup) -> Tag | None:
+        """Find the element holding the site's documentation navigation.
+
+        Used by the docs crawler to discover the other pages of a site. Must be
+        called before cleaning, which removes navigation elements.
+
+        Args:
+                soup: BeautifulSoup object containing the HTML content
+
+        Returns:
+                BeautifulSoup Tag with the navigation links, or None if not found
+
+        Usage: `nav = parser.extract_nav_element(soup)` -> Tag or None
+        """
+        for selector in self.NAV_SELECTORS:
+            element = soup.select_one(selector)
+            if element is not None:
+                return element
+
+        return None
+
     def get_cleaning_config(self) -> dict:
         """Get the cleaning pipeline configuration for this parser.
 
@@ -12,6 +12,14 @@ class GenericParser(BaseWebParser):
     so it can be used as a last resort fallback.
     """
 
+    NAV_SELECTORS = (
+        "#sidebar-content",
+        "aside nav",
+        "nav[role='navigation']",
+        "aside",
+        "nav",
+    )
+
     def can_parse(self, soup: BeautifulSoup, url: str) -> bool:
         """Check if parser can extract content from the page.
 
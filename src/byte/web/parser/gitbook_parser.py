@@ -11,6 +11,11 @@ class GitBookParser(BaseWebParser):
     and filtering out navigation, sidebars, and other non-content elements.
     """
 
+    NAV_SELECTORS = (
+        "aside#table-of-contents",
+        "aside[data-testid='table-of-contents']",
+    )
+
     def boot(self, exclude_links_ratio: float = 1.0, **kwargs) -> None:
         """Initialize GitBook parser.
 
@@ -11,6 +11,13 @@ class MkDocsParser(BaseWebParser):
     and filtering out navigation, search, and other non-content elements.
     """
 
+    NAV_SELECTORS = (
+        "nav.md-nav--primary",
+        "div.md-sidebar--primary",
+        "div.wy-menu-vertical",
+        "div.bs-sidebar",
+    )
+
     def boot(self, exclude_links_ratio: float = 1.0, **kwargs):
         """Initialize MkDocs parser.
 
@@ -11,6 +11,13 @@ class SphinxParser(BaseWebParser):
     specific HTML structure and filtering out navigation and sidebar elements.
     """
 
+    NAV_SELECTORS = (
+        "div.sidebar-tree",
+        "div.wy-menu-vertical",
+        "nav.bd-docs-nav",
+        "div.sphinxsidebarwrapper",
+    )
+
     def boot(self, exclude_links_ratio: float = 1.0, **kwargs):
         """Initialize Sphinx parser.
 
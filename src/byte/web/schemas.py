@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class WebPage:
+    """A scraped page with its markdown and the navigation links found on it.
+
+    Attributes:
+        url: The URL that was requested.
+        markdown: Cleaned markdown content of the page.
+        links: Absolute URLs from the page's navigation element, when requested.
+        canonical_url: The page's `<link rel="canonical">` target, if it declares one.
+    """
+
+    url: str
+    markdown: str
+    links: list[str] = field(default_factory=list)
+    canonical_url: str | None = None
+
+
+@dataclass
+class CrawlResult:
+    """Pages collected by a documentation crawl, in breadth-first order.
+
+    Attributes:
+        pages: Successfully scraped pages, one per canonical URL.
+        failed: URLs that could not be scraped, mapped to the error message.
+    """
+
+    pages: list[WebPage] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
@@ -0,0 +1,211 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+
+from byte import Service
+from byte.tui import Messages
+
+if TYPE_CHECKING:
+    from pydoll.browser.options import ChromiumOptions
+
+
+@dataclass
+class _LoopPool:
+    """Browser, tabs, and synchronisation primitives owned by one event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    lock: asyncio.Lock
+    semaphore: asyncio.Semaphore
+    browser: Any = None
+    idle_tabs: List[Any] = field(default_factory=list)
+    in_use: int = 0
+    idle_timer: Optional[asyncio.TimerHandle] = None
+
+
+class BrowserPoolService(Service):
+    """Keep one headless Chrome running per event loop and lend out reusable tabs.
+
+    The browser starts on the first `tab()` request rather than once per page,
+    and stays up until it has been idle for `web.browser_idle_timeout` seconds.
+    At most `web.max_tabs` tabs are in use at once; further requests wait for a
+    tab to be released. A tab that raises while borrowed is closed instead of
+    being returned, and a failure to open a tab restarts the browser.
+
+    The browser's CDP connection, the lock, the semaphore, and the idle timer
+    all belong to the loop that created them, and TUI commands and gateway runs
+    each execute on a fresh loop. Pools are therefore kept per running loop, and
+    whoever owns such a loop calls `close_loop()` before it ends, while the
+    browser can still be stopped cleanly and its temporary profile removed.
+    Usage: `async with pool.tab() as tab: await tab.go_to(url)`
+    """
+
+    def boot(self) -> None:
+        self._pools: Dict[asyncio.AbstractEventLoop, _LoopPool] = {}
+        self._pools_lock = threading.Lock()
+
+    def _browser_options(self) -> ChromiumOptions:
+        """Build headless Chrome options from the web config."""
+        from pydoll.browser.options import ChromiumOptions
+
+        options = ChromiumOptions()
+        options.add_argument("--headless=new")
+        options.binary_location = str(self.app["config"].web.chrome_binary_location)
+        options.start_timeout = 20
+        return options
+
+    async def _start_browser(self) -> tuple[Any, Any]:
+        """Launch Chrome and return it with its initial tab."""
+        from pydoll.browser.chromium import Chrome
+
+        self.emit_tui(Messages.Status("loading", "Opening browser..."))
+        browser = Chrome(options=self._browser_options())
+        return browser, await browser.start()
+
+    def _pool(self) -> _LoopPool:
+        """Return the pool of the running loop, creating it and reaping pools of closed loops."""
+        loop = asyncio.get_running_loop()
+        with self._pools_lock:
+            pool = self._pools.get(loop)
+            if pool is not None:
+                return pool
+
+            for stale in [pool for pool in self._pools.values() if pool.loop.is_closed()]:
+                del self._pools[stale.loop]
+                if stale.browser is not None:
+                    self.app["log"].warning("A browser outlived its event loop; close_loop() was not called")
+
+            pool = _LoopPool(
+                loop=loop,
+                lock=asyncio.Lock(),
+                semaphore=asyncio.Semaphore(self.app["config"].web.max_tabs),
+            )
+            self._pools[loop] = pool
+            return pool
+
+    @property
+    def running(self) -> bool:
+        """Whether a browser process is currently running on any loop."""
+        return any(pool.browser is not None for pool in self._pools.values())
+
+    async def _checkout(self, pool: _LoopPool) -> Any:
+        """Return an idle tab, starting the browser or opening a new tab as needed."""
+        async with pool.lock:
+            self._cancel_idle_timer(pool)
+            pool.in_use += 1
+
+            if pool.idle_tabs:
+                return pool.idle_tabs.pop()
+
+            try:
+                if pool.browser is None:
+                    pool.browser, tab = await self._start_browser()
+                    return tab
+
+                return await pool.browser.new_tab()
+            except Exception:
+                pool.in_use -= 1
+                await self._stop_browser(pool)
+                raise
+
+    async def _release(self, pool: _LoopPool, tab: Any, healthy: bool) -> None:
+        """Return a tab to the pool, or close it if it failed while borrowed."""
+        async with pool.lock:
+            pool.in_use -= 1
+
+            if healthy and pool.browser is not None:
+                pool.idle_tabs.append(tab)
+            else:
+                try:
+                    await tab.close()
+                except Exception as e:
+                    self.app["log"].debug(f"Could not close browser tab: {e}")
+
+            if pool.in_use == 0 and pool.browser is not None:
+                self._schedule_idle_shutdown(pool)
+
+    @asynccontextmanager
+    async def tab(self) -> AsyncIterator[Any]:
+        """Borrow a browser tab for the duration of the block.
+
+        Usage: `async with pool.tab() as tab: html = await tab.execute_script(...)`
+        """
+        pool = self._pool()
+        async with pool.semaphore:
+            tab = await self._checkout(pool)
+            healthy = False
+            try:
+                yield tab
+                healthy = True
+            finally:
+                await self._release(pool, tab, healthy)
+
+    def _schedule_idle_shutdown(self, pool: _LoopPool) -> None:
+        timeout = self.app["config"].web.browser_idle_timeout
+        pool.idle_timer = pool.loop.call_later(timeout, lambda: pool.loop.create_task(self._shutdown_if_idle(pool)))
+
+    def _cancel_idle_timer(self, pool: _LoopPool) -> None:
+        if pool.idle_timer is not None:
+            pool.idle_timer.cancel()
+            pool.idle_timer = None
+
+    async def _shutdown_if_idle(self, pool: _LoopPool) -> None:
+        async with pool.lock:
+            pool.idle_timer = None
+            if pool.in_use == 0:
+                self.app["log"].info("Closing idle browser")
+                await self._stop_browser(pool)
+
+    async def _stop_browser(self, pool: _LoopPool) -> None:
+        browser, pool.browser = pool.browser, None
+        pool.idle_tabs.clear()
+        if browser is None:
+            return
+
+        try:
+            await browser.stop()
+        except Exception as e:
+            self.app["log"].debug(f"Error stopping browser: {e}")
+
+    async def close_loop(self) -> None:
+        """Stop the browser of the running loop and forget its pool.
+
+        Usage: `await pool.close_loop()` -> in the `finally` of a worker that runs its own event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._pools_lock:
+            pool = self._pools.pop(loop, None)
+
+        if pool is not None:
+            await self._close_pool(pool)
+
+    async def _close_pool(self, pool: _LoopPool) -> None:
+        self._cancel_idle_timer(pool)
+        async with pool.lock:
+            await self._stop_browser(pool)
+
+    async def shutdown(self) -> None:
+        """Close every pooled browser immediately, regardless of borrowed tabs.
+
+        Browsers of other loops that are still running are stopped on their own loop.
+
+        Usage: `await pool.shutdown()` -> called when the application shuts down
+        """
+        loop = asyncio.get_running_loop()
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+
+        for pool in pools:
+            if pool.loop is loop:
+                await self._close_pool(pool)
+                continue
+
+            if pool.browser is None:
+                continue
+
+            try:
+                future = asyncio.run_coroutine_threadsafe(self._close_pool(pool), pool.loop)
+                await asyncio.wait_for(asyncio.wrap_future(future), timeout=10)
+            except Exception as e:
+                self.app["log"].warning(f"Could not stop the browser of another event loop: {e}")
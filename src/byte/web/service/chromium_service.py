@@ -1,33 +1,71 @@
-from typing import List, Type
-from urllib.parse import quote, unquote
-
-from bs4 import BeautifulSoup
-from pydoll.browser.chromium import Chrome
-from pydoll.browser.options import ChromiumOptions
+import asyncio
+import html
+import http.client
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Optional, Type
+from urllib.parse import quote, unquote, urljoin
 
 from byte import Service
 from byte.tui import Messages
 from byte.web.exceptions import WebNotEnabledException
-from byte.web.parser.base import BaseWebParser
-from byte.web.parser.generic_parser import GenericParser
-from byte.web.parser.gitbook_parser import GitBookParser
-from byte.web.parser.github_parser import GitHubParser
-from byte.web.parser.mkdocs_parser import MkDocsParser
-from byte.web.parser.raw_content_parser import RawContentParser
-from byte.web.parser.sphinx_parser import SphinxParser
+from byte.web.schemas import WebPage
+from byte.web.service.browser_pool_service import BrowserPoolService
 from byte.web.service.content_cleaner import ContentCleaner
+from byte.web.service.web_cache_service import WebCacheEntry, WebCacheService
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+    from byte.web.parser.base import BaseWebParser
+
+
+@dataclass
+class HttpResponse:
+    """Result of a plain HTTP fetch; `status` is 304 when a cached copy is still current."""
+
+    status: int
+    content_type: str = ""
+    body: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 class ChromiumService(Service):
     """Domain service for web scraping using headless Chrome browser.
 
     Provides utilities for fetching web pages and converting HTML content
-    to markdown format using BeautifulSoup and markdownify.
+    to markdown format using BeautifulSoup and markdownify. Static pages are
+    fetched over plain HTTP; pages that need rendering are loaded in tabs
+    borrowed from `BrowserPoolService`, so Chrome starts once per session
+    rather than once per page.
     Usage: `markdown = await chromium_service.do_scrape("https://example.com")` -> scraped content as markdown
     """
 
+    USER_AGENT: str = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0 Safari/537.36"
+    )
+    ACCEPT: str = "text/html,application/xhtml+xml,text/plain;q=0.9,*/*;q=0.5"
+    MAX_HTTP_BYTES: int = 10 * 1024 * 1024
+
+    # Visible characters below which a page with scripts is assumed to render client-side
+    MIN_STATIC_TEXT: int = 200
+
     def boot(self) -> None:
-        """Initialize the service with available parsers."""
+        """Initialize the service with available parsers.
+
+        Parsers, BeautifulSoup, and pydoll are imported here, in
+        `ContentCleaner`, and in the browser pool rather than at module level so
+        they only load on first web use.
+        """
+        from byte.web.parser.generic_parser import GenericParser
+        from byte.web.parser.gitbook_parser import GitBookParser
+        from byte.web.parser.github_parser import GitHubParser
+        from byte.web.parser.mkdocs_parser import MkDocsParser
+        from byte.web.parser.raw_content_parser import RawContentParser
+        from byte.web.parser.sphinx_parser import SphinxParser
+
         self.parsers: List[Type[BaseWebParser]] = [
             SphinxParser,
             GitBookParser,
@@ -37,6 +75,171 @@ class ChromiumService(Service):
             RawContentParser,
         ]
 
+    def _pipeline(self) -> tuple[List[BaseWebParser], ContentCleaner]:
+        """Resolve the parser chain and cleaner on the event loop, before handing them to a worker thread."""
+        return [self.app.make(parser_class) for parser_class in self.parsers], self.app.make(ContentCleaner)
+
+    async def _load_page(self, url: str) -> str:
+        """Load a URL in a pooled browser tab and return the rendered HTML."""
+        async with self.app.make(BrowserPoolService).tab() as tab:
+            await tab.go_to(url)
+            html_content = await tab.execute_script("return document.documentElement.outerHTML")
+
+        return html_content.get("result", {}).get("result", {}).get("value", "")
+
+    async def _fetch_http(self, url: str, entry: Optional[WebCacheEntry] = None) -> HttpResponse | None:
+        """Fetch a URL with a plain HTTP GET.
+
+        When a cached entry is given, its validators are sent as `If-None-Match`
+        and `If-Modified-Since`, and an unchanged page comes back as status 304
+        with no body. Returns None for anything the browser should handle
+        instead: network errors, other non-2xx responses, and content types other
+        than HTML or plain text. The request runs in a worker thread with the
+        standard library client.
+        """
+        timeout = self.app["config"].web.http_timeout
+        headers = {"User-Agent": self.USER_AGENT, "Accept": self.ACCEPT}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        def fetch() -> HttpResponse | None:
+            request = urllib.request.Request(url, headers=headers)
+            try:
+                response = urllib.request.urlopen(request, timeout=timeout)
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    return HttpResponse(status=304)
+                raise
+
+            with response:
+                content_type = response.headers.get_content_type()
+                if content_type not in ("text/html", "application/xhtml+xml", "text/plain"):
+                    return None
+                charset = response.headers.get_content_charset() or "utf-8"
+                return HttpResponse(
+                    status=response.status,
+                    content_type=content_type,
+                    body=response.read(self.MAX_HTTP_BYTES).decode(charset, errors="replace"),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+
+        try:
+            return await asyncio.to_thread(fetch)
+        except (OSError, ValueError, http.client.HTTPException) as e:
+            self.app["log"].debug(f"HTTP fetch of {url} failed, falling back to the browser: {e}")
+            return None
+
+    def _needs_javascript(self, soup: BeautifulSoup) -> bool:
+        """Guess whether static HTML is an app shell that only renders its content with JavaScript.
+
+        Pages with an empty SPA mount point, or with scripts but almost no
+        visible text, are treated as needing the browser.
+        """
+        for mount_id in ("root", "app", "__next", "__nuxt", "___gatsby"):
+            mount = soup.find(id=mount_id)
+            if mount is not None and not mount.get_text(strip=True):
+                return True
+
+        body = soup.body
+        if body is None:
+            return True
+
+        visible = sum(
+            len(text.strip())
+            for text in body.find_all(string=True)
+            if text.parent is not None and text.parent.name not in ("script", "style", "noscript", "template")
+        )
+        return visible < self.MIN_STATIC_TEXT and soup.find("script") is not None
+
+    def _parse(self, soup: BeautifulSoup, url: str, parsers: List[BaseWebParser], cleaner: ContentCleaner) -> str:
+        """Run the parser chain over a page, returning the first non-empty cleaned content."""
+        for parser in parsers:
+            if parser.can_parse(soup, url):
+                self.app["log"].info(f"Parsing with {parser.__class__.__name__}...")
+
+                # Extract content element
+                element = parser.extract_content_element(soup)
+                if element is not None:
+                    # Apply cleaning pipeline
+                    text_content = cleaner.apply_pipeline(element, **parser.get_cleaning_config())
+
+                    if text_content.strip():
+                        self.app["log"].info(f"Parsed successfully with {parser.__class__.__name__}...")
+                        return text_content
+
+        return ""
+
+    def _page_links(self, soup: BeautifulSoup, url: str, parsers: List[BaseWebParser]) -> tuple[List[str], str | None]:
+        """Collect absolute navigation links and the canonical URL of a page.
+
+        Links come from the navigation element of the first matching parser that
+        finds one. Must run before cleaning, which removes navigation.
+        """
+        links: List[str] = []
+        for parser in parsers:
+            if parser.can_parse(soup, url):
+                nav = parser.extract_nav_element(soup)
+                if nav is not None:
+                    links = [urljoin(url, anchor["href"]) for anchor in nav.find_all("a", href=True)]
+                    break
+
+        canonical = soup.find("link", rel="canonical", href=True)
+        return links, urljoin(url, canonical["href"]) if canonical is not None else None
+
+    def _convert_static(
+        self,
+        url: str,
+        response: HttpResponse,
+        parsers: List[BaseWebParser],
+        cleaner: ContentCleaner,
+        with_links: bool,
+    ) -> WebPage | None:
+        """Parse a plain HTTP response, returning None when the page has to be rendered in the browser.
+
+        Runs in a worker thread, so it must not touch the TUI.
+        """
+        if response.content_type == "text/plain":
+            # Mirror how Chrome renders plain text, so parsers see the same DOM either way
+            soup = cleaner.parse_html(f"<html><head></head><body><pre>{html.escape(response.body)}</pre></body></html>")
+            return WebPage(url=url, markdown=self._parse(soup, url, parsers, cleaner))
+
+        soup = cleaner.parse_html(response.body)
+        if self._needs_javascript(soup):
+            self.app["log"].info(f"{url} needs JavaScript, rendering in the browser")
+            return None
+
+        links, canonical_url = self._page_links(soup, url, parsers) if with_links else ([], None)
+
+        # The raw-content fallback always matches, so it would hide an empty static page
+        markdown = self._parse(soup, url, parsers[:-1], cleaner)
+        if not markdown.strip():
+            return None
+
+        return WebPage(url=url, markdown=markdown, links=links, canonical_url=canonical_url)
+
+    def _convert_rendered(
+        self,
+        url: str,
+        html_content: str,
+        parsers: List[BaseWebParser],
+        cleaner: ContentCleaner,
+        with_links: bool,
+    ) -> WebPage:
+        """Parse HTML rendered by the browser with the full parser chain. Runs in a worker thread."""
+        soup = cleaner.parse_html(html_content)
+        links, canonical_url = self._page_links(soup, url, parsers) if with_links else ([], None)
+        markdown = self._parse(soup, url, parsers, cleaner)
+        return WebPage(url=url, markdown=markdown, links=links, canonical_url=canonical_url)
+
+    def _cached_links(
+        self, url: str, html_content: str, parsers: List[BaseWebParser], cleaner: ContentCleaner
+    ) -> tuple[List[str], str | None]:
+        """Re-read navigation links from cached HTML. Runs in a worker thread."""
+        return self._page_links(cleaner.parse_html(html_content), url, parsers)
+
     async def do_scrape(self, url: str) -> str:
         """Scrape a webpage and convert it to markdown format.
 
@@ -51,122 +254,171 @@ class ChromiumService(Service):
 
         Usage: `content = await chromium_service.do_scrape("https://example.com")` -> markdown string
         """
+        return (await self.do_fetch(url)).markdown
+
+    async def do_fetch(self, url: str, with_links: bool = False) -> WebPage:
+        """Scrape a webpage into a `WebPage`, optionally with its navigation links.
+
+        Results are cached on disk by `WebCacheService`. A cached page younger
+        than `web.cache_ttl` is returned as is; an older one is revalidated with
+        a conditional request and reused if the server reports it unchanged.
+        Otherwise static pages are fetched with a plain HTTP GET and parsed
+        directly, and the page is only rendered in Chromium when HTTP fails, the
+        HTML looks like a JavaScript app shell, or no parser finds content in it.
+        Parsing and cleaning are CPU-bound, so they run in a worker thread to
+        keep the event loop and TUI responsive.
+
+        Args:
+                url: The URL to scrape
+                with_links: Also collect links from the page's navigation element
+
+        Returns:
+                The scraped page
+
+        Raises:
+                WebNotEnabledException: If web commands are not enabled in config
+
+        Usage: `page = await chromium_service.do_fetch(url, with_links=True)` -> WebPage
+        """
         # Check if web commands are enabled in configuration
-        if not self.app["config"].web.enable:
+        config = self.app["config"].web
+        if not config.enable:
             raise WebNotEnabledException
 
-        options = ChromiumOptions()
-        options.add_argument("--headless=new")
-        options.binary_location = str(self.app["config"].web.chrome_binary_location)
-        options.start_timeout = 20
-
-        async with Chrome(options=options) as browser:
-            self.emit_tui(Messages.Status("loading", "Opening browser..."))
-            tab = await browser.start()
+        parsers, cleaner = self._pipeline()
+        cache = self.app.make(WebCacheService) if config.cache_enable else None
+        entry = cache.get(url) if cache is not None else None
+        if entry is not None and entry.age() < config.cache_ttl:
+            self.app["log"].info(f"Using cached copy of {url}")
+            return await self._cached_page(entry, parsers, cleaner, with_links)
+
+        self.emit_tui(Messages.Status("loading", f"Loading {url}..."))
+
+        page = None
+        response = None
+        if config.http_first:
+            response = await self._fetch_http(url, entry)
+            if response is not None and response.status == 304 and entry is not None and cache is not None:
+                self.app["log"].info(f"{url} is unchanged, using cached copy")
+                cache.touch(entry)
+                self.emit_tui(Messages.Status())
+                return await self._cached_page(entry, parsers, cleaner, with_links)
 
-            self.emit_tui(Messages.Status("loading", f"Loading {url}..."))
-            await tab.go_to(url)
+            if response is not None and response.status != 304:
+                self.emit_tui(Messages.Status("loading", "Converting to markdown..."))
+                page = await asyncio.to_thread(self._convert_static, url, response, parsers, cleaner, with_links)
 
-            self.emit_tui(Messages.Status("loading", "Extracting content..."))
-            html_content = await tab.execute_script("return document.documentElement.outerHTML")
+        source = response.body if response is not None else ""
+        if page is None or not page.markdown.strip():
+            # Validators from the static response do not describe what the browser renders
+            response = None
+            source = await self._load_page(url)
 
             self.emit_tui(Messages.Status("loading", "Converting to markdown..."))
-            html_content = html_content.get("result", {}).get("result", {}).get("value", "")
+            page = await asyncio.to_thread(self._convert_rendered, url, source, parsers, cleaner, with_links)
+
+        if cache is not None and page.markdown.strip():
+            cache.put(
+                url,
+                source,
+                page.markdown,
+                etag=response.etag if response is not None else None,
+                last_modified=response.last_modified if response is not None else None,
+            )
 
-            soup = BeautifulSoup(
-                html_content,
-                "html.parser",
+        self.emit_tui(Messages.Status())
+        return page
+
+    async def _cached_page(
+        self, entry: WebCacheEntry, parsers: List[BaseWebParser], cleaner: ContentCleaner, with_links: bool
+    ) -> WebPage:
+        """Build a page from a cache entry, re-reading links from the cached HTML when asked."""
+        page = WebPage(url=entry.url, markdown=entry.markdown)
+        source = self.app.make(WebCacheService).get_html(entry) if with_links else None
+        if source:
+            page.links, page.canonical_url = await asyncio.to_thread(
+                self._cached_links, entry.url, source, parsers, cleaner
             )
+        return page
 
-            # Try to find a suitable parser for this content
-            text_content = ""
-            for parser_class in self.parsers:
-                parser = self.app.make(parser_class)
-                if parser.can_parse(soup, url):
-                    self.emit_tui(Messages.Status("loading", f"Parsing with {parser.__class__.__name__}..."))
-                    self.app["log"].info(f"Parsing with {parser.__class__.__name__}...")
-
-                    # Extract content element
-                    element = parser.extract_content_element(soup)
-                    if element is not None:
-                        # Apply cleaning pipeline
-                        cleaner = self.app.make(ContentCleaner)
-                        config = parser.get_cleaning_config()
-                        text_content = cleaner.apply_pipeline(element, **config)
-
-                        if text_content.strip():
-                            self.app["log"].info(f"Parsed successfully with {parser.__class__.__name__}...")
-                            break
+    async def do_scrape_many(self, urls: List[str]) -> List[str | BaseException]:
+        """Scrape several webpages concurrently, each in its own pooled tab.
 
-            self.emit_tui(Messages.Status())
-            return text_content
+        Concurrency is capped by `web.max_tabs`. Results keep the order of `urls`;
+        a page that fails yields its exception instead of failing the others.
+        Usage: `pages = await chromium_service.do_scrape_many(["https://a.dev", "https://b.dev"])`
+        """
+        if not self.app["config"].web.enable:
+            raise WebNotEnabledException
+
+        return await asyncio.gather(*(self.do_scrape(url) for url in urls), return_exceptions=True)
+
+    def _parse_search_results(self, html_content: str, cleaner: ContentCleaner) -> List[dict]:
+        """Extract titles, links, and snippets from a DuckDuckGo Lite results page. Runs in a worker thread."""
+        soup = cleaner.parse_html(html_content)
+
+        results = []
+        current: dict | None = None
+        position = 0
+
+        for tag in soup.find_all(["a", "td"]):
+            if tag.name == "a" and "result-link" in tag.get("class", []):
+                if current and current.get("link"):
+                    results.append(current)
+                raw_href = tag.get("href", "")
+                if raw_href.startswith("//duckduckgo.com/l/?uddg="):
+                    encoded = raw_href.split("uddg=", 1)[1]
+                    if "&" in encoded:
+                        encoded = encoded[: encoded.index("&")]
+                    raw_href = unquote(encoded)
+                position += 1
+                current = {
+                    "title": tag.get_text(strip=True),
+                    "link": raw_href,
+                    "snippet": "",
+                    "position": position,
+                }
+            elif tag.name == "td" and "result-snippet" in tag.get("class", []) and current is not None:
+                current["snippet"] = tag.get_text(strip=True)
+
+        if current and current.get("link"):
+            results.append(current)
+
+        return results
 
     async def do_search(self, query: str) -> str:
         """ """
         # Check if web commands are enabled in configuration
-        if not self.app["config"].web.enable:
+        config = self.app["config"].web
+        if not config.enable:
             raise WebNotEnabledException
 
-        options = ChromiumOptions()
-        options.add_argument("--headless=new")
-        options.binary_location = str(self.app["config"].web.chrome_binary_location)
-        options.start_timeout = 20
+        cache = self.app.make(WebCacheService) if config.cache_enable else None
+        if cache is not None:
+            cached = cache.get_search(query, config.search_cache_ttl)
+            if cached is not None:
+                self.app["log"].info(f"Using cached search results for {query}")
+                return cached
 
-        async with Chrome(options=options) as browser:
-            self.emit_tui(Messages.Status("loading", "Opening browser..."))
-            tab = await browser.start()
+        self.emit_tui(Messages.Status("loading", f"Searching for {query}..."))
+        html_content = await self._load_page(f"https://lite.duckduckgo.com/lite/?q={quote(query)}")
 
-            self.emit_tui(Messages.Status("loading", f"Searching for {query}..."))
-            await tab.go_to(f"https://lite.duckduckgo.com/lite/?q={quote(query)}")
+        self.emit_tui(Messages.Status("loading", "Parsing results..."))
+        results = await asyncio.to_thread(self._parse_search_results, html_content, self.app.make(ContentCleaner))
 
-            self.emit_tui(Messages.Status("loading", "Extracting content..."))
-            html_content = await tab.execute_script("return document.documentElement.outerHTML")
+        if not results:
+            self.emit_tui(Messages.Status())
+            return "No results found. Try rephrasing your search."
 
-            self.emit_tui(Messages.Status("loading", "Parsing results..."))
-            html_content = html_content.get("result", {}).get("result", {}).get("value", "")
-
-            soup = BeautifulSoup(html_content, "html.parser")
-
-            results = []
-            current: dict | None = None
-            position = 0
-
-            for tag in soup.find_all(["a", "td"]):
-                if tag.name == "a" and "result-link" in tag.get("class", []):
-                    if current and current.get("link"):
-                        results.append(current)
-                    raw_href = tag.get("href", "")
-                    if raw_href.startswith("//duckduckgo.com/l/?uddg="):
-                        encoded = raw_href.split("uddg=", 1)[1]
-                        if "&" in encoded:
-                            encoded = encoded[: encoded.index("&")]
-                        raw_href = unquote(encoded)
-                    position += 1
-                    current = {
-                        "title": tag.get_text(strip=True),
-                        "link": raw_href,
-                        "snippet": "",
-                        "position": position,
-                    }
-                elif tag.name == "td" and "result-snippet" in tag.get("class", []) and current is not None:
-                    current["snippet"] = tag.get_text(strip=True)
-
-            if current and current.get("link"):
-                results.append(current)
-
-            if not results:
-                self.emit_tui(Messages.Status())
-                return "No results found. Try rephrasing your search."
-
-            lines = [f"Found {len(results)} search results:\n"]
-            for result in results:
-                lines.append(
-                    f"{result['position']}. {result['title']}\n"
-                    f"   URL: {result['link']}\n"
-                    f"   Summary: {result['snippet']}\n"
-                )
+        lines = [f"Found {len(results)} search results:\n"]
+        for result in results:
+            lines.append(
+                f"{result['position']}. {result['title']}\n   URL: {result['link']}\n   Summary: {result['snippet']}\n"
+            )
 
-            text_content = "\n".join(lines)
+        text_content = "\n".join(lines)
+        if cache is not None:
+            cache.put_search(query, text_content)
 
-            self.emit_tui(Messages.Status())
-            return text_content
+        self.emit_tui(Messages.Status())
+        return text_content
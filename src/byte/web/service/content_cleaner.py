@@ -1,70 +1,124 @@
-from bs4.element import Comment, NavigableString, Tag
-from markdownify import markdownify
+import importlib.util
+from typing import TYPE_CHECKING
 
 from byte import Service
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    from bs4.element import Tag
+
+# Marks where a block element ends while text is collected from an explicit stack
+_BLOCK_END = object()
+
 
 class ContentCleaner(Service):
     """Service for cleaning and converting HTML content to markdown.
 
     Provides a reusable pipeline for processing scraped web content including
-    element removal, link density filtering, and markdown conversion.
-    Usage: `cleaned = await cleaner.apply_pipeline(soup_element)` -> markdown string
+    element removal, link density filtering, and markdown conversion. Pages are
+    parsed with lxml when it is installed, element removal and link density
+    filtering share one traversal, and the markdown converter works on the tree
+    directly instead of re-parsing serialized HTML. Everything here is
+    synchronous and stateless, so `ChromiumService` runs it in a worker thread.
+    Usage: `cleaned = cleaner.apply_pipeline(soup_element)` -> markdown string
     """
 
+    UNWANTED_TAGS: tuple[str, ...] = ("script", "noscript", "style", "nav", "header", "footer", "aside")
+
+    # Containers whose link-to-text ratio is checked by the link density filter
+    DENSITY_TAGS: tuple[str, ...] = ("div", "section")
+
     def boot(self) -> None:
         """Initialize the content cleaner with default settings."""
-        pass
+        self.features = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
 
-    def remove_unwanted_elements(
+    def parse_html(self, markup: str) -> BeautifulSoup:
+        """Parse an HTML document, using lxml when available and the stdlib parser otherwise.
+
+        Usage: `soup = cleaner.parse_html(html)` -> BeautifulSoup
+        """
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(markup, self.features)
+
+    def clean_tree(
         self,
         element: Tag,
-        tags_to_remove: list[str] | None = None,
+        tags_to_remove: tuple[str, ...] | list[str] = (),
+        max_ratio: float | None = None,
     ) -> Tag:
-        """Remove unwanted HTML elements like scripts, styles, and navigation.
+        """Remove unwanted tags and link-heavy sections in a single traversal.
+
+        Text and link-text lengths are accumulated bottom-up while walking the
+        tree once with an explicit stack, instead of re-walking every section's
+        subtree to compute its ratio. Removed tags do not count towards their
+        ancestors' text, matching removal before filtering. `element` itself is
+        never removed.
 
         Args:
-            element: BeautifulSoup element to clean
-            tags_to_remove: List of tag names to remove (uses defaults if None)
+            element: BeautifulSoup element to clean in place
+            tags_to_remove: Tag names to remove with their contents
+            max_ratio: Maximum link-to-text ratio for div and section elements, or None to keep them all
 
         Returns:
             Cleaned BeautifulSoup element
 
-        Usage: `cleaned = cleaner.remove_unwanted_elements(soup)` -> cleaned element
+        Usage: `cleaned = cleaner.clean_tree(soup, ["script"], max_ratio=0.5)` -> cleaned element
         """
-        if tags_to_remove is None:
-            tags_to_remove = [
-                "script",
-                "noscript",
-                "style",
-                "nav",
-                "header",
-                "footer",
-                "aside",
-            ]
-
-        for tag in tags_to_remove:
-            for el in element.find_all(tag):
-                el.decompose()
+        from bs4.element import CData, NavigableString, Tag
+
+        remove = frozenset(tags_to_remove)
+        doomed: list[Tag] = []
+
+        # Each frame is (tag, inside a link, child iterator, [text length, link text length])
+        stack = [(element, element.name == "a", iter(element.children), [0, 0])]
+        while stack:
+            node, in_link, children, counts = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                stack.pop()
+                total, links = counts
+                if stack:
+                    parent_counts = stack[-1][3]
+                    parent_counts[0] += total
+                    parent_counts[1] += links
+                    if max_ratio is not None and node.name in self.DENSITY_TAGS and total and links / total > max_ratio:
+                        doomed.append(node)
+            elif isinstance(child, Tag):
+                if child.name in remove:
+                    doomed.append(child)
+                else:
+                    stack.append((child, in_link or child.name == "a", iter(child.children), [0, 0]))
+            elif type(child) in (NavigableString, CData):
+                length = len(child.strip())
+                counts[0] += length
+                if in_link:
+                    counts[1] += length
+
+        # Descendants are always recorded before their ancestors
+        for tag in doomed:
+            tag.decompose()
 
         return element
 
-    def _get_link_ratio(self, section: Tag) -> float:
-        """Calculate the ratio of link text to total text in a section.
+    def remove_unwanted_elements(
+        self,
+        element: Tag,
+        tags_to_remove: list[str] | None = None,
+    ) -> Tag:
+        """Remove unwanted HTML elements like scripts, styles, and navigation.
 
         Args:
-            section: BeautifulSoup element to analyze
+            element: BeautifulSoup element to clean
+            tags_to_remove: List of tag names to remove (uses defaults if None)
 
         Returns:
-            Ratio of link text to total text (0.0 to 1.0)
-        """
-        links = section.find_all("a")
-        total_text = "".join(str(s) for s in section.stripped_strings)
-        if len(total_text) == 0:
-            return 0.0
+            Cleaned BeautifulSoup element
 
-        link_text = "".join(str(string.string.strip()) for link in links for string in link.strings if string)
-        return len(link_text) / len(total_text)
+        Usage: `cleaned = cleaner.remove_unwanted_elements(soup)` -> cleaned element
+        """
+        return self.clean_tree(element, self.UNWANTED_TAGS if tags_to_remove is None else tags_to_remove)
 
     def filter_by_link_density(
         self,
@@ -82,11 +136,7 @@ class ContentCleaner(Service):
 
         Usage: `filtered = cleaner.filter_by_link_density(soup, 0.5)` -> filtered element
         """
-        for section in element.find_all(["div", "section"]):
-            if self._get_link_ratio(section) > max_ratio:
-                section.decompose()
-
-        return element
+        return self.clean_tree(element, max_ratio=max_ratio)
 
     def normalize_whitespace(self, element: Tag) -> Tag:
         """Normalize whitespace in HTML element while preserving structure.
@@ -113,15 +163,18 @@ class ContentCleaner(Service):
 
         Usage: `markdown = cleaner.convert_to_markdown(soup)` -> markdown string
         """
-        return markdownify(
-            str(element),
-            heading_style="ATX",
-            bullets="-",
-            strip=["script", "style"],
-        ).strip()
+        from markdownify import MarkdownConverter
+
+        # Merge the adjacent strings left behind by removed elements, as re-parsing serialized HTML would
+        element.smooth()
+        converter = MarkdownConverter(heading_style="ATX", bullets="-", strip=["script", "style"])
+        return converter.convert_soup(element).strip()
 
     def _process_element(self, element, elements_to_skip: list, newline_elements: list) -> str:
-        """Traverse through HTML tree recursively to preserve newline and skip unwanted elements.
+        """Collect the text of an HTML tree, skipping unwanted elements and ending blocks with newlines.
+
+        Walks the tree with an explicit stack rather than recursion, so deeply
+        nested pages cannot hit the recursion limit.
 
         Args:
             element: Element to process
@@ -131,28 +184,31 @@ class ContentCleaner(Service):
         Returns:
             Processed text content
         """
-        tag_name = getattr(element, "name", None)
-        if isinstance(element, Comment) or tag_name in elements_to_skip:
-            return ""
-        elif isinstance(element, NavigableString):
-            return str(element)
-        elif tag_name == "br":
-            return "\n"
-        elif tag_name in newline_elements:
-            return (
-                "".join(
-                    self._process_element(child, elements_to_skip, newline_elements)
-                    for child in element.children
-                    if isinstance(child, Tag | NavigableString | Comment)
-                )
-                + "\n"
-            )
-        else:
-            return "".join(
-                self._process_element(child, elements_to_skip, newline_elements)
-                for child in element.children
-                if isinstance(child, Tag | NavigableString | Comment)
-            )
+        from bs4.element import Comment, NavigableString
+
+        skip = frozenset(elements_to_skip)
+        newline = frozenset(newline_elements)
+        parts: list[str] = []
+
+        stack = [element]
+        while stack:
+            node = stack.pop()
+            if node is _BLOCK_END:
+                parts.append("\n")
+            elif isinstance(node, Comment):
+                continue
+            elif isinstance(node, NavigableString):
+                parts.append(str(node))
+            elif node.name in skip:
+                continue
+            elif node.name == "br":
+                parts.append("\n")
+            else:
+                if node.name in newline:
+                    stack.append(_BLOCK_END)
+                stack.extend(reversed(node.contents))
+
+        return "".join(parts)
 
     def get_clean_text(self, element: Tag) -> str:
         """Extract cleaned text with newlines preserved and irrelevant elements removed.
@@ -238,11 +294,12 @@ class ContentCleaner(Service):
 
         Usage: `result = cleaner.apply_pipeline(soup, filter_links=True)` -> cleaned content
         """
-        if remove_unwanted:
-            element = self.remove_unwanted_elements(element)
-
-        if filter_links:
-            element = self.filter_by_link_density(element, link_ratio)
+        if remove_unwanted or filter_links:
+            element = self.clean_tree(
+                element,
+                self.UNWANTED_TAGS if remove_unwanted else (),
+                link_ratio if filter_links else None,
+            )
 
         if normalize:
             element = self.normalize_whitespace(element)
@@ -0,0 +1,153 @@
+import asyncio
+from typing import List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from byte import Service
+from byte.tui import Messages
+from byte.web.exceptions import WebNotEnabledException
+from byte.web.schemas import CrawlResult, WebPage
+from byte.web.service.chromium_service import ChromiumService
+
+
+class DocsCrawlerService(Service):
+    """Crawl a documentation site by following its navigation links.
+
+    Starting from one URL, pages are fetched breadth-first through
+    `ChromiumService`, so they share its HTTP tier, browser pool, and cache.
+    Only links from the navigation element detected by the site's parser are
+    followed, and only on the same host. Pages are deduplicated by canonical URL
+    and the crawl stops at `web.crawl_max_depth` levels or
+    `web.crawl_max_pages` pages. At most `web.crawl_concurrency` pages are
+    fetched at once.
+    Usage: `result = await crawler.crawl("https://docs.example.com/")` -> CrawlResult
+    """
+
+    # Links to these are downloads or assets rather than documentation pages
+    SKIP_EXTENSIONS: tuple[str, ...] = (
+        ".css",
+        ".gif",
+        ".ico",
+        ".jpeg",
+        ".jpg",
+        ".js",
+        ".json",
+        ".pdf",
+        ".png",
+        ".svg",
+        ".tar.gz",
+        ".webp",
+        ".whl",
+        ".xml",
+        ".zip",
+    )
+
+    @staticmethod
+    def canonical_url(url: str) -> str:
+        """Normalize a URL so that links to the same page compare equal.
+
+        Lowercases the scheme and host, drops default ports and the fragment,
+        and treats `index.html` as its directory.
+        Usage: `DocsCrawlerService.canonical_url("HTTPS://Docs.dev:443/a/index.html#x")` -> "https://docs.dev/a/"
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        if parts.port is not None and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+            host = f"{host}:{parts.port}"
+
+        path = parts.path or "/"
+        for index in ("index.html", "index.htm"):
+            if path.endswith(f"/{index}"):
+                path = path[: -len(index)]
+
+        return urlunsplit((scheme, host, path, parts.query, ""))
+
+    def _in_scope(self, url: str, root: str) -> bool:
+        """Whether a link is an HTML page on the same site as the crawl root."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or parts.netloc != urlsplit(root).netloc:
+            return False
+
+        return not parts.path.lower().endswith(self.SKIP_EXTENSIONS)
+
+    async def crawl(
+        self,
+        start_url: str,
+        max_depth: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> CrawlResult:
+        """Crawl a documentation site breadth-first from a start URL.
+
+        Args:
+                start_url: The first page to fetch
+                max_depth: Link levels to follow from the start page (defaults to `web.crawl_max_depth`)
+                max_pages: Maximum number of pages to fetch (defaults to `web.crawl_max_pages`)
+
+        Returns:
+                The pages scraped, in breadth-first order, and the URLs that failed
+
+        Raises:
+                WebNotEnabledException: If web commands are not enabled in config
+
+        Usage: `result = await crawler.crawl(url, max_depth=1)` -> CrawlResult
+        """
+        config = self.app["config"].web
+        if not config.enable:
+            raise WebNotEnabledException
+
+        max_depth = config.crawl_max_depth if max_depth is None else max_depth
+        max_pages = config.crawl_max_pages if max_pages is None else max_pages
+
+        chromium_service = self.app.make(ChromiumService)
+        semaphore = asyncio.Semaphore(config.crawl_concurrency)
+        result = CrawlResult()
+        root = self.canonical_url(start_url)
+        queued = {root}
+        stored: set[str] = set()
+        attempted = 0
+
+        async def fetch(url: str) -> WebPage:
+            nonlocal attempted
+            async with semaphore:
+                page = await chromium_service.do_fetch(url, with_links=True)
+            attempted += 1
+            self.emit_tui(Messages.Status("loading", f"Crawled {attempted} of up to {max_pages} pages: {url}"))
+            return page
+
+        frontier = [root]
+        for depth in range(max_depth + 1):
+            frontier = frontier[: max_pages - len(result.pages) - len(result.failed)]
+            if not frontier:
+                break
+
+            pages = await asyncio.gather(*(fetch(url) for url in frontier), return_exceptions=True)
+
+            next_frontier: List[str] = []
+            for url, page in zip(frontier, pages):
+                if isinstance(page, WebNotEnabledException):
+                    raise page
+                if isinstance(page, BaseException):
+                    self.app["log"].warning(f"Could not crawl {url}: {page}")
+                    result.failed[url] = str(page)
+                    continue
+
+                key = self.canonical_url(page.canonical_url or url)
+                if key in stored or not page.markdown.strip():
+                    continue
+                stored.add(key)
+                result.pages.append(page)
+
+                if depth == max_depth:
+                    continue
+
+                for link in page.links:
+                    link = self.canonical_url(link)
+                    if link not in queued and self._in_scope(link, root):
+                        queued.add(link)
+                        next_frontier.append(link)
+
+            frontier = next_frontier
+
+        self.emit_tui(Messages.Status())
+        self.app["log"].info(f"Crawled {len(result.pages)} pages from {start_url}, {len(result.failed)} failed")
+        return result
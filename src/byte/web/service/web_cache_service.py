@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+from byte import Service
+
+
+@dataclass
+class WebCacheEntry:
+    """Cached result of scraping one URL."""
+
+    url: str
+    markdown: str
+    html_hash: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def age(self) -> float:
+        """Seconds since the entry was fetched or last revalidated."""
+        return time.time() - self.fetched_at
+
+
+class WebCacheService(Service):
+    """On-disk cache of scraped pages and search results in `.byte/cache/web`.
+
+    Each URL has a small JSON index entry, named by the URL's hash, holding the
+    cleaned markdown, the HTTP validators (`ETag`, `Last-Modified`), and the
+    hash of the raw HTML. Raw HTML is stored content-addressed under `html/`, so
+    identical pages share one file. Search results are cached by query under
+    `search/`. All writes go through a temp file and `os.replace`.
+
+    Once the application has booted, pages older than `web.cache_max_age`,
+    expired search results, and HTML that no remaining page refers to are
+    deleted in a worker thread.
+    Usage: `entry = cache.get(url)` -> `WebCacheEntry` or None
+    """
+
+    def boot(self) -> None:
+        self.root = self.app.cache_path("web")
+
+    @staticmethod
+    def _key(value: str) -> str:
+        return hashlib.sha256(value.encode()).hexdigest()
+
+    def _write(self, path: Path, data: bytes) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.app["log"].warning(f"Could not write web cache file {path}: {e}")
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            return orjson.loads(path.read_bytes())
+        except OSError, orjson.JSONDecodeError:
+            return None
+
+    def get(self, url: str) -> Optional[WebCacheEntry]:
+        """Return the cached entry for a URL, fresh or not."""
+        data = self._read(self.root / "pages" / f"{self._key(url)}.json")
+        if data is None:
+            return None
+
+        try:
+            return WebCacheEntry(**data)
+        except TypeError:
+            return None
+
+    def get_html(self, entry: WebCacheEntry) -> Optional[str]:
+        """Return the raw HTML a cached entry was parsed from."""
+        try:
+            return (self.root / "html" / f"{entry.html_hash}.html").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        markdown: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> WebCacheEntry:
+        """Store the raw HTML and cleaned markdown of a freshly fetched URL.
+
+        Usage: `cache.put(url, html, markdown, etag=response.etag)`
+        """
+        html_hash = self._key(html)
+        html_path = self.root / "html" / f"{html_hash}.html"
+        if not html_path.exists():
+            self._write(html_path, html.encode())
+
+        entry = WebCacheEntry(
+            url=url,
+            markdown=markdown,
+            html_hash=html_hash,
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self._write(self.root / "pages" / f"{self._key(url)}.json", orjson.dumps(asdict(entry)))
+        return entry
+
+    def touch(self, entry: WebCacheEntry) -> WebCacheEntry:
+        """Mark an entry as fresh again after the server confirmed it is unchanged."""
+        entry.fetched_at = time.time()
+        self._write(self.root / "pages" / f"{self._key(entry.url)}.json", orjson.dumps(asdict(entry)))
+        return entry
+
+    def get_search(self, query: str, ttl: float) -> Optional[str]:
+        """Return cached search results for a query if they are younger than `ttl` seconds."""
+        data = self._read(self.root / "search" / f"{self._key(query)}.json")
+        if data is None or time.time() - data.get("fetched_at", 0) >= ttl:
+            return None
+        return data.get("results")
+
+    def put_search(self, query: str, results: str) -> None:
+        """Store formatted search results for a query."""
+        payload = {"query": query, "results": results, "fetched_at": time.time()}
+        self._write(self.root / "search" / f"{self._key(query)}.json", orjson.dumps(payload))
+
+    def _unlink(self, path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError as e:
+            self.app["log"].debug(f"Could not delete web cache file {path}: {e}")
+            return False
+
+    def prune(self) -> dict[str, int]:
+        """Delete expired pages and search results, then the HTML no page refers to any more.
+
+        Blocks on the filesystem, so call it from a worker thread.
+        Usage: `removed = cache.prune()` -> `{"pages": 3, "search": 1, "html": 2}`
+        """
+        config = self.app["config"].web
+        started = time.time()
+        removed = {"pages": 0, "search": 0, "html": 0}
+        referenced: set[str] = set()
+
+        for path in (self.root / "pages").glob("*.json"):
+            data = self._read(path)
+            if not isinstance(data, dict) or (
+                config.cache_max_age > 0 and started - data.get("fetched_at", 0) >= config.cache_max_age
+            ):
+                removed["pages"] += self._unlink(path)
+            elif data.get("html_hash"):
+                referenced.add(data["html_hash"])
+
+        for path in (self.root / "search").glob("*.json"):
+            data = self._read(path)
+            if not isinstance(data, dict) or started - data.get("fetched_at", 0) >= config.search_cache_ttl:
+                removed["search"] += self._unlink(path)
+
+        for path in (self.root / "html").glob("*.html"):
+            if path.stem in referenced:
+                continue
+            try:
+                # A page written while pruning may not be indexed yet
+                if path.stat().st_mtime >= started:
+                    continue
+            except OSError:
+                continue
+            removed["html"] += self._unlink(path)
+
+        return removed
+
+    async def prune_hook(self, *args) -> None:
+        """Prune the cache in a worker thread; registered as a booted callback.
+
+        Usage: `app.booted(web_cache_service.prune_hook)`
+        """
+        removed = await asyncio.to_thread(self.prune)
+        self.app["log"].debug(f"Pruned web cache: {removed}")
@@ -1,15 +1,19 @@
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from byte import Service, ServiceProvider
-from byte.web import ChromiumService, SearchWebTool
+from byte.web import BrowserPoolService, ChromiumService, DocsCrawlerService, SearchWebTool, WebCacheService
 from byte.web.service.content_cleaner import ContentCleaner
 
+if TYPE_CHECKING:
+    from byte.foundation import Application
+
 
 class WebServiceProvider(ServiceProvider):
     """Service provider for web browser automation and interaction.
 
     Registers the Chromium service for headless browser operations,
-    web scraping, and page interaction capabilities.
+    web scraping, and page interaction capabilities, and closes the pooled
+    browser on shutdown.
     Usage: Register with container to enable web automation features
     """
 
@@ -24,7 +28,23 @@ class WebServiceProvider(ServiceProvider):
     def services(self) -> List[Type[Service]]:
         return [
             # keep-sorted start
+            BrowserPoolService,
             ChromiumService,
             ContentCleaner,
+            DocsCrawlerService,
+            WebCacheService,
             # keep-sorted end
         ]
+
+    async def boot(self) -> None:
+        """Prune expired entries from the web cache once the application has booted."""
+        if self.app["config"].web.cache_enable:
+            web_cache_service = self.app.make(WebCacheService)
+            self.app.booted(web_cache_service.prune_hook)
+
+    async def shutdown(self, app: Application) -> None:
+        """Close the pooled browser if one was started."""
+        if not app.bound(BrowserPoolService):
+            return
+
+        await app.make(BrowserPoolService).shutdown()
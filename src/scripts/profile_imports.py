@@ -0,0 +1,95 @@
+"""Report where Byte spends its import time.
+
+Runs `python -X importtime` on a module in a fresh interpreter, then groups the
+self time of every imported module by top-level package and lists the slowest
+modules by cumulative time.
+
+Usage: `uv run python src/scripts/profile_imports.py`
+Usage: `uv run python src/scripts/profile_imports.py --module byte.web --top 15`
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def collect_import_times(module: str) -> List[ImportTiming]:
+    """Import a module under `-X importtime` and parse the timings written to stderr.
+
+    Usage: `collect_import_times("byte.main")` -> [ImportTiming("byte.main", 120, 2400000, 0), ...]
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+
+    timings = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        timings.append(ImportTiming(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return timings
+
+
+def group_by_package(timings: List[ImportTiming]) -> Dict[str, int]:
+    """Sum self time per top-level package, slowest first.
+
+    Usage: `group_by_package(timings)` -> {"langchain_core": 410000, "textual": 220000, ...}
+    """
+    by_package: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        by_package[timing.module.split(".")[0]] += timing.self_us
+    return dict(sorted(by_package.items(), key=lambda item: item[1], reverse=True))
+
+
+def format_report(module: str, timings: List[ImportTiming], top: int) -> str:
+    """Render the package and module tables as plain text."""
+    total_us = sum(timing.self_us for timing in timings)
+    lines = [f"import {module}: {total_us / 1000:.0f} ms across {len(timings)} modules", ""]
+
+    lines.append(f"{'package':<32} {'self ms':>10} {'share':>7}")
+    for package, self_us in list(group_by_package(timings).items())[:top]:
+        lines.append(f"{package:<32} {self_us / 1000:>10.1f} {self_us / total_us:>7.1%}")
+
+    lines.append("")
+    lines.append(f"{'module':<56} {'cumulative ms':>14}")
+    slowest = sorted(timings, key=lambda timing: timing.cumulative_us, reverse=True)
+    for timing in slowest[:top]:
+        lines.append(f"{timing.module:<56} {timing.cumulative_us / 1000:>14.1f}")
+
+    return "\n".join(lines)
+
+
+def main():
+    """Entry point for the script.
+
+    Usage: `python src/scripts/profile_imports.py`
+    """
+    parser = argparse.ArgumentParser(description="Profile Byte's import time by package.")
+    parser.add_argument("--module", default="byte.main", help="Module to import (default: byte.main)")
+    parser.add_argument("--top", type=int, default=25, help="Number of rows per table (default: 25)")
+    args = parser.parse_args()
+
+    timings = collect_import_times(args.module)
+    print(format_report(args.module, timings, args.top))
+
+
+if __name__ == "__main__":
+    main()
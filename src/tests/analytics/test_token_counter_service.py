@@ -0,0 +1,93 @@
+"""Test suite for TokenCounterService."""
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.analytics import TokenCounterService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide AnalyticsProvider for token counter tests."""
+    from byte.analytics import AnalyticsProvider
+
+    return [AnalyticsProvider]
+
+
+@pytest.fixture
+def counter(application: Application) -> TokenCounterService:
+    """Create a TokenCounterService that uses the character ratio instead of a tokenizer."""
+    service = application.make(TokenCounterService)
+    service._encoding_loaded = True
+    service._encoding = None
+    return service
+
+
+@pytest.mark.asyncio
+async def test_counts_fall_back_to_character_ratio(counter: TokenCounterService):
+    """Without a tokenizer, counts round up characters divided by CHARS_PER_TOKEN."""
+    assert counter.count("") == 0
+    assert counter.count("abcdefghi") == 3
+
+
+@pytest.mark.asyncio
+async def test_fragments_are_cached_by_hash(counter: TokenCounterService):
+    """Counting the same fragment twice only tokenizes it once."""
+    counter.count("x" * 400)
+    counter.count("x" * 400)
+    counter.count("y" * 400)
+
+    assert counter.stats()["hits"] == 1
+    assert counter.stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_calibration_learns_provider_factor(counter: TokenCounterService):
+    """Reported input tokens adjust later estimates for the same provider only."""
+    agent_state = {"user_message": "a" * 400, "system_message": "", "context_message": ""}
+    scratch = [SimpleNamespace(text="b" * 400)]
+
+    assert counter.estimate_prompt(agent_state, scratch, "anthropic") == 200
+
+    counter.calibrate("anthropic", 300)
+
+    assert counter.factor("anthropic") == pytest.approx(1.5)
+    assert counter.estimate_prompt(agent_state, scratch, "anthropic") == 300
+    assert counter.estimate_prompt(agent_state, scratch, "openai") == 200
+
+
+@pytest.mark.asyncio
+async def test_calibration_is_smoothed(counter: TokenCounterService):
+    """Later observations move the factor part of the way toward the new ratio."""
+    counter.estimate_prompt({"user_message": "a" * 400}, [], "openai")
+    counter.calibrate("openai", 100)
+    counter.estimate_prompt({"user_message": "a" * 400}, [], "openai")
+    counter.calibrate("openai", 200)
+
+    assert counter.factor("openai") == pytest.approx(1.0 + TokenCounterService.CALIBRATION_WEIGHT)
+
+
+@pytest.mark.asyncio
+async def test_encoding_loads_in_a_worker_thread(application: Application, monkeypatch):
+    """The tokenizer loads off the event loop, and estimates made before it is ready are not cached."""
+    import threading
+
+    service = application.make(TokenCounterService)
+    service._encoding_loaded = False
+    loaded_on = []
+    monkeypatch.setattr(service, "_load_encoding", lambda: loaded_on.append(threading.get_ident()))
+
+    assert service.count("abcdefghi") == 3
+    assert service.stats()["cached"] == 0
+
+    await service.load_encoding()
+
+    assert len(loaded_on) == 1
+    assert loaded_on[0] != threading.get_ident()
+    service.count("abcdefghi")
+    assert service.stats()["cached"] == 1
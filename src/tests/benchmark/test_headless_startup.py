@@ -0,0 +1,94 @@
+"""Benchmark for headless startup against the Textual TUI.
+
+Each mode boots every provider from `byte.main.PROVIDERS` in a fresh
+interpreter so imports, RSS, and cold start are measured in isolation:
+
+- headless: `byte --headless` until the gateway discovery file is written.
+- tui: the regular boot plus `ByteTUI` mounted on Textual's headless driver.
+
+Run with: `uv run pytest src/tests/benchmark/test_headless_startup.py -s`
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+_SCRIPT = """
+import asyncio, json, os, resource, signal, sys, time
+
+start = time.perf_counter()
+mode = sys.argv[1]
+sys.argv = ["byte", "--headless"] if mode == "headless" else ["byte"]
+
+from pathlib import Path
+
+from byte.foundation import Application, Kernel
+from byte.main import PROVIDERS
+
+
+def report(ready):
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"ready_ms": (ready - start) * 1000, "rss_mb": rss_kb / 1024}))
+
+
+async def headless(app):
+    discovery = Path.cwd() / ".byte" / "cache" / "gateway.json"
+    run = asyncio.create_task(app.handle_command(sys.argv))
+    while not discovery.exists():
+        await asyncio.sleep(0.005)
+    report(time.perf_counter())
+    # The gateway is up before boot finishes; wait for run_headless to take over SIGTERM
+    while signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        await asyncio.sleep(0.005)
+    os.kill(os.getpid(), signal.SIGTERM)
+    assert await run == 0
+
+
+async def tui(app):
+    kernel = app.make(Kernel, app=app)
+    kernel.bootstrap()
+    await app.boot()
+
+    async def ready(pilot):
+        report(time.perf_counter())
+        pilot.app.exit()
+
+    await app.tui().run_async(headless=True, auto_pilot=ready)
+
+
+app = Application.configure(Path.cwd(), PROVIDERS).create()
+asyncio.run(headless(app) if mode == "headless" else tui(app))
+"""
+
+
+def _measure(mode: str, cwd: Path) -> dict:
+    """Run one mode in a subprocess and return its startup time and peak RSS."""
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, mode],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _report(label: str, metrics: dict) -> None:
+    print(f"\n{label}: ready in {metrics['ready_ms']:.0f} ms, peak RSS {metrics['rss_mb']:.1f} MB")
+
+
+def test_headless_startup(git_repo: Path):
+    """Headless mode boots providers and serves the gateway without Textual."""
+    metrics = _measure("headless", git_repo)
+
+    assert not (git_repo / ".byte" / "cache" / "gateway.json").exists()
+    _report("headless", metrics)
+
+
+def test_tui_startup_baseline(git_repo: Path):
+    """Baseline: the same boot with the Textual app mounted."""
+    metrics = _measure("tui", git_repo)
+
+    _report("tui", metrics)
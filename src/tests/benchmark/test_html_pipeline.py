@@ -0,0 +1,115 @@
+"""Benchmark for the HTML parse and cleaning pipeline on saved documentation pages.
+
+Parses every fixture page in `src/tests/web/fixtures` with the stdlib parser
+and, when installed, lxml, then runs the parser chain and `ContentCleaner`
+over it the way `ChromiumService` does. A second benchmark measures the
+longest event loop stall while the pipeline runs inline versus in a worker
+thread.
+
+Run with: `uv run pytest src/tests/benchmark/test_html_pipeline.py -s`
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from bs4 import BeautifulSoup
+
+from byte.web import ChromiumService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+FIXTURES = Path(__file__).parent.parent / "web" / "fixtures"
+PAGES = sorted(FIXTURES.glob("*.txt"))
+FEATURES = ["html.parser"] + (["lxml"] if importlib.util.find_spec("lxml") is not None else [])
+
+
+@pytest.fixture
+def providers():
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+def _convert_all(service: ChromiumService, features: str) -> tuple[float, float]:
+    """Return seconds spent parsing and seconds spent in the parser chain, over all pages."""
+    parsers, cleaner = service._pipeline()
+    parse_time = clean_time = 0.0
+
+    for page in PAGES:
+        markup = page.read_text()
+
+        start = time.perf_counter()
+        soup = BeautifulSoup(markup, features)
+        parse_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert service._parse(soup, f"https://docs.example.com/{page.stem}/", parsers, cleaner).strip()
+        clean_time += time.perf_counter() - start
+
+    return parse_time, clean_time
+
+
+@pytest.mark.parametrize("features", FEATURES)
+def test_pipeline_throughput(application: Application, features: str):
+    """Parse and clean every fixture page with the given BeautifulSoup tree builder."""
+    service = application.make(ChromiumService)
+    size = sum(page.stat().st_size for page in PAGES)
+
+    parse_time, clean_time = _convert_all(service, features)
+
+    print(
+        f"\n{features}: {len(PAGES)} pages, {size / 1_000_000:.1f} MB, "
+        f"parse {parse_time * 1000:.0f} ms, clean {clean_time * 1000:.0f} ms"
+    )
+
+
+async def _max_loop_stall(work) -> float:
+    """Run `work` while a ticker measures the longest gap between event loop iterations."""
+    stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            stall = max(stall, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    await work()
+    done = True
+    await task
+    return stall
+
+
+@pytest.mark.asyncio
+async def test_worker_thread_keeps_loop_responsive(application: Application):
+    """Compare the longest event loop stall with the pipeline run inline and in a worker thread."""
+    service = application.make(ChromiumService)
+    parsers, cleaner = service._pipeline()
+    markup = max(PAGES, key=lambda page: page.stat().st_size).read_text()
+
+    def convert() -> str:
+        return service._convert_rendered("https://docs.example.com/", markup, parsers, cleaner, False)
+
+    async def inline():
+        convert()
+
+    async def threaded():
+        await asyncio.to_thread(convert)
+
+    inline_stall = await _max_loop_stall(inline)
+    threaded_stall = await _max_loop_stall(threaded)
+
+    assert threaded_stall < inline_stall
+    print(f"\nlongest loop stall: inline {inline_stall * 1000:.0f} ms, worker thread {threaded_stall * 1000:.0f} ms")
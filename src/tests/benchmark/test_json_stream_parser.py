@@ -0,0 +1,71 @@
+"""Benchmark for streaming tool call argument parsing.
+
+Streams a ~200 KB `write_file` payload in small fragments through the
+incremental `JsonStreamParser`, and compares it with re-parsing the accumulated
+text on every fragment, which is what the tool call widget used to do.
+
+Run with: `uv run pytest src/tests/benchmark/test_json_stream_parser.py -s`
+"""
+
+import json
+import time
+
+from byte.support import JsonStreamParser
+from byte.support.utils import parse_partial_json
+
+FRAGMENT_SIZE = 256
+
+# Re-parsing is quadratic in the payload size, so the baseline runs on a smaller
+# payload to keep the benchmark short. Compare the per-KB timings it prints.
+BASELINE_LINES = 100
+
+
+def _payload(lines: int = 2_300) -> str:
+    """Build a write_file style payload, roughly 200 KB at the default size."""
+    line = 'def handler_{i}(event: dict) -> str:\n    return f"processed {{event[\\"id\\"]}}"  # é\n\n'
+    content = "".join(line.format(i=i) for i in range(lines))
+    return json.dumps({"file_path": "src/app/handlers.py", "content": content})
+
+
+def _fragments(payload: str) -> list[str]:
+    return [payload[i : i + FRAGMENT_SIZE] for i in range(0, len(payload), FRAGMENT_SIZE)]
+
+
+def _report(label: str, payload: str, fragments: list[str], elapsed: float) -> None:
+    print(
+        f"\n{label}: {len(payload) / 1000:.0f} KB in {len(fragments)} fragments, "
+        f"{elapsed * 1000:.1f} ms ({elapsed * 1e6 / len(payload):.3f} ms/KB)"
+    )
+
+
+def test_incremental_parser_throughput():
+    """The incremental parser scans each fragment once."""
+    payload = _payload()
+    fragments = _fragments(payload)
+
+    start = time.perf_counter()
+    parser = JsonStreamParser()
+    for fragment in fragments:
+        parser.feed(fragment)
+    elapsed = time.perf_counter() - start
+
+    assert parser.is_complete
+    assert parser.value("content") == json.loads(payload)["content"]
+    _report("incremental", payload, fragments, elapsed)
+
+
+def test_reparse_accumulated_baseline():
+    """Baseline: re-parse the whole accumulated text after every fragment."""
+    payload = _payload(BASELINE_LINES)
+    fragments = _fragments(payload)
+
+    start = time.perf_counter()
+    raw_args = ""
+    parsed = None
+    for fragment in fragments:
+        raw_args = raw_args + fragment
+        parsed = parse_partial_json(raw_args)
+    elapsed = time.perf_counter() - start
+
+    assert parsed == json.loads(payload)
+    _report("re-parse", payload, fragments, elapsed)
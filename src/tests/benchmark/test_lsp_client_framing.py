@@ -0,0 +1,100 @@
+"""Benchmark for LSPClient JSON-RPC framing.
+
+Replays a recorded LSP session through `LSPClient._read_message` at high message
+rates, followed by a multi-megabyte `workspace/symbol` payload.
+
+Run with: `uv run pytest src/tests/benchmark/test_lsp_client_framing.py -s`
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.lsp import LSPClient
+
+if TYPE_CHECKING:
+    from byte import Application
+
+SESSION_REPLAYS = 5_000
+LARGE_SYMBOL_COUNT = 25_000
+
+
+@pytest.fixture
+def providers():
+    """Framing needs no domain providers."""
+    return []
+
+
+def _frame(message: dict) -> bytes:
+    """Encode a message with its JSON-RPC Content-Length header."""
+    body = json.dumps(message).encode("utf-8")
+    return f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+
+def _recorded_session() -> list[dict]:
+    """Load the recorded LSP session fixture."""
+    fixture_path = Path(__file__).parent / "fixtures" / "lsp_session.jsonl"
+    return [json.loads(line) for line in fixture_path.read_text().splitlines() if line.strip()]
+
+
+def _workspace_symbols() -> dict:
+    """Build a large `workspace/symbol` response similar to a big monorepo."""
+    symbols = [
+        {
+            "name": f"symbol_{i}",
+            "kind": 12,
+            "containerName": f"module_{i // 100}",
+            "location": {
+                "uri": f"file:///workspace/src/module_{i // 100}/file_{i % 100}.py",
+                "range": {"start": {"line": i % 500, "character": 4}, "end": {"line": i % 500, "character": 24}},
+            },
+        }
+        for i in range(LARGE_SYMBOL_COUNT)
+    ]
+    return {"jsonrpc": "2.0", "id": 99, "result": symbols}
+
+
+async def _replay(application: Application, payload: bytes, expected: int) -> float:
+    """Feed a framed byte stream to a client and return the seconds spent reading it."""
+    client = LSPClient("bench", [], application.root_path(), application)
+    reader = asyncio.StreamReader(limit=2**16)
+    reader.feed_data(payload)
+    reader.feed_eof()
+    client.reader = reader
+
+    start = time.perf_counter()
+    count = 0
+    while await client._read_message() is not None:
+        count += 1
+    elapsed = time.perf_counter() - start
+
+    assert count == expected
+    return elapsed
+
+
+@pytest.mark.asyncio
+async def test_replay_recorded_session(application: Application):
+    """Measure message throughput for a replayed session of small messages."""
+    session = _recorded_session()
+    payload = b"".join(_frame(message) for message in session) * SESSION_REPLAYS
+    expected = len(session) * SESSION_REPLAYS
+
+    elapsed = await _replay(application, payload, expected)
+
+    print(f"\nrecorded session: {expected} messages in {elapsed:.3f}s ({expected / elapsed:,.0f} msg/s)")
+
+
+@pytest.mark.asyncio
+async def test_large_workspace_symbol_payload(application: Application):
+    """Measure throughput for multi-megabyte single responses."""
+    frame = _frame(_workspace_symbols())
+    replays = 10
+
+    elapsed = await _replay(application, frame * replays, replays)
+
+    megabytes = len(frame) * replays / 1_000_000
+    print(f"\nworkspace/symbol: {megabytes:.1f} MB in {elapsed:.3f}s ({megabytes / elapsed:,.1f} MB/s)")
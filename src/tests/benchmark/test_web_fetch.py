@@ -0,0 +1,98 @@
+"""Benchmark for the HTTP-first fetch path against a full Chromium render.
+
+Serves the MkDocs and ReadTheDocs fixtures from a local HTTP server and scrapes
+each page through `ChromiumService` twice: once with `web.http_first` enabled,
+and once with it disabled so every page is rendered in headless Chrome. The
+browser run is skipped when Chrome cannot be started. The web cache is
+disabled so every round measures a real fetch.
+
+Run with: `uv run pytest src/tests/benchmark/test_web_fetch.py -s`
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.web import BrowserPoolService, ChromiumService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+FIXTURES = Path(__file__).parent.parent / "web" / "fixtures"
+PAGES = ["mkdocs-1.txt", "readthedocs-1.txt", "readthedocs-2.txt"]
+ROUNDS = 3
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    extensions_map = {".txt": "text/html"}
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(FixtureHandler, directory=str(FIXTURES)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def providers():
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+async def _scrape_all(service: ChromiumService, base_url: str) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for page in PAGES:
+            assert (await service.do_scrape(f"{base_url}/{page}")).strip()
+    return time.perf_counter() - start
+
+
+def _report(label: str, elapsed: float) -> None:
+    count = ROUNDS * len(PAGES)
+    print(f"\n{label}: {count} pages in {elapsed * 1000:.0f} ms ({elapsed * 1000 / count:.1f} ms/page)")
+
+
+@pytest.mark.asyncio
+async def test_http_first_fetch(application: Application, fixture_server: str):
+    """Static documentation pages are fetched and parsed without starting Chrome."""
+    application["config"].web.enable = True
+    application["config"].web.cache_enable = False
+    service = application.make(ChromiumService)
+
+    elapsed = await _scrape_all(service, fixture_server)
+
+    assert not application.make(BrowserPoolService).running
+    _report("http-first", elapsed)
+
+
+@pytest.mark.asyncio
+async def test_browser_render_baseline(application: Application, fixture_server: str):
+    """Baseline: render every page in headless Chrome."""
+    application["config"].web.enable = True
+    application["config"].web.cache_enable = False
+    application["config"].web.http_first = False
+    service = application.make(ChromiumService)
+
+    try:
+        elapsed = await _scrape_all(service, fixture_server)
+    except Exception as e:
+        pytest.skip(f"Chrome unavailable: {e}")
+    finally:
+        await application.make(BrowserPoolService).shutdown()
+
+    _report("browser", elapsed)
@@ -0,0 +1,98 @@
+"""Test suite for ConstitutionService incremental persistence and batched flushing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide ConstitutionServiceProvider for constitution service tests."""
+    from byte.constitution import ConstitutionServiceProvider
+
+    return [ConstitutionServiceProvider]
+
+
+def _track_writes(service, monkeypatch) -> list:
+    written = []
+    write = service._write
+
+    def track(path, content):
+        written.append(path.relative_to(service.constitution_path).as_posix())
+        write(path, content)
+
+    monkeypatch.setattr(service, "_write", track)
+    return written
+
+
+@pytest.mark.asyncio
+async def test_mutations_write_only_changed_files(application: Application, monkeypatch):
+    """Each mutation writes or removes only its own file and leaves the rest untouched."""
+    from byte.constitution import ConstitutionService
+
+    service = application.make(ConstitutionService)
+    service.add_principle("I. Library-First", "Every feature starts as a library.", order=1)
+    service.add_section("Security")
+
+    written = _track_writes(service, monkeypatch)
+    service.add_section_item("security", "Secrets", "All secrets in env vars.")
+
+    assert written == ["sections/security/items/secrets.md"]
+
+    written.clear()
+    service.delete_principle("i-library-first")
+
+    assert written == []
+    assert not (service.constitution_path / "principles" / "i-library-first.md").exists()
+    assert (service.constitution_path / "sections" / "security" / "section.md").exists()
+
+
+@pytest.mark.asyncio
+async def test_batch_defers_writes_until_it_exits(application: Application, monkeypatch):
+    """Changes made inside a batch are flushed once, and an entry added then deleted is never written."""
+    from byte.constitution import ConstitutionService
+
+    service = application.make(ConstitutionService)
+    written = _track_writes(service, monkeypatch)
+
+    with service.batch():
+        service.add_principle("I. Library-First", "Every feature starts as a library.")
+        service.add_governance_rule("Supremacy", "Constitution supersedes all other practices.")
+        service.add_governance_rule("Draft", "Temporary.")
+        service.delete_governance_rule("draft")
+        service.update_meta(version="1.1.0")
+        assert written == []
+
+    assert sorted(written) == ["constitution.md", "governance/supremacy.md", "principles/i-library-first.md"]
+
+    service.reload()
+    assert list(service.get_constitution().governance) == ["supremacy"]
+    assert service.get_constitution().meta.version == "1.1.0"
+
+
+@pytest.mark.asyncio
+async def test_tool_call_events_flush_once(application: Application, monkeypatch):
+    """The tool node's pre/post events wrap a set of tool calls in a single batch."""
+    from byte import EventBus
+    from byte.constitution import ConstitutionService
+    from byte.node import NodeEvents
+
+    service = application.make(ConstitutionService)
+    event_bus = application.make(EventBus)
+    flushes = []
+    flush = service.flush
+    monkeypatch.setattr(service, "flush", lambda: (flushes.append(True), flush()))
+
+    await event_bus.emit(NodeEvents.PreToolCalls(state={}))
+    service.add_principle("I. Library-First", "Every feature starts as a library.")
+    service.add_principle("II. Test-First", "Tests are written before code.")
+    assert flushes == []
+    await event_bus.emit(NodeEvents.PostToolCalls(state={}))
+
+    assert len(flushes) == 1
+    assert (service.constitution_path / "principles" / "ii-test-first.md").exists()
@@ -0,0 +1,70 @@
+"""Test suite for FileContext outlines."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from byte.files import FileContext
+
+SOURCE = """import os
+
+
+@cache
+def load(path):
+    return os.path.exists(path)
+
+
+class App:
+    def run(self):
+        handler = lambda: load("x")
+        return handler()
+"""
+
+
+@pytest.fixture
+def file_context(tmp_path) -> FileContext:
+    """Create a FileContext for a small Python module."""
+    path = tmp_path / "app.py"
+    path.write_text(SOURCE)
+    return FileContext(path=path, root_path=tmp_path)
+
+
+def _item(start_line: int, *children) -> SimpleNamespace:
+    return SimpleNamespace(span=SimpleNamespace(start_line=start_line), children=list(children))
+
+
+def test_summary_lists_tree_sitter_declarations(file_context: FileContext, monkeypatch):
+    """Declarations found by tree-sitter, nested ones included, are listed with their source lines."""
+    import tree_sitter_language_pack
+
+    structure = [_item(3, _item(4)), _item(8, _item(9), _item(10))]
+    monkeypatch.setattr(
+        tree_sitter_language_pack, "process", lambda source, config: SimpleNamespace(structure=structure)
+    )
+
+    summary = file_context.to_summary()
+
+    assert "4: @cache" in summary
+    assert "5: def load(path):" in summary
+    assert "9: class App:" in summary
+    assert "10:     def run(self):" in summary
+    assert '11:         handler = lambda: load("x")' in summary
+    assert "1: import os" not in summary
+
+
+def test_summary_falls_back_to_pattern_without_a_grammar(file_context: FileContext, monkeypatch):
+    """When tree-sitter cannot load a grammar, declarations are matched by pattern."""
+    import tree_sitter_language_pack
+
+    def unavailable(source, config):
+        raise tree_sitter_language_pack.DownloadError("no network")
+
+    monkeypatch.setattr(tree_sitter_language_pack, "process", unavailable)
+
+    summary = file_context.to_summary()
+
+    assert "Outline of 12 lines" in summary
+    assert "4: @cache" in summary
+    assert "9: class App:" in summary
+    assert "10:     def run(self):" in summary
+    assert "handler" not in summary
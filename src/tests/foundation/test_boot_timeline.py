@@ -0,0 +1,117 @@
+"""Test suite for the boot timeline, provider boot order, and booted listeners."""
+
+import asyncio
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.foundation import BootTimeline
+from byte.support import ServiceProvider
+
+if TYPE_CHECKING:
+    from byte import Application
+
+boot_order: list[str] = []
+booted_threads: list[int] = []
+
+
+class SlowProvider(ServiceProvider):
+    async def boot(self):
+        await asyncio.sleep(0.02)
+        boot_order.append("slow")
+
+
+class FastProvider(ServiceProvider):
+    def boots_concurrently(self):
+        return True
+
+    async def boot(self):
+        boot_order.append("fast")
+
+
+class DependentProvider(ServiceProvider):
+    def boots_concurrently(self):
+        return True
+
+    def depends_on(self):
+        return [SlowProvider]
+
+    async def boot(self):
+        await asyncio.sleep(0.02)
+        boot_order.append("dependent")
+
+
+class SequentialProvider(ServiceProvider):
+    async def boot(self):
+        boot_order.append("sequential")
+        self.app.booted(lambda app: booted_threads.append(threading.get_ident()))
+
+
+@pytest.fixture
+def providers():
+    """Provide opted-in concurrent providers followed by a sequential one."""
+    boot_order.clear()
+    booted_threads.clear()
+    return [SlowProvider, FastProvider, DependentProvider, SequentialProvider]
+
+
+def test_span_records_duration_and_category():
+    """A span is recorded with its name, category, and a non-negative duration."""
+    timeline = BootTimeline()
+
+    with timeline.span("LoadConfiguration", "bootstrap"):
+        pass
+
+    [span] = timeline.spans
+    assert (span.name, span.category) == ("LoadConfiguration", "bootstrap")
+    assert span.duration_ns >= 0
+
+
+def test_finish_stops_recording():
+    """Spans opened after finish() are not recorded."""
+    timeline = BootTimeline()
+    timeline.finish()
+
+    with timeline.span("LateService", "service"):
+        pass
+
+    assert timeline.spans == []
+
+
+def test_chrome_trace_uses_complete_events():
+    """Spans export as Chrome "X" events in microseconds, ordered by start time."""
+    timeline = BootTimeline()
+    with timeline.span("outer", "provider"):
+        with timeline.span("inner", "service"):
+            pass
+
+    events = timeline.to_chrome_trace()["traceEvents"]
+
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["dur"] >= events[1]["dur"]
+
+
+@pytest.mark.asyncio
+async def test_opted_in_providers_boot_concurrently(application: Application):
+    """Opted-in providers wait only for their dependencies; other providers wait for everything before them."""
+    assert boot_order == ["fast", "slow", "dependent", "sequential"]
+
+
+@pytest.mark.asyncio
+async def test_plain_booted_listeners_run_on_the_event_loop(application: Application):
+    """Synchronous booted listeners run on the loop thread rather than in a worker thread."""
+    assert booted_threads == [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_boot_writes_trace_to_cache(application: Application):
+    """Booting writes a Chrome trace with bootstrapper and provider spans to the cache directory."""
+    trace = json.loads(application.cache_path("boot_trace.json").read_text())
+
+    categories = {(event["cat"], event["name"]) for event in trace["traceEvents"]}
+    assert ("bootstrap", "LoadConfiguration") in categories
+    assert ("provider", "SlowProvider") in categories
+    assert not application.timeline.recording
@@ -190,3 +190,25 @@ def test_make_error_response_no_result() -> None:
     response = GatewayUtils.make_error_response("req-1", -32601, "Method not found")
 
     assert response.result is None
+
+
+def test_request_types_contains_stats() -> None:
+    """REQUEST_TYPES contains 'stats' key for Requests.Stats."""
+    assert "stats" in GatewayUtils.REQUEST_TYPES
+    assert GatewayUtils.REQUEST_TYPES["stats"] is Requests.Stats
+
+
+def test_request_types_use_method_override() -> None:
+    """Requests with a METHOD override are registered under that method name."""
+    assert GatewayUtils.REQUEST_TYPES["agent/run"] is Requests.AgentRun
+    assert GatewayUtils.REQUEST_TYPES["agent/cancel"] is Requests.AgentCancel
+
+
+def test_parse_agent_run_request() -> None:
+    """parse_request() builds an AgentRun with the default command."""
+    rpc = RpcRequest(jsonrpc="2.0", id="run-1", method="agent/run", params={"input": "Explain main.py"})
+    request = GatewayUtils.parse_request(rpc)
+
+    assert isinstance(request, Requests.AgentRun)
+    assert request.input == "Explain main.py"
+    assert request.command == "coder"
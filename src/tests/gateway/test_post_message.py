@@ -1,7 +1,7 @@
 """Test suite for GatewayService.post_message."""
 
 from typing import TYPE_CHECKING
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -21,83 +21,37 @@ def providers():
 
 @pytest.fixture
 def gateway(application: Application):
-    """Create a GatewayService with mocked session for testing."""
+    """Create a GatewayService with two mocked sessions for testing."""
     service = application.make(GatewayService)
-    service._session = MagicMock()
-    service._session.notify = AsyncMock()
+    service._sessions = {"first": MagicMock(), "second": MagicMock()}
     return service
 
 
 @pytest.mark.asyncio
 async def test_post_message_response(gateway: GatewayService):
-    """Test post_message routes Response messages to stream/response."""
-    event = Messages.Response(chunk="hello", status=Status.SUCCESS)
+    """Test post_message routes Response messages to messages/response."""
+    gateway.post_message(Messages.Response(chunk="hello", status=Status.SUCCESS))
 
-    with patch("asyncio.create_task") as mock_create_task:
-        gateway.post_message(event)
-
-        mock_create_task.assert_called_once()
-        coroutine = mock_create_task.call_args[0][0]
-        await coroutine
-
-        gateway._session.notify.assert_called_once_with("stream/response", {"content": "hello", "done": True})  # ty:ignore[unresolved-attribute]
-
-
-@pytest.mark.asyncio
-async def test_post_message_tool_response(gateway: GatewayService):
-    """Test post_message routes ToolResponse messages to stream/tool."""
-    event = Messages.ToolResponse(tool_name="search", chunk="results", tool_id="test")
-
-    with patch("asyncio.create_task") as mock_create_task:
-        gateway.post_message(event)
-
-        mock_create_task.assert_called_once()
-        coroutine = mock_create_task.call_args[0][0]
-        await coroutine
-
-        gateway._session.notify.assert_called_once_with("stream/tool", {"tool": "search", "content": "results"})  # ty:ignore[unresolved-attribute]
+    for session in gateway.sessions:
+        session.enqueue.assert_called_once_with("messages/response", {"content": "hello", "done": True})  # ty:ignore[unresolved-attribute]
 
 
 @pytest.mark.asyncio
 async def test_post_message_command_completed(gateway: GatewayService):
-    """Test post_message routes CommandExecutionCompleted to stream/done."""
-    event = Messages.CommandExecutionCompleted()
-
-    with patch("asyncio.create_task") as mock_create_task:
-        gateway.post_message(event)
+    """Test post_message routes CommandExecutionCompleted to messages/command_execution_completed."""
+    gateway.post_message(Messages.CommandExecutionCompleted())
 
-        mock_create_task.assert_called_once()
-        coroutine = mock_create_task.call_args[0][0]
-        await coroutine
-
-        gateway._session.notify.assert_called_once_with("stream/done", {})  # ty:ignore[unresolved-attribute]
+    for session in gateway.sessions:
+        session.enqueue.assert_called_once_with("messages/command_execution_completed", {})  # ty:ignore[unresolved-attribute]
 
 
 @pytest.mark.asyncio
 async def test_post_message_error_status(gateway: GatewayService):
-    """Test post_message routes error Status messages to stream/error."""
-    event = Messages.Status(state="error", message="something broke")
-
-    with patch("asyncio.create_task") as mock_create_task:
-        gateway.post_message(event)
-
-        mock_create_task.assert_called_once()
-        coroutine = mock_create_task.call_args[0][0]
-        await coroutine
+    """Test post_message routes error Status messages to messages/status."""
+    gateway.post_message(Messages.Status(state="error", message="something broke"))
 
-        gateway._session.notify.assert_called_once_with("stream/error", {"message": "something broke"})  # ty:ignore[unresolved-attribute]
-
-
-@pytest.mark.asyncio
-async def test_post_message_no_session_returns_early(gateway: GatewayService):
-    """Test post_message returns early when _session is None."""
-    gateway._session = None
-    event = Messages.Response(chunk="hello", status=Status.SUCCESS)
-
-    with patch("asyncio.create_task") as mock_create_task:
-        gateway.post_message(event)
-
-        mock_create_task.assert_not_called()
+    for session in gateway.sessions:
+        session.enqueue.assert_called_once_with("messages/status", {"message": "something broke"})  # ty:ignore[unresolved-attribute]
 
 
 @pytest.mark.asyncio
@@ -105,9 +59,7 @@ async def test_post_message_unmatched_event_ignored(gateway: GatewayService):
     """Test post_message ignores unmatched message types."""
     from textual.message import Message
 
-    event = Message()
-
-    with patch("asyncio.create_task") as mock_create_task:
-        gateway.post_message(event)
+    gateway.post_message(Message())
 
-        mock_create_task.assert_not_called()
+    for session in gateway.sessions:
+        session.enqueue.assert_not_called()  # ty:ignore[unresolved-attribute]
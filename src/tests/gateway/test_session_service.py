@@ -0,0 +1,326 @@
+"""Test suite for SessionService concurrent request dispatch."""
+
+import asyncio
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.gateway import GatewayServiceProvider, SessionService
+from byte.gateway.protocol import RpcRequest, RpcResponse
+from byte.gateway.requests import Requests
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide GatewayServiceProvider for gateway tests."""
+    return [GatewayServiceProvider]
+
+
+class FakeWebSocket:
+    """Minimal websocket that yields queued requests, records everything sent, and stays open until closed."""
+
+    def __init__(self, requests: list[RpcRequest]) -> None:
+        self._requests = [request.model_dump_json() for request in requests]
+        self.sent: list[dict] = []
+        self.closed = asyncio.Event()
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for raw in self._requests:
+            yield raw
+        await self.closed.wait()
+
+    async def send(self, raw: str) -> None:
+        self.sent.append(json.loads(raw))
+
+
+class WaitForCancelCommand:
+    """Agent command that keeps running until its workflow run is cancelled."""
+
+    def __init__(self, application: Application) -> None:
+        from byte.orchestration import WorkflowService
+
+        self.workflow_service = application.make(WorkflowService)
+        self.started = threading.Event()
+
+    async def handle(self, args: str) -> None:
+        run = self.workflow_service.current_run()
+        self.started.set()
+        while not run.cancelled:
+            await asyncio.sleep(0.01)
+
+
+def _add_file(id: int, file_path: str) -> RpcRequest:
+    return RpcRequest(jsonrpc="2.0", id=id, method="add_file", params={"file_path": file_path})
+
+
+@pytest.mark.asyncio
+async def test_slow_request_does_not_block_later_requests(application: Application):
+    """A fast request queued behind a slow one is answered first."""
+    websocket = FakeWebSocket([_add_file(1, "slow.py"), _add_file(2, "fast.py")])
+    session = application.make(SessionService, websocket=websocket, session_id="test")
+
+    async def handle_add_file(request: Requests.AddFile) -> None:
+        if request.file_path == "slow.py":
+            await asyncio.sleep(0.05)
+        await session._send(RpcResponse(id=request.id, result={"ok": True}))
+
+    session._handlers[Requests.AddFile] = handle_add_file
+
+    connection = asyncio.create_task(session.handle_connection())
+    while len(websocket.sent) < 2:
+        await asyncio.sleep(0.01)
+    websocket.closed.set()
+    await connection
+
+    assert [message["id"] for message in websocket.sent] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_in_flight_limit_bounds_concurrent_handlers(application: Application):
+    """No more than gateway.max_in_flight handlers run at the same time."""
+    limit = application["config"].gateway.max_in_flight
+    websocket = FakeWebSocket([_add_file(i, f"file_{i}.py") for i in range(limit * 3)])
+    session = application.make(SessionService, websocket=websocket, session_id="test")
+
+    running = 0
+    peak = 0
+
+    async def handle_add_file(request: Requests.AddFile) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        await session._send(RpcResponse(id=request.id, result={"ok": True}))
+
+    session._handlers[Requests.AddFile] = handle_add_file
+
+    connection = asyncio.create_task(session.handle_connection())
+    while len(websocket.sent) < limit * 3:
+        await asyncio.sleep(0.01)
+    websocket.closed.set()
+    await connection
+
+    assert peak == limit
+
+
+@pytest.mark.asyncio
+async def test_handler_exception_returns_error_response(application: Application):
+    """A failing handler produces an error response for its request id."""
+    websocket = FakeWebSocket([_add_file(7, "boom.py")])
+    session = application.make(SessionService, websocket=websocket, session_id="test")
+
+    async def handle_add_file(request: Requests.AddFile) -> None:
+        raise RuntimeError("boom")
+
+    session._handlers[Requests.AddFile] = handle_add_file
+
+    connection = asyncio.create_task(session.handle_connection())
+    while not websocket.sent:
+        await asyncio.sleep(0.01)
+    websocket.closed.set()
+    await connection
+
+    assert websocket.sent[0]["id"] == 7
+    assert websocket.sent[0]["error"]["message"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_response_chunks_coalesce_while_queued(application: Application):
+    """Chunks queued behind each other are sent as one frame, and the final frame stays separate."""
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+
+    session.enqueue("messages/response", {"content": "Hel", "done": False})
+    session.enqueue("messages/response", {"content": "lo", "done": False})
+    session.enqueue("messages/response", {"content": "!", "done": True})
+    session.enqueue("messages/response", {"content": "next", "done": False})
+
+    frames = [(n.method, n.params) for n in session._outbox]
+    assert frames == [
+        ("messages/response", {"content": "Hello", "done": False}),
+        ("messages/response", {"content": "!", "done": True}),
+        ("messages/response", {"content": "next", "done": False}),
+    ]
+    assert session.stats()["merged"] == 1
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_ends_without_none_text(application: Application):
+    """A SUCCESS frame with no chunk ends the stream without adding text, and PENDING frames are not streamed."""
+    from byte.gateway import GatewayService
+    from byte.tui import Messages, Status
+
+    gateway = application.make(GatewayService)
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+    gateway._sessions = {"test": session}
+
+    gateway.post_message(Messages.Response(status=Status.PENDING, chunk="assistant_node"))
+    for chunk in ["Hel", "lo", "!"]:
+        gateway.post_message(Messages.Response(status=Status.RUNNING, chunk=chunk))
+    gateway.post_message(Messages.Response(status=Status.SUCCESS, chunk=None))
+
+    frames = [n.params for n in session._outbox if n.method == "messages/response"]
+    assert frames == [{"content": "Hello!", "done": False}, {"content": "", "done": True}]
+
+
+@pytest.mark.asyncio
+async def test_state_updates_keep_latest_value(application: Application):
+    """A queued state update is replaced rather than queued twice."""
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+
+    session.enqueue("messages/update_files", {"count": 1})
+    session.enqueue("messages/command_execution_started", {})
+    session.enqueue("messages/update_files", {"count": 2})
+
+    frames = [(n.method, n.params) for n in session._outbox]
+    assert frames == [
+        ("messages/update_files", {"count": 2}),
+        ("messages/command_execution_started", {}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_high_water_drops_state_updates(application: Application):
+    """Past the high-water mark, new state updates are dropped and lifecycle events are kept."""
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+    session._high_water = 2
+
+    session.enqueue("messages/command_execution_started", {})
+    session.enqueue("messages/response", {"content": "a", "done": False})
+    session.enqueue("messages/command_execution_completed", {})
+    session.enqueue("messages/update_context", {"context_count": 3})
+    session.enqueue("messages/response", {"content": "b", "done": False})
+
+    methods = [n.method for n in session._outbox]
+    assert methods == [
+        "messages/command_execution_started",
+        "messages/response",
+        "messages/command_execution_completed",
+    ]
+    assert session._outbox[1].params["content"] == "ab"
+    assert session.stats()["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_notifications_are_sent_in_order(application: Application):
+    """The writer drains the queue over the websocket once the connection is running."""
+    websocket = FakeWebSocket([])
+    session = application.make(SessionService, websocket=websocket, session_id="test")
+
+    connection = asyncio.create_task(session.handle_connection())
+    session.enqueue("messages/command_execution_started", {})
+    session.enqueue("messages/response", {"content": "hi", "done": True})
+    while len(websocket.sent) < 2:
+        await asyncio.sleep(0.01)
+    websocket.closed.set()
+    await connection
+
+    assert [message["method"] for message in websocket.sent] == [
+        "messages/command_execution_started",
+        "messages/response",
+    ]
+    assert session.stats()["sent"] == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_text_deltas_coalesce_per_request(application: Application):
+    """Queued text deltas for the same run merge; other runs and delta types stay separate."""
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+
+    session.enqueue("agent/delta", {"request_id": 1, "type": "text", "text": "Hel"})
+    session.enqueue("agent/delta", {"request_id": 1, "type": "text", "text": "lo"})
+    session.enqueue("agent/delta", {"request_id": 1, "type": "tool_start", "tool_id": "t1", "name": "read_file"})
+    session.enqueue("agent/delta", {"request_id": 1, "type": "text", "text": "!"})
+
+    assert [n.params.get("text") for n in session._outbox] == ["Hello", None, "!"]
+
+
+@pytest.mark.asyncio
+async def test_agent_cancel_without_run_is_rejected(application: Application):
+    """Cancelling an id that is not running returns an error response."""
+    cancel = RpcRequest(jsonrpc="2.0", id=2, method="agent/cancel", params={"run_id": 1})
+    websocket = FakeWebSocket([cancel])
+    session = application.make(SessionService, websocket=websocket, session_id="test")
+
+    connection = asyncio.create_task(session.handle_connection())
+    while not websocket.sent:
+        await asyncio.sleep(0.01)
+    websocket.closed.set()
+    await connection
+
+    assert websocket.sent[0]["id"] == 2
+    assert websocket.sent[0]["error"]["code"] == -32600
+
+
+@pytest.mark.asyncio
+async def test_agent_cancel_stops_only_its_run(application: Application, monkeypatch):
+    """Cancelling an agent run stops that run and leaves a run started elsewhere untouched."""
+    command = WaitForCancelCommand(application)
+    other_run = command.workflow_service.begin_run()
+    run = RpcRequest(jsonrpc="2.0", id=1, method="agent/run", params={"input": "go"})
+    websocket = FakeWebSocket([run])
+    session = application.make(SessionService, websocket=websocket, session_id="test")
+    monkeypatch.setattr(session._command_registry, "get_slash_command", lambda name: command)
+
+    connection = asyncio.create_task(session.handle_connection())
+    assert await asyncio.to_thread(command.started.wait, 5)
+    await session.handle_agent_cancel(Requests.AgentCancel(id=2, run_id=1))
+    while len([message for message in websocket.sent if "id" in message]) < 2:
+        await asyncio.sleep(0.01)
+    websocket.closed.set()
+    await connection
+
+    results = {message["id"]: message["result"] for message in websocket.sent if "id" in message}
+    assert results == {2: {"ok": True, "run_id": 1}, 1: {"ok": True, "cancelled": True}}
+    assert not other_run.cancelled
+    assert not command.workflow_service.run_lock.locked()
+
+
+@pytest.mark.asyncio
+async def test_flood_past_high_water_stays_bounded(application: Application):
+    """A client that never drains keeps at most queue_limit frames, whatever mix of notifications arrives."""
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+    session._high_water = 4
+    session._queue_limit = 8
+
+    for index in range(200):
+        session.enqueue("agent/delta", {"request_id": 1, "type": "text", "text": "a"})
+        session.enqueue("agent/delta", {"request_id": 1, "type": "tool_start", "tool_id": f"t{index}", "name": "read"})
+        session.enqueue("agent/delta", {"request_id": 1, "type": "tool_args", "tool_id": f"t{index}", "args": "{}"})
+        session.enqueue("messages/response", {"content": "b", "done": False})
+        session.enqueue("messages/update_context", {"context_count": index})
+        session.enqueue("messages/command_execution_completed", {})
+
+    stats = session.stats()
+    assert len(session._outbox) <= 8
+    assert stats["peak_queue_depth"] <= 8
+    assert stats["dropped"] > 0
+    assert stats["merged"] > 0
+
+
+@pytest.mark.asyncio
+async def test_chunks_past_high_water_merge_into_their_request(application: Application):
+    """Past the high-water mark a chunk joins its request's latest frame only when that frame is the same stream."""
+    session = application.make(SessionService, websocket=FakeWebSocket([]), session_id="test")
+    session._high_water = 1
+
+    session.enqueue("agent/delta", {"request_id": 1, "type": "text", "text": "Hel"})
+    session.enqueue("agent/delta", {"request_id": 2, "type": "text", "text": "Other"})
+    session.enqueue("agent/delta", {"request_id": 1, "type": "text", "text": "lo"})
+    session.enqueue("agent/delta", {"request_id": 2, "type": "tool_start", "tool_id": "t1", "name": "read"})
+    session.enqueue("agent/delta", {"request_id": 2, "type": "text", "text": " run"})
+
+    assert [(n.params["request_id"], n.params["type"], n.params.get("text")) for n in session._outbox] == [
+        (1, "text", "Hello"),
+        (2, "text", "Other"),
+        (2, "tool_start", None),
+        (2, "text", " run"),
+    ]
@@ -0,0 +1,138 @@
+"""Test suite for SessionContextIndexService and retrieval in the session context hook."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+RETRY_DOC = """# Client
+
+Create a client with an API key.
+
+## Retries
+
+The client retries failed requests with exponential backoff. Set `max_retries` to change how often.
+
+## Timeouts
+
+Requests time out after 60 seconds by default.
+"""
+
+STREAMING_DOC = """# Streaming
+
+Pass `stream=True` to receive server-sent events.
+
+```python
+# Not a heading
+for event in client.stream():
+    print(event)
+```
+"""
+
+
+@pytest.fixture
+def providers():
+    """Provide KnowledgeServiceProvider for session context tests."""
+    from byte.knowledge import KnowledgeServiceProvider
+
+    return [KnowledgeServiceProvider]
+
+
+def test_chunk_splits_at_headings_outside_code_fences():
+    """Documents are chunked per heading, and comments inside code fences are not headings."""
+    from byte.knowledge import SessionContextIndexService
+
+    chunks = SessionContextIndexService.chunk(RETRY_DOC + STREAMING_DOC, 1500)
+
+    assert [heading for heading, _ in chunks] == ["Client", "Client > Retries", "Client > Timeouts", "Streaming"]
+    assert "# Not a heading" in chunks[-1][1]
+
+
+def test_chunk_splits_long_sections_at_blank_lines():
+    """Sections longer than the limit are split into parts that each fit."""
+    from byte.knowledge import SessionContextIndexService
+
+    paragraphs = [f"Paragraph {i} " + "word " * 60 for i in range(10)]
+    chunks = SessionContextIndexService.chunk("# Long\n\n" + "\n\n".join(paragraphs), 1000)
+
+    assert len(chunks) > 1
+    assert all(heading == "Long" for heading, _ in chunks)
+    assert all(len(text) <= 1000 for _, text in chunks)
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_matching_section_first(application: Application):
+    """BM25 search returns the section about the query terms first."""
+    from byte.knowledge import SessionContextModel, SessionContextService
+
+    service = application.make(SessionContextService)
+    service.add_context(application.make(SessionContextModel, type="web", key="client", content=RETRY_DOC))
+    service.add_context(application.make(SessionContextModel, type="web", key="streaming", content=STREAMING_DOC))
+
+    chunks = service.search_context("how do I configure retries?", limit=3)
+
+    assert chunks[0].key == "client"
+    assert chunks[0].heading == "Client > Retries"
+    assert service.search_context("stream events", limit=3, keys=["client"]) == []
+
+
+@pytest.mark.asyncio
+async def test_sync_reindexes_changed_and_removed_context(application: Application):
+    """Edited content is re-indexed and removed items drop out of the index."""
+    from byte.knowledge import SessionContextModel, SessionContextService
+
+    service = application.make(SessionContextService)
+    model = application.make(SessionContextModel, type="agent", key="notes", content="# Notes\n\nUse sqlite.")
+    service.add_context(model)
+    assert service.search_context("sqlite", limit=3)
+
+    model.set_content("# Notes\n\nUse postgres.")
+    assert not service.search_context("sqlite", limit=3)
+    assert service.search_context("postgres", limit=3)
+
+    service.remove_context("notes")
+    assert not service.search_context("postgres", limit=3)
+
+
+@pytest.mark.asyncio
+async def test_hook_inlines_small_context(application: Application):
+    """Session context under the inline limit is injected in full."""
+    from byte.knowledge import SessionContextModel, SessionContextService
+    from byte.orchestration import OrchestrationEvents
+
+    service = application.make(SessionContextService)
+    service.add_context(application.make(SessionContextModel, type="web", key="client", content=RETRY_DOC))
+
+    payload = await service.add_session_context_hook(OrchestrationEvents.GatherProjectContext(user_request="retries"))
+
+    assert "Requests time out after 60 seconds" in payload.session_docs[0]
+    assert payload.tools == []
+
+
+@pytest.mark.asyncio
+async def test_hook_injects_retrieved_chunks_for_large_context(application: Application):
+    """Above the inline limit only matching sections are injected, along with the search tool."""
+    from byte.knowledge import SearchSessionContextTool, SessionContextModel, SessionContextService
+    from byte.orchestration import OrchestrationEvents
+
+    application["config"].knowledge.retrieval.inline_max_tokens = 10
+    application["config"].knowledge.retrieval.top_k = 1
+
+    service = application.make(SessionContextService)
+    service.add_context(application.make(SessionContextModel, type="web", key="client", content=RETRY_DOC))
+    service.add_context(application.make(SessionContextModel, type="web", key="streaming", content=STREAMING_DOC))
+
+    payload = await service.add_session_context_hook(
+        OrchestrationEvents.GatherProjectContext(user_request="Bump max_retries to 5")
+    )
+
+    [session_docs] = payload.session_docs
+    assert "exponential backoff" in session_docs
+    assert "Requests time out" not in session_docs
+    assert "`streaming`" in session_docs
+    assert payload.tools == [SearchSessionContextTool]
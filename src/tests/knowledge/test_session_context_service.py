@@ -390,3 +390,43 @@ async def test_clear_context_returns_self_for_chaining(application: Application)
     # Should return self
     result = service.clear_context()
     assert result is service
+
+
+@pytest.mark.asyncio
+async def test_content_is_served_from_memory_until_reloaded(application: Application):
+    """Test that content is held in memory and only re-read when the file changes."""
+    from byte.knowledge import SessionContextModel
+
+    model = application.make(SessionContextModel, type="agent", key="cached", content="original")
+
+    # Edit the file behind the model's back
+    model.file_path.write_text("edited outside", encoding="utf-8")
+    assert model.content == "original"
+
+    # Reload picks up the edit once
+    assert model.reload() is True
+    assert model.content == "edited outside"
+    assert model.reload() is False
+
+    # Writes go through to disk
+    model.set_content("written")
+    assert model.file_path.read_text(encoding="utf-8") == "written"
+    assert model.reload() is False
+
+
+@pytest.mark.asyncio
+async def test_reload_context_hook_picks_up_external_edits(application: Application):
+    """Test that a watcher event for a session context file reloads its model."""
+    from byte.files import FileEvents
+    from byte.knowledge import SessionContextModel, SessionContextService
+
+    service = application.make(SessionContextService)
+    model = application.make(SessionContextModel, type="web", key="watched", content="before")
+    service.add_context(model)
+
+    model.file_path.write_text("after", encoding="utf-8")
+    await service.reload_context_hook(
+        FileEvents.SessionContextChanged(file_path=str(model.file_path), change_type="modified")
+    )
+
+    assert service.get_context("watched").content == "after"
@@ -0,0 +1,56 @@
+"""Test suite for LLMRegistryService."""
+
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from byte.llm import LLMRegistryService, ModelSchema
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide LLMServiceProvider for registry tests."""
+    from byte.llm import LLMServiceProvider
+
+    return [LLMServiceProvider]
+
+
+@pytest.mark.asyncio
+async def test_boot_writes_hashed_cache(application: Application):
+    """Boot caches the parsed YAML with the hash of models_data.yaml."""
+    application.make(LLMRegistryService)
+
+    cached = orjson.loads(application.cache_path("llm_registry.json").read_bytes())
+
+    assert len(cached["hash"]) == 64
+    assert "claude-opus-4-5" in cached["models"]
+
+
+@pytest.mark.asyncio
+async def test_models_are_built_on_lookup(application: Application):
+    """Schemas are only constructed for models that are looked up, then reused."""
+    registry = application.make(LLMRegistryService)
+
+    model = registry.get_model("claude-opus-4-5")
+
+    assert isinstance(model, ModelSchema)
+    assert model.constraints.max_input_tokens == 200000
+    assert list(registry._models) == ["claude-opus-4-5"]
+    assert registry.get_model("claude-opus-4-5") is model
+    assert registry.get_model("not-a-model") is None
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_rebuilt(application: Application):
+    """A cache whose hash does not match the YAML is ignored and rewritten."""
+    cache_path = application.cache_path("llm_registry.json")
+    cache_path.write_bytes(orjson.dumps({"hash": "stale", "models": {}}))
+
+    registry = application.build(LLMRegistryService)
+
+    assert registry.get_model("claude-opus-4-5") is not None
+    assert orjson.loads(cache_path.read_bytes())["hash"] != "stale"
@@ -0,0 +1,177 @@
+"""Test suite for the LSP tools, with LSPService replaced by a fake that answers from a table."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from byte.lsp import (
+    BatchQueryTool,
+    FindReferencesTool,
+    GetDefinitionTool,
+    GetHoverInfoTool,
+    HoverResult,
+    Location,
+    LSPService,
+    Position,
+    Range,
+)
+
+SOURCE = """def greet(name):
+    return f"Hello {name}"
+
+
+message = greet("world")
+print(greet("again"))
+"""
+
+
+@pytest.fixture
+def providers():
+    """The tools only need the base providers; LSPService is bound to a fake."""
+    return []
+
+
+class FakeLSPService:
+    """Answer lookups from a table keyed by operation and zero-based line, recording each call."""
+
+    def __init__(self, answers: dict) -> None:
+        self.answers = answers
+        self.calls: list[tuple[str, int, int]] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def handle(self, operation: str, file_path: Path, line: int, character: int):
+        self.calls.append((operation, line, character))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        answer = self.answers[(operation, line)]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    async def get_hover(self, file_path: Path, line: int, character: int):
+        return await self.handle("hover", file_path, line, character)
+
+    async def goto_definition(self, file_path: Path, line: int, character: int):
+        return await self.handle("definition", file_path, line, character)
+
+    async def find_references(self, file_path: Path, line: int, character: int):
+        return await self.handle("references", file_path, line, character)
+
+
+@pytest.fixture
+def module(git_repo: Path) -> Path:
+    path = git_repo / "module.py"
+    path.write_text(SOURCE)
+    return path
+
+
+def _location(path: Path, line: int, character: int) -> Location:
+    start = Position(line=line, character=character)
+    return Location(uri=f"file://{path}", range=Range(start=start, end=start))
+
+
+def _bind(application, answers: dict) -> FakeLSPService:
+    fake = FakeLSPService(answers)
+    application.instance(LSPService, fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_batch_query_dispatches_concurrently_with_zero_based_lines(application, module: Path):
+    """Every query is in flight at once, and editor lines are converted to LSP lines."""
+    fake = _bind(
+        application,
+        {
+            ("hover", 0): HoverResult(contents="def greet(name: str) -> str"),
+            ("definition", 4): [_location(module, 0, 4)],
+        },
+    )
+    tool = application.make(BatchQueryTool)
+
+    result = await tool.run(
+        queries=[
+            {"file_path": str(module), "line": 1, "character": 4, "operation": "hover"},
+            {"file_path": str(module), "line": 5, "character": 10, "operation": "definition"},
+        ]
+    )
+
+    assert fake.peak_in_flight == 2
+    assert sorted(fake.calls) == [("definition", 4, 10), ("hover", 0, 4)]
+    assert "def greet(name: str) -> str" in result.result["content"]
+
+
+@pytest.mark.asyncio
+async def test_batch_query_reports_failed_queries_alongside_the_rest(application, module: Path):
+    """A lookup that raises becomes an error section; the other queries still answer."""
+    _bind(
+        application,
+        {
+            ("hover", 0): RuntimeError("server crashed"),
+            ("definition", 4): [_location(module, 0, 4)],
+        },
+    )
+    tool = application.make(BatchQueryTool)
+
+    result = await tool.run(
+        queries=[
+            {"file_path": str(module), "line": 1, "character": 4, "operation": "hover"},
+            {"file_path": str(module), "line": 5, "character": 10, "operation": "definition"},
+        ]
+    )
+
+    hover, definition, _locations = result.result["content"].split("\n\n---\n\n")
+    assert hover.endswith("Error: server crashed")
+    assert definition.endswith(f"{module}:L1:C5")
+
+
+@pytest.mark.asyncio
+async def test_batch_query_lists_each_location_once(application, module: Path):
+    """A location found by several queries is shown once, with its source line."""
+    definition = _location(module, 0, 4)
+    _bind(
+        application,
+        {
+            ("definition", 4): [definition],
+            ("references", 4): [definition, _location(module, 4, 10), _location(module, 5, 6)],
+        },
+    )
+    tool = application.make(BatchQueryTool)
+
+    result = await tool.run(
+        queries=[
+            {"file_path": str(module), "line": 5, "character": 10, "operation": "definition"},
+            {"file_path": str(module), "line": 5, "character": 10, "operation": "references"},
+        ]
+    )
+
+    locations = result.result["content"].split("\n\n---\n\n")[-1]
+    assert locations.splitlines() == [
+        "Locations:",
+        f"{module}:L1:C5 | def greet(name):",
+        f'{module}:L5:C11 | message = greet("world")',
+        f'{module}:L6:C7 | print(greet("again"))',
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("tool_class", "operation", "answer"),
+    [
+        (GetHoverInfoTool, "hover", HoverResult(contents="greet")),
+        (GetDefinitionTool, "definition", []),
+        (FindReferencesTool, "references", []),
+    ],
+)
+async def test_single_symbol_tools_take_one_based_lines(application, module: Path, tool_class, operation, answer):
+    """The single-symbol tools use the same one-based line convention as the batch tool."""
+    fake = _bind(application, {(operation, 4): answer})
+    tool = application.make(tool_class)
+
+    await tool.run(file_path=str(module), line=5, character=10)
+
+    assert fake.calls == [(operation, 4, 10)]
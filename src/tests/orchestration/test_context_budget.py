@@ -0,0 +1,52 @@
+"""Test suite for ContextBudget eviction planning."""
+
+from byte.orchestration import ContextBudget
+
+SHARES = {"scratch": 0.25, "history": 0.25, "references": 0.25, "read_only_files": 0.25}
+
+
+def test_plan_is_empty_when_prompt_fits():
+    """No category shrinks while total usage is within the limit."""
+    budget = ContextBudget(1000, SHARES)
+
+    assert budget.plan({"instructions": 200, "history": 300, "scratch": 400}) == {}
+
+
+def test_plan_only_removes_the_overflow():
+    """The first over-share category in eviction order absorbs the overflow, no further."""
+    budget = ContextBudget(1000, SHARES)
+
+    targets = budget.plan({"instructions": 200, "scratch": 700, "history": 150})
+
+    assert targets == {"scratch": 650}
+
+
+def test_plan_never_shrinks_below_share():
+    """A category stops at its allowance and the remaining overflow moves to the next one."""
+    budget = ContextBudget(1000, SHARES)
+
+    targets = budget.plan({"instructions": 200, "scratch": 400, "history": 700})
+
+    assert targets == {"scratch": 200, "history": 600}
+
+
+def test_fixed_categories_are_never_planned():
+    """Instructions and editable files reduce the allowances but are never shrunk themselves."""
+    budget = ContextBudget(1000, SHARES)
+
+    targets = budget.plan({"instructions": 600, "files": 300, "references": 500})
+
+    assert set(targets) == {"references"}
+    assert budget.allowances({"instructions": 600, "files": 300})["references"] == 25
+
+
+def test_truncate_keeps_head_and_tail():
+    """Truncation removes the middle and marks how much was cut."""
+    text = "HEAD" + "x" * 392 + "TAIL"
+
+    truncated = ContextBudget.truncate(text, 100, 10)
+
+    assert truncated.startswith("HEAD")
+    assert truncated.endswith("TAIL")
+    assert "90 tokens truncated" in truncated
+    assert ContextBudget.truncate(text, 100, 100) == text
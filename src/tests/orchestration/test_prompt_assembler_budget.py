@@ -0,0 +1,153 @@
+"""Test suite for PromptAssembler.apply_budget and the leaf shrink overrides."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from byte.files import FileContext
+from byte.llm import ModelSchema
+from byte.llm.schemas import ModelConstraints
+from byte.orchestration import Leaf, Leaves, PromptAssembler
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+class FakeAgentNode:
+    """Agent node with fixed templates and a model with a configurable input limit."""
+
+    def __init__(self, max_input_tokens: int):
+        self.model_schema = ModelSchema(
+            model="test-model",
+            provider="test",
+            constraints=ModelConstraints(max_input_tokens=max_input_tokens),
+        )
+
+    def get_system_template(self):
+        return ["You are a test agent."]
+
+    def get_user_template(self):
+        return ["Do the task."]
+
+    def get_context_template(self):
+        return []
+
+    def get_model(self):
+        return self.model_schema, None
+
+    def filter_message_history(self, messages):
+        return messages
+
+
+class StaticLeaf(Leaf):
+    """Leaf that assembles fixed text and keeps the default truncating shrink."""
+
+    category = "references"
+
+    def __init__(self, text: str):
+        self.text = text
+
+    async def assemble(self, prompt_assembler: PromptAssembler) -> str:
+        return self.text
+
+
+@pytest.fixture
+def providers():
+    """Provide the orchestration and analytics providers used by the prompt assembler."""
+    from byte.analytics import AnalyticsProvider
+    from byte.orchestration import OrchestrationServiceProvider
+
+    return [AnalyticsProvider, OrchestrationServiceProvider]
+
+
+@pytest.fixture
+def make_assembler(application: Application):
+    """Build assemblers whose token counts use the character ratio (4 characters per token)."""
+    from byte.analytics import TokenCounterService
+
+    counter = application.make(TokenCounterService)
+    counter._encoding_loaded = True
+    counter._encoding = None
+
+    def make(max_input_tokens: int = 100_000, **state) -> PromptAssembler:
+        return application.make(PromptAssembler, agent_node=FakeAgentNode(max_input_tokens), state=state, extra={})
+
+    return make
+
+
+def _history(count: int) -> list:
+    return [
+        (HumanMessage if index % 2 == 0 else AIMessage)(content=f"message {index} " + "word " * 40)
+        for index in range(count)
+    ]
+
+
+def _reference_files(tmp_path) -> list[FileContext]:
+    small = tmp_path / "small.py"
+    small.write_text("def tiny():\n    return 1\n")
+    large = tmp_path / "large.py"
+    large.write_text("class Large:\n" + "".join(f"    def method_{i}(self):\n        return {i}\n" for i in range(200)))
+    return [FileContext(path=small, root_path=tmp_path), FileContext(path=large, root_path=tmp_path)]
+
+
+@pytest.mark.asyncio
+async def test_apply_budget_leaves_fitting_prompt_alone(make_assembler):
+    """A prompt within the model's limit is returned unchanged with no decisions."""
+    assembler = make_assembler()
+    templates = {"system_message": ["system"], "user_message": ["user"], "context_message": []}
+
+    assembled = await assembler.apply_budget(templates, [StaticLeaf("x" * 400)], ["x" * 400])
+
+    assert assembled == ["x" * 400]
+    assert assembler.get_budget_decisions() == []
+
+
+@pytest.mark.asyncio
+async def test_apply_budget_shrinks_over_budget_leaves(make_assembler):
+    """Over-budget categories are shrunk by their leaves and each eviction is recorded."""
+    assembler = make_assembler(max_input_tokens=1_000)
+    templates = {"system_message": ["system"], "user_message": ["user"], "context_message": []}
+    text = "reference line\n" * 400
+
+    assembled = await assembler.apply_budget(templates, [StaticLeaf(text)], [text])
+
+    [decision] = assembler.get_budget_decisions()
+    assert (decision.category, decision.action, decision.source) == ("references", "truncated", "StaticLeaf")
+    assert decision.tokens_after < decision.tokens_before
+    assert assembler.count_tokens(assembled[0]) == decision.tokens_after
+    assert "tokens truncated to fit the context window" in assembled[0]
+
+
+@pytest.mark.asyncio
+async def test_conversation_history_shrink_keeps_recent_messages(make_assembler, application: Application):
+    """Older messages become one-line digests while the most recent ones stay verbatim."""
+    keep = application["config"].llm.context_budget.history_keep
+    messages = _history(keep + 10)
+    assembler = make_assembler(history_messages=messages)
+    leaf = Leaves.ConversationHistory()
+
+    content = await leaf.assemble(assembler)
+    shrunk = await leaf.shrink(assembler, content, assembler.count_tokens(content))
+
+    assert "summarized to fit the context window (10 messages)" in shrunk
+    assert f"- human: {messages[0].text.strip()[: leaf.DIGEST_CHARS].rstrip()}" in shrunk
+    assert all(message.text in shrunk for message in messages[-keep:])
+    assert messages[0].text not in shrunk
+
+
+@pytest.mark.asyncio
+async def test_reference_files_shrink_largest_file_to_an_outline(make_assembler, tmp_path, monkeypatch):
+    """Only as many of the largest files are outlined as needed to fit; smaller ones stay verbatim."""
+    file_contexts = _reference_files(tmp_path)
+    assembler = make_assembler()
+    leaf = Leaves.HarnessWorkspaceReferenceFiles()
+    monkeypatch.setattr(leaf, "_file_contexts", lambda prompt_assembler: file_contexts)
+
+    content = leaf._render([file_context.to_boundary() for file_context in file_contexts])
+    shrunk = await leaf.shrink(assembler, content, assembler.count_tokens(content) - 100)
+
+    assert "def tiny():\n    return 1" in shrunk
+    assert "Outline of 401 lines" in shrunk
+    assert "2:     def method_0(self):" in shrunk
+    assert "return 199" not in shrunk
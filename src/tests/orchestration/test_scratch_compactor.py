@@ -0,0 +1,58 @@
+"""Test suite for ScratchCompactor."""
+
+import math
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from byte.llm.config import ScratchCompactionConfig
+from byte.orchestration import ScratchCompactor
+
+
+def count_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+def tool_loop(steps: int, output_chars: int = 4000) -> list:
+    """Build scratch messages for a loop of tool calls, each with a large output."""
+    messages = []
+    for step in range(steps):
+        messages.append(AIMessage(content="", tool_calls=[{"name": "grep", "args": {}, "id": f"call-{step}"}]))
+        messages.append(
+            ToolMessage(content=f"result {step}\n" + "x" * output_chars, tool_call_id=f"call-{step}", name="grep")
+        )
+    return messages
+
+
+def test_recent_outputs_stay_verbatim():
+    """Only outputs older than keep_recent are digested, in whole batches."""
+    config = ScratchCompactionConfig(keep_recent=2, batch_size=4)
+    messages = tool_loop(7)
+
+    compacted, count = ScratchCompactor(config, count_tokens).compact(messages)
+
+    digested = [m.text.startswith("[Compacted") for m in compacted if isinstance(m, ToolMessage)]
+    assert count == 4
+    assert digested == [True, True, True, True, False, False, False]
+    assert compacted[-1] is messages[-1]
+
+
+def test_small_outputs_are_not_compacted():
+    """Outputs under min_tokens are left alone even when old."""
+    config = ScratchCompactionConfig(keep_recent=0, batch_size=1, min_tokens=5000)
+
+    _, count = ScratchCompactor(config, count_tokens).compact(tool_loop(3))
+
+    assert count == 0
+
+
+def test_digest_names_the_id_and_original_is_recoverable():
+    """Digests point at the tool call id, which finds the original in uncompacted state."""
+    config = ScratchCompactionConfig(keep_recent=0, batch_size=1, digest_chars=20)
+    messages = tool_loop(1)
+
+    compacted, _ = ScratchCompactor(config, count_tokens).compact(messages)
+
+    assert '"call-0"' in compacted[1].text
+    assert len(compacted[1].text) < 300
+    assert ScratchCompactor.find_original(messages, "call-0") is messages[1]
+    assert ScratchCompactor.find_original(messages, "missing") is None
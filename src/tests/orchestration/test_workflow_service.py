@@ -0,0 +1,79 @@
+"""Test suite for WorkflowService cancellation and per-run delta streaming."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide OrchestrationServiceProvider for workflow service tests."""
+    from byte.orchestration import OrchestrationServiceProvider
+
+    return [OrchestrationServiceProvider]
+
+
+@pytest.mark.asyncio
+async def test_cancel_before_workflow_starts_is_kept(application: Application):
+    """A cancel sent after the run is accepted survives until the workflow checks it."""
+    from byte.orchestration import WorkflowService
+
+    service = application.make(WorkflowService)
+
+    run = service.begin_run()
+    run.cancel()
+
+    assert service.current_run() is run
+    assert run.cancelled
+
+    next_run = service.begin_run()
+    assert service.current_run() is next_run
+    assert not next_run.cancelled
+
+
+@pytest.mark.asyncio
+async def test_runs_in_other_contexts_are_not_cancelled(application: Application):
+    """Each context gets its own run, so cancelling one leaves the cancel flag and stream state of another alone."""
+    from byte.orchestration import WorkflowService
+
+    service = application.make(WorkflowService)
+
+    async def start(index: int):
+        run = service.begin_run()
+        run.message_chunks[index] = {"completed": False, "type": "text"}
+        await asyncio.sleep(0)
+        return run, service.current_run()
+
+    (first, first_seen), (second, second_seen) = await asyncio.gather(start(0), start(1))
+    first.cancel()
+
+    assert first_seen is first
+    assert second_seen is second
+    assert not second.cancelled
+    assert list(second.message_chunks) == [1]
+
+
+@pytest.mark.asyncio
+async def test_deltas_reach_only_the_sink_of_their_run(application: Application):
+    """The sink follows its run onto the worker thread, and deltas outside a run are ignored."""
+    from byte.orchestration import WorkflowService
+
+    service = application.make(WorkflowService)
+    first, second = [], []
+
+    async def run(text: str) -> None:
+        service.emit_delta({"type": "text", "text": text})
+
+    async def stream(sink: list, text: str) -> None:
+        with service.stream_deltas(sink.append):
+            await asyncio.to_thread(asyncio.run, run(text))
+
+    await asyncio.gather(stream(first, "a"), stream(second, "b"))
+    service.emit_delta({"type": "text", "text": "stray"})
+
+    assert first == [{"type": "text", "text": "a"}]
+    assert second == [{"type": "text", "text": "b"}]
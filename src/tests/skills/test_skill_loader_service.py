@@ -0,0 +1,90 @@
+"""Test suite for SkillLoaderService discovery and the skill manifest cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide SkillsServiceProvider for skill loader tests."""
+    from byte.skills import SkillsServiceProvider
+
+    return [SkillsServiceProvider]
+
+
+def _write_skill(application: Application, name: str, description: str, body: str = "Do the thing."):
+    skill_dir = application.skills_path(name)
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n{body}\n")
+    return skill_dir
+
+
+@pytest.mark.asyncio
+async def test_reload_loads_frontmatter_and_defers_bodies(application: Application):
+    """Only frontmatter is read on reload; instructions and references load on first use."""
+    from byte.skills import SkillLoaderService
+
+    skill_dir = _write_skill(application, "greeting", "Greet the user", body="Say hello.")
+    (skill_dir / "references").mkdir()
+    (skill_dir / "references" / "examples.md").write_text("Hello!")
+
+    service = application.make(SkillLoaderService)
+    service.reload()
+
+    skill = service.get_skill("greeting")
+    assert skill.description == "Greet the user"
+    assert skill.instructions is None
+    assert skill.references is None
+
+    assert skill.get_instructions() == "Say hello."
+    assert list(skill.get_references()) == ["examples"]
+    assert "Say hello." in skill.to_markdown()
+
+
+@pytest.mark.asyncio
+async def test_reload_reuses_manifest_for_unchanged_skills(application: Application, monkeypatch):
+    """A reload with nothing changed neither walks the directories nor parses frontmatter."""
+    from byte.skills import SkillLoaderService
+
+    _write_skill(application, "greeting", "Greet the user")
+    service = application.make(SkillLoaderService)
+    service.reload()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unchanged skills should come from the manifest")
+
+    monkeypatch.setattr(service, "_find_skill_files", fail)
+    monkeypatch.setattr(service, "_parse_frontmatter", fail)
+    service.reload()
+
+    assert service.get_skill("greeting") is not None
+
+
+@pytest.mark.asyncio
+async def test_reload_picks_up_edited_added_and_removed_skills(application: Application):
+    """Edits, new skills, and deleted skills are all reflected after a reload."""
+    import shutil
+
+    from byte.skills import SkillLoaderService
+
+    skill_dir = _write_skill(application, "greeting", "Greet the user")
+    service = application.make(SkillLoaderService)
+    service.reload()
+
+    (skill_dir / "SKILL.md").write_text("---\nname: greeting\ndescription: Greet the user warmly\n---\nBody\n")
+    _write_skill(application, "farewell", "Say goodbye")
+    service.reload()
+
+    assert service.get_skill("greeting").description == "Greet the user warmly"
+    assert service.get_skill("farewell") is not None
+
+    shutil.rmtree(skill_dir)
+    service.reload()
+
+    assert service.get_skill("greeting") is None
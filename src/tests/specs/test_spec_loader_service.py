@@ -0,0 +1,122 @@
+"""Test suite for SpecLoaderService incremental loading and the task status index."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """Provide SpecsServiceProvider for spec loader tests."""
+    from byte.specs import SpecsServiceProvider
+
+    return [SpecsServiceProvider]
+
+
+def _write_task(application: Application, spec: str, task_id: str, order: int, status: str = "pending"):
+    tasks_dir = application.specs_path(f"{spec}/tasks")
+    tasks_dir.mkdir(parents=True, exist_ok=True)
+    task_file = tasks_dir / f"{task_id}.md"
+    task_file.write_text(f"---\nid: {task_id}\norder: {order}\nstatus: {status}\n---\nDo {task_id}.\n")
+    return task_file
+
+
+def _write_spec(application: Application, name: str, statuses: list[str]):
+    spec_dir = application.specs_path(name)
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    (spec_dir / "SPEC.md").write_text(f"---\nname: {name}\ndescription: The {name} spec\n---\nBody\n")
+    for order, status in enumerate(statuses):
+        _write_task(application, name, f"t{order}", order, status)
+    return spec_dir
+
+
+@pytest.mark.asyncio
+async def test_load_tasks_filters_by_status_without_reparsing(application: Application, monkeypatch):
+    """Tasks are parsed once on reload and status filters are answered from the index."""
+    from byte.specs import SpecLoaderService
+
+    _write_spec(application, "feature", ["pending", "completed", "in_progress"])
+    service = application.make(SpecLoaderService)
+    service.reload()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached tasks should not be re-parsed")
+
+    monkeypatch.setattr(service, "_parse_task_file", fail)
+
+    assert [task.id for task in service.load_tasks("feature")] == ["t0", "t1", "t2"]
+    assert [task.id for task in service.load_tasks("feature", statuses=("pending", "in_progress"))] == ["t0", "t2"]
+
+    service.reload()
+    assert service.get_spec("feature") is not None
+
+
+@pytest.mark.asyncio
+async def test_save_task_updates_status_index(application: Application):
+    """Saving a task writes it through to disk and moves it between status buckets."""
+    from byte.specs import SpecLoaderService
+
+    _write_spec(application, "feature", ["pending", "pending"])
+    service = application.make(SpecLoaderService)
+    service.reload()
+
+    task = service.load_task("feature", "t0")
+    task.status = "completed"
+    service.save_task("feature", task)
+
+    assert [task.id for task in service.load_tasks("feature", statuses=("pending",))] == ["t1"]
+    assert "status: completed" in application.specs_path("feature/tasks/t0.md").read_text()
+
+
+@pytest.mark.asyncio
+async def test_file_changed_hook_refreshes_edited_and_deleted_tasks(application: Application):
+    """Watcher events re-parse only the touched task file."""
+    from byte.files import FileEvents
+    from byte.specs import SpecLoaderService
+
+    _write_spec(application, "feature", ["completed", "pending"])
+    service = application.make(SpecLoaderService)
+    service.reload()
+
+    task_file = _write_task(application, "feature", "t0", 0, status="pending")
+    # Bump the mtime explicitly so the change is visible on coarse-grained filesystems.
+    stat = task_file.stat()
+    import os
+
+    os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    await service.file_changed_hook(FileEvents.SpecChanged(file_path=str(task_file), change_type="modified"))
+
+    assert [task.id for task in service.load_tasks("feature", statuses=("pending",))] == ["t0", "t1"]
+
+    removed = application.specs_path("feature/tasks/t1.md")
+    removed.unlink()
+    await service.file_changed_hook(FileEvents.SpecChanged(file_path=str(removed), change_type="deleted"))
+
+    assert [task.id for task in service.load_tasks("feature")] == ["t0"]
+
+
+@pytest.mark.asyncio
+async def test_reload_picks_up_added_and_removed_specs(application: Application):
+    """New spec directories are discovered and deleted ones drop out with their tasks."""
+    import shutil
+
+    from byte.specs import SpecLoaderService
+
+    _write_spec(application, "feature", ["pending"])
+    service = application.make(SpecLoaderService)
+    service.reload()
+
+    spec_dir = _write_spec(application, "bugfix", ["pending"])
+    service.reload()
+    assert service.get_spec("bugfix") is not None
+
+    shutil.rmtree(spec_dir)
+    service.reload()
+
+    assert service.get_spec("bugfix") is None
+    assert service.load_tasks("bugfix") == []
@@ -0,0 +1,64 @@
+"""Test suite for JsonStreamParser."""
+
+import json
+
+from byte.support import JsonStreamParser
+
+
+def _feed_in_chunks(parser: JsonStreamParser, payload: str, size: int) -> list:
+    deltas = []
+    for i in range(0, len(payload), size):
+        deltas.extend(parser.feed(payload[i : i + size]))
+    return deltas
+
+
+def test_parses_object_fed_in_small_fragments():
+    """Values are reconstructed regardless of where fragments are split."""
+    data = {
+        "file_path": "src/main.py",
+        "content": 'print("héllo")\n\tdone \\ 😀',
+        "line": 42,
+        "replace_all": True,
+        "edits": [{"old": "a", "new": "]}"}],
+    }
+    payload = json.dumps(data)
+
+    for size in (1, 3, 7, 64):
+        parser = JsonStreamParser()
+        _feed_in_chunks(parser, payload, size)
+
+        assert parser.is_complete
+        assert {key: parser.value(key) for key in parser.keys()} == data
+
+
+def test_string_values_stream_as_deltas():
+    """String values are emitted as decoded text deltas before they complete."""
+    parser = JsonStreamParser()
+
+    first = parser.feed('{"content": "hel')
+    second = parser.feed('lo\\nworld"}')
+
+    assert [(d.key, d.text, d.complete) for d in first] == [("content", "hel", False)]
+    assert second[0].text == "lo\nworld"
+    assert second[-1].complete is True
+    assert second[-1].value == "hello\nworld"
+
+
+def test_partial_value_is_available_before_completion():
+    """Incomplete values expose the text received so far."""
+    parser = JsonStreamParser()
+    parser.feed('{"phase_id": "plan", "count": 12')
+
+    assert parser.value("phase_id") == "plan"
+    assert parser.is_value_complete("phase_id") is True
+    assert parser.value("count") == "12"
+    assert parser.is_value_complete("count") is False
+
+
+def test_non_object_input_is_invalid():
+    """Streams that are not JSON objects are flagged so callers can fall back to raw text."""
+    parser = JsonStreamParser()
+    parser.feed("plain text arguments")
+
+    assert parser.is_invalid is True
+    assert parser.raw() == "plain text arguments"
@@ -0,0 +1,99 @@
+"""Test suite for collapsing, releasing and restoring response panels outside the viewport."""
+
+import pytest
+
+from byte.tui import ByteTUI
+from byte.tui.widgets.response_panel import ResponsePanel
+from byte.tui.widgets.ui.selectable_markdown import SelectableMarkdown
+
+
+@pytest.fixture
+def providers():
+    """The conversation only needs the base providers."""
+    return []
+
+
+async def _mount_panels(conversation, count: int, box_sizing: str = "border-box") -> list[ResponsePanel]:
+    """Mount settled panels with a margin, padding and border, so their outer and content heights differ."""
+    panels = []
+    for index in range(count):
+        panel = ResponsePanel(id=f"panel_{index}")
+        panel.styles.margin = (1, 0)
+        panel.styles.padding = (1, 1)
+        panel.styles.border = ("round", "white")
+        panel.styles.box_sizing = box_sizing
+        await conversation.chat_container.mount(panel)
+        await panel.add_static_markdown("\n\n".join(f"Paragraph {index}.{line}" for line in range(6)))
+        panels.append(panel)
+    return panels
+
+
+def _mounted_content(panels: list[ResponsePanel]) -> int:
+    """Count the widgets mounted inside the panels, which is what releasing frees."""
+    return sum(len(panel.query("*")) for panel in panels)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("box_sizing", ["border-box", "content-box"])
+async def test_offscreen_panels_stay_bounded_and_keep_their_height(application, box_sizing: str):
+    """Panels far from the viewport end up released, and the scroll height does not drift."""
+    application["config"].tui.offscreen_margin = 1
+    tui = ByteTUI(application)
+
+    async with tui.run_test(size=(80, 24)) as pilot:
+        conversation = tui.conversation
+        container = conversation.chat_container
+        panels = await _mount_panels(conversation, 40, box_sizing)
+        await pilot.pause()
+        heights = [panel.outer_size.height for panel in panels]
+        widgets_before = _mounted_content(panels)
+
+        container.scroll_end(animate=False)
+        await pilot.pause()
+        virtual_height = container.virtual_size.height
+
+        # The first pass collapses panels outside the window, the second releases them.
+        for _ in range(2):
+            await conversation.virtualize_panels()
+            await pilot.pause()
+
+        released = [panel for panel in panels if panel.released]
+        assert len(released) > 20
+        assert all(not panel.children for panel in released)
+        assert _mounted_content(panels) <= widgets_before - len(released)
+        assert [panel.outer_size.height for panel in panels] == heights
+        assert container.virtual_size.height == virtual_height
+
+
+@pytest.mark.asyncio
+async def test_scrolling_back_restores_panels_in_place(application):
+    """Released panels in the window mount their snapshot again without moving the scroll position."""
+    application["config"].tui.offscreen_margin = 1
+    tui = ByteTUI(application)
+
+    async with tui.run_test(size=(80, 24)) as pilot:
+        conversation = tui.conversation
+        container = conversation.chat_container
+        panels = await _mount_panels(conversation, 40)
+        await pilot.pause()
+        heights = [panel.outer_size.height for panel in panels]
+
+        container.scroll_end(animate=False)
+        await pilot.pause()
+        for _ in range(2):
+            await conversation.virtualize_panels()
+            await pilot.pause()
+        assert panels[10].released
+
+        container.scroll_to(y=panels[10].virtual_region.y, animate=False)
+        await pilot.pause()
+        scroll_y = container.scroll_y
+
+        await conversation.virtualize_panels()
+        await pilot.pause()
+
+        assert not panels[10].released
+        assert isinstance(panels[10].children[0], SelectableMarkdown)
+        assert "Paragraph 10.5" in panels[10].snapshot_markdown
+        assert container.scroll_y == scroll_y
+        assert [panel.outer_size.height for panel in panels] == heights
@@ -0,0 +1,54 @@
+"""Test suite for InteractionService prompts when running headless."""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.tui import InputCancelledError, InteractionService
+from byte.tui.schemas import Answer
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """InteractionService is registered by the base providers."""
+    return []
+
+
+@pytest.fixture
+def headless(application: Application, monkeypatch) -> InteractionService:
+    """Run the application as if started with --headless."""
+    monkeypatch.setattr(application, "is_headless", lambda: True)
+    return application.make(InteractionService)
+
+
+async def _answer(prompt):
+    """Fail instead of hanging if a prompt still waits for an answer."""
+    return await asyncio.wait_for(prompt, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_confirm_returns_default_without_prompting(headless: InteractionService):
+    """Confirmations resolve to their default instead of waiting for a TUI answer."""
+    assert await _answer(headless.confirm("Write to file?", default=True)) is True
+    assert await _answer(headless.confirm("Delete everything?")) is False
+
+
+@pytest.mark.asyncio
+async def test_selections_return_default_choices(headless: InteractionService):
+    """Selections pick the default choice, or the first one when none is marked."""
+    choices = [Answer(label="a", value=1), Answer(label="b", value=2, is_default=True)]
+
+    assert (await _answer(headless.select("Pick one", choices))).value == 2
+    assert (await _answer(headless.select("Pick one", [Answer(label="a", value=1)]))).value == 1
+    assert [answer.value for answer in await _answer(headless.multi_select("Pick some", choices))] == [2]
+
+
+@pytest.mark.asyncio
+async def test_text_input_is_cancelled(headless: InteractionService):
+    """Free-text prompts have no default, so they are cancelled."""
+    with pytest.raises(InputCancelledError):
+        await _answer(headless.input_text("Describe the change"))
@@ -0,0 +1,80 @@
+"""Test suite for StreamCoalescerService."""
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from byte.tui import Messages, Status, StreamCoalescerService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+@pytest.fixture
+def providers():
+    """The coalescer only depends on configuration."""
+    return []
+
+
+@pytest.fixture
+def coalescer(application: Application):
+    """Create a StreamCoalescerService with emit_tui captured."""
+    service = application.make(StreamCoalescerService)
+    service.emit_tui = MagicMock()  # ty:ignore[invalid-assignment]
+    return service
+
+
+def _emitted(coalescer: StreamCoalescerService) -> list:
+    return [call.args[0] for call in coalescer.emit_tui.call_args_list]  # ty:ignore[unresolved-attribute]
+
+
+@pytest.mark.asyncio
+async def test_chunks_within_a_frame_are_merged(coalescer: StreamCoalescerService):
+    """Chunks arriving inside one frame interval are emitted as a single message."""
+    for fragment in ["Hel", "lo", " wor", "ld"]:
+        coalescer.push(Messages.Response(status=Status.RUNNING, with_indicator=False, chunk=fragment))
+
+    coalescer.flush()
+
+    chunks = [message.chunk for message in _emitted(coalescer)]
+    assert "".join(chunks) == "Hello world"
+    assert len(chunks) == 2
+    assert coalescer.stats() == {"emitted": 2, "merged": 2, "dropped": 0}
+
+
+@pytest.mark.asyncio
+async def test_status_change_flushes_pending_frames_first(coalescer: StreamCoalescerService):
+    """A non-running message flushes buffered chunks before being emitted."""
+    coalescer.push(Messages.Response(status=Status.RUNNING, chunk="first"))
+    coalescer.push(Messages.Response(status=Status.RUNNING, chunk=" second"))
+    coalescer.push(Messages.Response(status=Status.SUCCESS))
+
+    emitted = _emitted(coalescer)
+    assert [message.status for message in emitted] == [Status.RUNNING, Status.RUNNING, Status.SUCCESS]
+    assert emitted[1].chunk == " second"
+
+
+@pytest.mark.asyncio
+async def test_pending_frame_is_flushed_by_timer(coalescer: StreamCoalescerService):
+    """Buffered chunks are emitted once the frame interval elapses without new input."""
+    coalescer.push(Messages.ToolResponse(tool_id="tool_1", status=Status.RUNNING, chunk='{"a"'))
+    coalescer.push(Messages.ToolResponse(tool_id="tool_1", status=Status.RUNNING, chunk=": 1}"))
+
+    assert len(_emitted(coalescer)) == 1
+
+    await asyncio.sleep(0.1)
+
+    emitted = _emitted(coalescer)
+    assert len(emitted) == 2
+    assert emitted[1].chunk == ": 1}"
+
+
+@pytest.mark.asyncio
+async def test_empty_chunks_are_dropped(coalescer: StreamCoalescerService):
+    """Empty running chunks never reach the TUI."""
+    coalescer.push(Messages.Response(status=Status.RUNNING, chunk=""))
+
+    assert _emitted(coalescer) == []
+    assert coalescer.stats()["dropped"] == 1
@@ -0,0 +1,167 @@
+"""Test suite for BrowserPoolService."""
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.web import BrowserPoolService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+
+class FakeTab:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.tabs: list[FakeTab] = []
+        self.stopped = False
+
+    async def new_tab(self):
+        tab = FakeTab()
+        self.tabs.append(tab)
+        return tab
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def providers():
+    """Provide WebServiceProvider for browser pool tests."""
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+@pytest.fixture
+def pool(application: Application) -> tuple[BrowserPoolService, list[FakeBrowser]]:
+    """Create a pool with two tabs and a short idle timeout that launches fake browsers."""
+    application["config"].web.max_tabs = 2
+    application["config"].web.browser_idle_timeout = 0.05
+
+    service = application.build(BrowserPoolService)
+    browsers: list[FakeBrowser] = []
+
+    async def start_browser():
+        browser = FakeBrowser()
+        browsers.append(browser)
+        return browser, await browser.new_tab()
+
+    service._start_browser = start_browser
+    return service, browsers
+
+
+@pytest.mark.asyncio
+async def test_tabs_are_reused(pool):
+    """Sequential borrows share one tab instead of opening a new one each time."""
+    service, browsers = pool
+
+    for _ in range(3):
+        async with service.tab():
+            pass
+
+    [browser] = browsers
+    assert len(browser.tabs) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_by_max_tabs(pool):
+    """No more than max_tabs tabs are in use at once."""
+    service, browsers = pool
+    peak = 0
+
+    async def borrow():
+        nonlocal peak
+        async with service.tab():
+            peak = max(peak, service._pool().in_use)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(borrow() for _ in range(5)))
+
+    [browser] = browsers
+    assert peak == 2
+    assert len(browser.tabs) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_tab_is_closed_not_reused(pool):
+    """A tab that raised while borrowed is closed and replaced on the next borrow."""
+    service, browsers = pool
+
+    with pytest.raises(RuntimeError):
+        async with service.tab():
+            raise RuntimeError("navigation failed")
+
+    async with service.tab() as tab:
+        assert tab is browsers[0].tabs[1]
+
+    assert browsers[0].tabs[0].closed
+
+
+@pytest.mark.asyncio
+async def test_idle_browser_is_stopped(pool):
+    """The browser shuts down once no tab has been borrowed for the idle timeout."""
+    service, browsers = pool
+
+    async with service.tab():
+        pass
+    await asyncio.sleep(0.1)
+
+    assert browsers[0].stopped
+    assert not service.running
+
+
+def test_each_event_loop_gets_its_own_browser(pool):
+    """A borrow on a new loop starts a fresh browser, and close_loop stops it before the loop ends."""
+    service, browsers = pool
+
+    async def run():
+        try:
+            async with service.tab() as tab:
+                return tab
+        finally:
+            await service.close_loop()
+
+    first_tab = asyncio.run(run())
+    second_tab = asyncio.run(run())
+
+    assert len(browsers) == 2
+    assert first_tab is browsers[0].tabs[0]
+    assert second_tab is browsers[1].tabs[0]
+    assert all(browser.stopped for browser in browsers)
+    assert not service.running
+
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_browsers_on_their_own_loop(pool):
+    """Shutdown stops a browser started by a worker loop that is still running, on that loop."""
+    service, browsers = pool
+    borrowed = threading.Event()
+    release = threading.Event()
+
+    async def hold_tab():
+        async with service.tab():
+            borrowed.set()
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+        return asyncio.get_running_loop()
+
+    worker = asyncio.create_task(asyncio.to_thread(asyncio.run, hold_tab()))
+    await asyncio.to_thread(borrowed.wait)
+
+    await service.shutdown()
+    release.set()
+    await worker
+
+    [browser] = browsers
+    assert browser.stopped
+    assert not service.running
@@ -0,0 +1,82 @@
+"""Test suite for ContentCleaner."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.web import ContentCleaner
+
+if TYPE_CHECKING:
+    from byte import Application
+
+PAGE = """
+<html><body><main>
+  <nav><a href="/">Home</a></nav>
+  <h1>Guide</h1>
+  <script>track()</script>
+  <div class="toc"><a href="/a">Alpha</a> <a href="/b">Beta</a> x</div>
+  <section>
+    <p>Install the package with <a href="/pip">pip</a> and then configure it.</p>
+    <div class="links"><a href="/c">Gamma</a></div>
+  </section>
+</main></body></html>
+"""
+
+
+@pytest.fixture
+def providers():
+    """Provide WebServiceProvider for content cleaner tests."""
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+@pytest.fixture(params=["lxml", "html.parser"])
+def cleaner(application: Application, request) -> ContentCleaner:
+    """Create a ContentCleaner for each parser, so both produce the same output."""
+    service = application.make(ContentCleaner)
+    service.features = request.param
+    return service
+
+
+def test_clean_tree_removes_tags_and_link_heavy_sections(cleaner: ContentCleaner):
+    """Unwanted tags and link-dense containers are removed while prose with links is kept."""
+    main = cleaner.clean_tree(cleaner.parse_html(PAGE).main, cleaner.UNWANTED_TAGS, max_ratio=0.5)
+
+    assert main.find("nav") is None
+    assert main.find("script") is None
+    assert main.find("div", class_="toc") is None
+    assert main.find("div", class_="links") is None
+    assert main.find("section") is not None
+    assert main.find("a", href="/pip") is not None
+
+
+def test_removed_tags_do_not_count_towards_link_density(cleaner: ContentCleaner):
+    """Text inside removed tags is ignored when measuring a section's link ratio."""
+    soup = cleaner.parse_html(
+        "<html><body><div id='root'><div class='card'><script>var long_script_text = 1;</script>"
+        "<a href='/x'>Read more</a></div></div></body></html>"
+    )
+
+    root = cleaner.clean_tree(soup.find(id="root"), ["script"], max_ratio=0.5)
+
+    assert root.find("div", class_="card") is None
+
+
+def test_apply_pipeline_converts_to_markdown(cleaner: ContentCleaner):
+    """The pipeline returns markdown without the removed elements."""
+    markdown = cleaner.apply_pipeline(cleaner.parse_html(PAGE).main, filter_links=True, link_ratio=0.5)
+
+    assert markdown.startswith("# Guide")
+    assert "[pip](/pip)" in markdown
+    assert "Home" not in markdown
+    assert "track()" not in markdown
+    assert "Alpha" not in markdown
+
+
+def test_clean_text_handles_deeply_nested_pages(cleaner: ContentCleaner):
+    """Plain text extraction does not recurse, so deep trees do not hit the recursion limit."""
+    depth = 5_000
+    soup = cleaner.parse_html("<html><body>" + "<span>" * depth + "deep" + "</span>" * depth + "</body></html>")
+
+    assert cleaner.get_clean_text(soup.body) == "deep"
@@ -0,0 +1,150 @@
+"""Test suite for DocsCrawlerService, against a small MkDocs-style site served locally."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.web import ChromiumService, DocsCrawlerService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+NAV = {
+    "/": ["/guide/", "/guide/index.html", "/api/", "/manual.pdf", "https://elsewhere.example.com/"],
+    "/guide/": ["/", "/guide/install/"],
+    "/guide/install/": ["/guide/install/linux/"],
+    "/api/": ["/"],
+    "/guide/install/linux/": [],
+}
+
+
+def _page(path: str) -> bytes:
+    links = "".join(f'<li><a href="{href}">{href}</a></li>' for href in NAV[path])
+    return (
+        '<html><head><meta name="generator" content="mkdocs-1.6.0"></head><body>'
+        f'<nav class="md-nav md-nav--primary"><ul>{links}</ul></nav>'
+        f'<article class="md-content__inner"><h1>Page {path}</h1><p>Documentation for {path}.</p></article>'
+        "</body></html>"
+    ).encode()
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        path = "/guide/" if self.path == "/guide/index.html" else self.path
+        if path not in NAV:
+            self.send_error(404)
+            return
+
+        body = _page(path)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    """Serve the test documentation site on an ephemeral local port."""
+    SiteHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def providers():
+    """Provide WebServiceProvider for crawler tests."""
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+@pytest.fixture
+def crawler(application: Application, monkeypatch) -> DocsCrawlerService:
+    """Create a DocsCrawlerService with web commands enabled, the cache off, and no browser."""
+
+    async def load_page(self, url: str) -> str:
+        raise RuntimeError("browser unavailable")
+
+    monkeypatch.setattr(ChromiumService, "_load_page", load_page)
+    application["config"].web.enable = True
+    application["config"].web.cache_enable = False
+    return application.make(DocsCrawlerService)
+
+
+def test_canonical_url():
+    """Equivalent spellings of a URL normalize to the same string."""
+    assert (
+        DocsCrawlerService.canonical_url("HTTPS://Docs.Example.com:443/a/index.html#x") == "https://docs.example.com/a/"
+    )
+    assert DocsCrawlerService.canonical_url("http://docs.example.com") == "http://docs.example.com/"
+    assert (
+        DocsCrawlerService.canonical_url("http://docs.example.com:8000/a?v=1") == "http://docs.example.com:8000/a?v=1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_crawl_follows_navigation_breadth_first(crawler: DocsCrawlerService, site: str):
+    """Navigation links are followed level by level, deduplicated, and kept on the same site."""
+    result = await crawler.crawl(f"{site}/", max_depth=2, max_pages=50)
+
+    assert [page.url for page in result.pages] == [
+        f"{site}/",
+        f"{site}/guide/",
+        f"{site}/api/",
+        f"{site}/guide/install/",
+    ]
+    assert "/guide/index.html" not in SiteHandler.requests
+    assert "/manual.pdf" not in SiteHandler.requests
+    assert result.failed == {}
+
+
+@pytest.mark.asyncio
+async def test_crawl_respects_page_budget(crawler: DocsCrawlerService, site: str):
+    """No more than max_pages pages are fetched."""
+    result = await crawler.crawl(f"{site}/", max_depth=5, max_pages=2)
+
+    assert len(result.pages) == 2
+    assert len(SiteHandler.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_crawl_reports_failed_pages(crawler: DocsCrawlerService, site: str):
+    """Pages that cannot be loaded are reported instead of failing the crawl."""
+    NAV["/api/"].append("/missing/")
+    try:
+        result = await crawler.crawl(f"{site}/api/", max_depth=1, max_pages=50)
+    finally:
+        NAV["/api/"].remove("/missing/")
+
+    assert [page.url for page in result.pages] == [f"{site}/api/", f"{site}/"]
+    assert list(result.failed) == [f"{site}/missing/"]
+
+
+@pytest.mark.asyncio
+async def test_mkdocs_fixture_navigation_links(application: Application):
+    """MkDocsParser finds the primary navigation of a real MkDocs page."""
+    from byte.web import ContentCleaner, MkDocsParser
+
+    soup = application.make(ContentCleaner).parse_html((FIXTURES / "mkdocs-1.txt").read_text())
+    nav = application.make(MkDocsParser).extract_nav_element(soup)
+
+    assert nav is not None
+    assert nav.find_all("a", href=True)
@@ -0,0 +1,170 @@
+"""Test suite for the HTTP-first fetch path and web cache of ChromiumService, against a local fixture server."""
+
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.web import ChromiumService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+APP_SHELL = '<html><head><script src="/bundle.js"></script></head><body><div id="root"></div></body></html>'
+RENDERED = "<html><body><main><h1>Rendered</h1><p>Rendered by the browser.</p></main></body></html>"
+
+ETAG = '"docs-v1"'
+
+ROUTES = {
+    "/docs/": ("text/html; charset=utf-8", (FIXTURES / "mkdocs-1.txt").read_bytes()),
+    "/app/": ("text/html; charset=utf-8", APP_SHELL.encode()),
+    "/raw.py": ("text/plain; charset=utf-8", b"def main():\n    return 1 < 2\n"),
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        route = ROUTES.get(self.path)
+        if route is None:
+            self.send_error(404)
+            return
+
+        if self.path == "/docs/" and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        content_type, body = route
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if self.path == "/docs/":
+            self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    """Serve the web fixtures over HTTP on an ephemeral local port."""
+    FixtureHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def providers():
+    """Provide WebServiceProvider for fetch tests."""
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+@pytest.fixture
+def service(application: Application, monkeypatch) -> ChromiumService:
+    """Create a ChromiumService whose browser tier is replaced with a recorder."""
+    application["config"].web.enable = True
+    service = application.build(ChromiumService)
+    service.browser_loads = []
+
+    async def load_page(url: str) -> str:
+        service.browser_loads.append(url)
+        return RENDERED
+
+    monkeypatch.setattr(service, "_load_page", load_page)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_static_docs_skip_the_browser(service: ChromiumService, fixture_server: str):
+    """A static MkDocs page is parsed from the HTTP response without rendering."""
+    content = await service.do_scrape(f"{fixture_server}/docs/")
+
+    assert content.strip()
+    assert service.browser_loads == []
+
+
+@pytest.mark.asyncio
+async def test_plain_text_is_parsed_like_the_browser(service: ChromiumService, fixture_server: str):
+    """Plain text responses are wrapped the way Chrome renders them and kept verbatim."""
+    content = await service.do_scrape(f"{fixture_server}/raw.py")
+
+    assert "return 1 < 2" in content
+    assert service.browser_loads == []
+
+
+@pytest.mark.asyncio
+async def test_app_shell_escalates_to_browser(service: ChromiumService, fixture_server: str):
+    """An empty JavaScript mount point is rendered in the browser instead."""
+    content = await service.do_scrape(f"{fixture_server}/app/")
+
+    assert "Rendered by the browser." in content
+    assert service.browser_loads == [f"{fixture_server}/app/"]
+
+
+@pytest.mark.asyncio
+async def test_http_errors_escalate_to_browser(service: ChromiumService, fixture_server: str):
+    """Non-2xx responses fall back to the browser."""
+    await service.do_scrape(f"{fixture_server}/missing/")
+
+    assert service.browser_loads == [f"{fixture_server}/missing/"]
+
+
+@pytest.mark.asyncio
+async def test_fresh_cache_skips_the_network(service: ChromiumService, fixture_server: str):
+    """A page scraped within the cache TTL is served from disk without a request."""
+    first = await service.do_scrape(f"{fixture_server}/docs/")
+    second = await service.do_scrape(f"{fixture_server}/docs/")
+
+    assert second == first
+    assert FixtureHandler.requests == ["/docs/"]
+
+
+@pytest.mark.asyncio
+async def test_stale_cache_is_revalidated(application: Application, service: ChromiumService, fixture_server: str):
+    """An expired page is revalidated with its ETag and reused when the server answers 304."""
+    url = f"{fixture_server}/docs/"
+    first = await service.do_scrape(url)
+
+    application["config"].web.cache_ttl = 0
+    second = await service.do_scrape(url)
+
+    assert second == first
+    assert FixtureHandler.requests == ["/docs/", "/docs/"]
+    assert service.browser_loads == []
+
+
+@pytest.mark.asyncio
+async def test_revalidation_refreshes_the_entry(
+    application: Application, service: ChromiumService, fixture_server: str
+):
+    """A 304 resets the entry's age so it is fresh again."""
+    from byte.web import WebCacheService
+
+    url = f"{fixture_server}/docs/"
+    await service.do_scrape(url)
+    cache = application.make(WebCacheService)
+    fetched_at = cache.get(url).fetched_at
+
+    application["config"].web.cache_ttl = 0
+    time.sleep(0.01)
+    await service.do_scrape(url)
+
+    assert cache.get(url).fetched_at > fetched_at
@@ -0,0 +1,17 @@
+"""Test suite for deferred web dependency imports."""
+
+import subprocess
+import sys
+
+
+def test_web_provider_import_does_not_load_browser_dependencies():
+    """Importing the web provider leaves pydoll, bs4, and markdownify unloaded until first use."""
+    script = (
+        "import sys\n"
+        "from byte.web import WebServiceProvider\n"
+        "print(sorted(name for name in ('pydoll', 'bs4', 'markdownify') if name in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
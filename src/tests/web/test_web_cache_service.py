@@ -0,0 +1,92 @@
+"""Test suite for WebCacheService."""
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from byte.web import WebCacheService
+
+if TYPE_CHECKING:
+    from byte import Application
+
+URL = "https://docs.example.com/guide/"
+
+
+@pytest.fixture
+def providers():
+    """Provide WebServiceProvider for web cache tests."""
+    from byte.web import WebServiceProvider
+
+    return [WebServiceProvider]
+
+
+@pytest.fixture
+def cache(application: Application) -> WebCacheService:
+    """Create a WebCacheService rooted in the test repository's cache directory."""
+    return application.make(WebCacheService)
+
+
+def test_missing_url_returns_none(cache: WebCacheService):
+    """A URL that was never stored has no entry."""
+    assert cache.get(URL) is None
+
+
+def test_put_and_get_round_trip(cache: WebCacheService):
+    """Markdown, validators, and raw HTML are read back from disk."""
+    cache.put(URL, "<html>guide</html>", "# Guide", etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+
+    entry = cache.get(URL)
+
+    assert entry.markdown == "# Guide"
+    assert entry.etag == '"v1"'
+    assert entry.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert cache.get_html(entry) == "<html>guide</html>"
+
+
+def test_identical_html_is_stored_once(cache: WebCacheService):
+    """Pages with the same HTML share one content-addressed file."""
+    cache.put(URL, "<html>same</html>", "# Same")
+    cache.put("https://mirror.example.com/guide/", "<html>same</html>", "# Same")
+
+    assert len(list((cache.root / "html").iterdir())) == 1
+
+
+def test_search_results_expire(cache: WebCacheService):
+    """Search results are returned only while younger than the TTL."""
+    cache.put_search("python asyncio", "Found 1 search results")
+
+    assert cache.get_search("python asyncio", ttl=60) == "Found 1 search results"
+    assert cache.get_search("python asyncio", ttl=0) is None
+    assert cache.get_search("python threads", ttl=60) is None
+
+
+def test_corrupt_entry_is_ignored(cache: WebCacheService):
+    """An unreadable index file is treated as a cache miss."""
+    cache.put(URL, "<html>guide</html>", "# Guide")
+    next((cache.root / "pages").iterdir()).write_text("{not json")
+
+    assert cache.get(URL) is None
+
+
+def test_prune_removes_expired_pages_and_orphaned_html(cache: WebCacheService, application: Application):
+    """Expired pages, expired search results, and HTML no remaining page uses are deleted."""
+    import os
+    import time
+
+    import orjson
+
+    month_ago = time.time() - application["config"].web.cache_max_age - 1
+    cache.put(URL, "<html>old</html>", "# Old")
+    cache.put("https://docs.example.com/new/", "<html>new</html>", "# New")
+    cache.put_search("python asyncio", "Found 1 search results")
+
+    page = cache.root / "pages" / f"{cache._key(URL)}.json"
+    page.write_bytes(orjson.dumps({**orjson.loads(page.read_bytes()), "fetched_at": month_ago}))
+    search = next((cache.root / "search").iterdir())
+    search.write_bytes(orjson.dumps({**orjson.loads(search.read_bytes()), "fetched_at": month_ago}))
+    for html in (cache.root / "html").iterdir():
+        os.utime(html, (month_ago, month_ago))
+
+    assert cache.prune() == {"pages": 1, "search": 1, "html": 1}
+    assert cache.get(URL) is None
+    assert cache.get_html(cache.get("https://docs.example.com/new/")) == "<html>new</html>"